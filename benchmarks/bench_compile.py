@@ -0,0 +1,77 @@
+"""Compares the single-pass `lower_ast` with the former two-pass compilation pipeline.
+
+The former pipeline extracts the input variables with `filter_ast` and builds the instructions by
+threading a `(list, dict, int)` tuple through `functools.reduce` over `flatten_ast`. The single-pass
+lowering is also timed on the same circuit built with `AST.interning()`.
+
+Usage:
+
+```bash
+python benchmarks/bench_compile.py --gates 100000 1000000
+```
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from functools import reduce
+from typing import Callable
+
+from qadence2_ir.factory_tools import extract_inputs_variables, flatten_ast, lower_ast, to_instruct
+from qadence2_ir.irast import AST
+
+
+def layered_circuit(num_gates: int, num_qubits: int = 16) -> AST:
+    """Builds a sequence of parametric rotations and CNOTs with shared parameter expressions."""
+
+    theta = AST.input_variable("theta", num_qubits, True)
+    x = AST.input_variable("x", 1, False)
+    ops = []
+    for index in range(num_gates):
+        qubit = index % num_qubits
+        if index % 3 == 2:
+            ops.append(AST.quantum_op("CNOT", ((qubit + 1) % num_qubits,), (qubit,)))
+        else:
+            angle = AST.mul(AST.add(x, AST.numeric(float(qubit))), theta)
+            ops.append(AST.quantum_op("rx", (qubit,), (), angle))
+    return AST.sequence(*ops)
+
+
+def legacy_pipeline(ast: AST) -> None:
+    extract_inputs_variables(ast)
+    reduce(lambda acc, x: to_instruct(x, *acc), flatten_ast(ast), ([], dict(), 0))  # type: ignore
+
+
+def single_pass(ast: AST) -> None:
+    lower_ast(ast)
+
+
+def best_of(fn: Callable[[AST], None], ast: AST, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(ast)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--gates", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'gates':>10} {'legacy (s)':>12} {'single-pass (s)':>16} {'interned (s)':>13}")
+    for num_gates in args.gates:
+        ast = layered_circuit(num_gates)
+        legacy = best_of(legacy_pipeline, ast, args.repeat)
+        new = best_of(single_pass, ast, args.repeat)
+        with AST.interning():
+            interned_ast = layered_circuit(num_gates)
+        interned = best_of(single_pass, interned_ast, args.repeat)
+        print(f"{num_gates:>10} {legacy:>12.3f} {new:>16.3f} {interned:>13.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Measures the memory footprint per instruction of a compiled `Model` and per `AST` node.
+
+The footprint of the instructions packed in `ColumnarInstructions` is reported as well.
+
+Usage:
+
+```bash
+python benchmarks/bench_memory.py --gates 100000
+```
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import tracemalloc
+from typing import Any, Callable
+
+from qadence2_ir.columnar import ColumnarInstructions
+from qadence2_ir.factory_tools import lower_ast
+from qadence2_ir.irast import AST
+from qadence2_ir.traversal import walk_postorder
+from qadence2_ir.types import AllocQubits, Model
+
+
+def parametric_circuit(num_gates: int, num_qubits: int = 16) -> AST:
+    """Builds a sequence of rotations, each one with its own parameter expression, and CNOTs."""
+
+    x = AST.input_variable("x", 1, False)
+    ops = []
+    for index in range(num_gates):
+        qubit = index % num_qubits
+        if index % 2:
+            ops.append(AST.quantum_op("CNOT", ((qubit + 1) % num_qubits,), (qubit,)))
+        else:
+            angle = AST.mul(x, AST.numeric(float(index)))
+            ops.append(AST.quantum_op("rx", (qubit,), (), angle))
+    return AST.sequence(*ops)
+
+
+def compile_model(ast: AST) -> Model:
+    inputs, instructions = lower_ast(ast)
+    return Model(AllocQubits(16), inputs, instructions)
+
+
+def allocated(build: Callable[[], Any]) -> tuple[Any, int]:
+    gc.collect()
+    tracemalloc.start()
+    obj = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--gates", type=int, default=100_000)
+    args = parser.parse_args()
+
+    ast, ast_bytes = allocated(lambda: parametric_circuit(args.gates))
+    num_nodes = sum(1 for _ in walk_postorder(ast))
+    model, model_bytes = allocated(lambda: compile_model(ast))
+    num_instructions = len(model.instructions)
+
+    table, table_bytes = allocated(
+        lambda: ColumnarInstructions.from_instructions(model.instructions)
+    )
+
+    print(f"AST:   {num_nodes:>9} nodes        {ast_bytes / num_nodes:>8.1f} bytes/node")
+    print(
+        f"Model: {num_instructions:>9} instructions "
+        f"{model_bytes / num_instructions:>8.1f} bytes/instruction"
+    )
+    print(
+        f"Columnar: {len(table):>6} instructions "
+        f"{table_bytes / num_instructions:>8.1f} bytes/instruction"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Synthetic circuit generators shared by the benchmarks.
+
+- `wide_circuit`: layers of single-qubit rotations on every qubit followed by a ladder of CNOTs,
+    with one trainable parameter per qubit.
+- `deep_circuit`: a few rotations whose angles are deeply nested chains of classical calls.
+- `param_heavy_circuit`: one rotation per gate, each one with its own parameter expression built
+    from many input variables.
+"""
+
+from __future__ import annotations
+
+from qadence2_ir.irast import AST
+
+
+def wide_circuit(num_qubits: int, depth: int) -> AST:
+    """Builds `depth` layers of rotations and CNOT ladders on `num_qubits` qubits."""
+
+    theta = [AST.input_variable(f"theta_{qubit}", 1, True) for qubit in range(num_qubits)]
+    ops = []
+    for layer in range(depth):
+        for qubit in range(num_qubits):
+            angle = AST.mul(AST.numeric(float(layer + 1)), theta[qubit])
+            ops.append(AST.quantum_op("rx", (qubit,), (), angle))
+        for qubit in range(num_qubits - 1):
+            ops.append(AST.quantum_op("CNOT", (qubit + 1,), (qubit,)))
+    return AST.sequence(*ops)
+
+
+def deep_circuit(num_gates: int, depth: int) -> AST:
+    """Builds `num_gates` rotations whose angles are chains of `depth` nested calls."""
+
+    x = AST.input_variable("x", 1, True)
+    ops = []
+    for gate in range(num_gates):
+        angle = AST.numeric(float(gate))
+        for level in range(depth):
+            if level % 2:
+                angle = AST.callable("sin", AST.add(angle, x))
+            else:
+                angle = AST.mul(angle, AST.numeric(0.5))
+        ops.append(AST.quantum_op("ry", (gate % 8,), (), angle))
+    return AST.sequence(*ops)
+
+
+def param_heavy_circuit(num_gates: int, num_inputs: int = 64) -> AST:
+    """Builds `num_gates` rotations, each one with its own expression of several inputs."""
+
+    inputs = [AST.input_variable(f"p_{index}", 1, index % 2 == 0) for index in range(num_inputs)]
+    ops = []
+    for gate in range(num_gates):
+        a = inputs[gate % num_inputs]
+        b = inputs[(gate * 7 + 3) % num_inputs]
+        c = inputs[(gate * 13 + 5) % num_inputs]
+        angle = AST.add(
+            AST.mul(a, b), AST.div(AST.numeric(float(gate)), AST.pow(c, AST.numeric(2)))
+        )
+        ops.append(AST.quantum_op("rz", (gate % 16,), (), angle))
+    return AST.sequence(*ops)
@@ -0,0 +1,57 @@
+"""Compares two benchmark results written by `run.py`.
+
+Prints the ratio between the best times of every benchmark present in both results, and exits with
+a non-zero status if any benchmark is slower than the threshold.
+
+Usage:
+
+```bash
+python benchmarks/compare.py baseline.json results.json --threshold 1.2
+```
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+
+def compare(baseline: dict, results: dict, threshold: float) -> list[str]:
+    """Prints the comparison table and returns the names of the regressed benchmarks."""
+
+    regressions = []
+    print(f"{'benchmark':<28} {'baseline (s)':>13} {'current (s)':>12} {'ratio':>7}")
+    for name, current in results["results"].items():
+        if name not in baseline["results"]:
+            continue
+        before = baseline["results"][name]["min"]
+        ratio = current["min"] / before if before else float("inf")
+        flag = " !" if ratio > threshold else ""
+        print(f"{name:<28} {before:>13.4f} {current['min']:>12.4f} {ratio:>7.2f}{flag}")
+        if ratio > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("results", type=Path)
+    parser.add_argument("--threshold", type=float, default=1.2)
+    args = parser.parse_args()
+
+    baseline = json.loads(args.baseline.read_text())
+    results = json.loads(args.results.read_text())
+    if baseline.get("scale") != results.get("scale"):
+        print("Warning: the results were measured at different scales.", file=sys.stderr)
+
+    regressions = compare(baseline, results, args.threshold)
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) slower than {args.threshold}x.", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""Runs the benchmark suite and writes the results as JSON.
+
+Every operation is timed on the wide, deep and parameter-heavy circuits of `circuits.py`:
+
+- `construct`: building the AST with the `AST` constructors.
+- `extract_inputs`: `extract_inputs_variables`.
+- `build_instructions`: `build_instructions`.
+- `compile`: a full compilation with the function built by `ir_compiler_factory`.
+- `model_eq`: comparing two equal models compiled separately.
+- `model_repr`: `repr` of the compiled model.
+- `model_copy`: `deepcopy` of the compiled model.
+
+The results, with the best and median times of each benchmark, are written to a JSON file that can
+be compared across commits with `compare.py`. The lowering pipelines and the memory footprint are
+measured in more detail by `bench_compile.py` and `bench_memory.py`.
+
+Usage:
+
+```bash
+python benchmarks/run.py --scale 1 --repeat 5 --output results.json
+python benchmarks/run.py --filter wide/compile
+```
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import operator
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from copy import deepcopy
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable
+
+from circuits import deep_circuit, param_heavy_circuit, wide_circuit
+
+from qadence2_ir.factory import ir_compiler_factory
+from qadence2_ir.factory_tools import build_instructions, extract_inputs_variables
+from qadence2_ir.irast import AST, Attributes
+from qadence2_ir.irbuilder import IRBuilder
+from qadence2_ir.types import AllocQubits
+
+FORMAT_VERSION = 1
+
+
+@dataclass
+class Circuit:
+    num_qubits: int
+    ast: AST
+
+
+class CircuitBuilder(IRBuilder[Circuit]):
+    @staticmethod
+    def set_register(input_obj: Circuit) -> AllocQubits:
+        return AllocQubits(input_obj.num_qubits)
+
+    @staticmethod
+    def set_directives(input_obj: Circuit) -> Attributes:
+        return dict()
+
+    @staticmethod
+    def settings(input_obj: Circuit) -> Attributes:
+        return dict()
+
+    @staticmethod
+    def parse_sequence(input_obj: Circuit) -> AST:
+        return input_obj.ast
+
+
+def families(scale: float) -> dict[str, tuple[int, Callable[[], AST]]]:
+    """Returns the circuit generators by name, with their number of qubits, for the given scale."""
+
+    def size(value: int) -> int:
+        return max(1, int(value * scale))
+
+    return {
+        "wide": (64, lambda: wide_circuit(64, size(100))),
+        "deep": (8, lambda: deep_circuit(size(100), 100)),
+        "params": (16, lambda: param_heavy_circuit(size(10_000))),
+    }
+
+
+def measure(fn: Callable[[], Any], repeat: int) -> dict[str, Any]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return {"min": min(timings), "median": statistics.median(timings), "repeat": repeat}
+
+
+def benchmarks(scale: float) -> dict[str, Callable[[], Any]]:
+    """Returns the benchmarks by name, `<circuit>/<operation>`."""
+
+    ir_compiler = ir_compiler_factory(CircuitBuilder())
+    cases: dict[str, Callable[[], Any]] = dict()
+    for name, (num_qubits, generate) in families(scale).items():
+        ast = generate()
+        model = ir_compiler(Circuit(num_qubits, ast))
+        other = ir_compiler(Circuit(num_qubits, generate()))
+
+        cases[f"{name}/construct"] = generate
+        cases[f"{name}/extract_inputs"] = partial(extract_inputs_variables, ast)
+        cases[f"{name}/build_instructions"] = partial(build_instructions, ast)
+        cases[f"{name}/compile"] = partial(ir_compiler, Circuit(num_qubits, ast))
+        cases[f"{name}/model_eq"] = partial(operator.eq, model, other)
+        cases[f"{name}/model_repr"] = partial(repr, model)
+        cases[f"{name}/model_copy"] = partial(deepcopy, model)
+    return cases
+
+
+def metadata() -> dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "format": FORMAT_VERSION,
+        "commit": commit,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiplies the circuit sizes.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--filter", default="", help="Runs the benchmarks containing the text.")
+    parser.add_argument("--output", type=Path, default=None, help="Path of the JSON results.")
+    args = parser.parse_args()
+
+    results = dict()
+    for name, fn in benchmarks(args.scale).items():
+        if args.filter not in name:
+            continue
+        results[name] = measure(fn, args.repeat)
+        print(f"{name:<28} {results[name]['min']:>10.4f} s", flush=True)
+
+    report = {**metadata(), "scale": args.scale, "results": results}
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
-from .factory import ir_compiler_factory
+from .factory import async_ir_compiler_factory, ir_batch_compile, ir_compiler_factory
 from .irast import AST, Attributes, InputType
-from .irbuilder import IRBuilder
+from .irbuilder import AsyncIRBuilder, IRBuilder
 from .types import AllocQubits
 
 __all__ = [
     "IRBuilder",
+    "AsyncIRBuilder",
     "AllocQubits",
     "Attributes",
     "AST",
     "InputType",
     "ir_compiler_factory",
+    "ir_batch_compile",
+    "async_ir_compiler_factory",
 ]
@@ -0,0 +1,278 @@
+"""Automatic differentiation of the parameters of the quantum instructions of a `Model`.
+
+`gradient_program` differentiates the arguments of the parametric quantum instructions with respect
+to the trainable input variables, the ones allocated with `Alloc.is_trainable`. The chain of
+`Assign` instructions is differentiated in reverse mode: the adjoint of every argument is
+propagated back through the assignments it depends on, using the local derivatives of each
+callable, given by the rules in `DERIVATIVES`.
+
+The result is a separate program of `Assign` instructions, to be evaluated after the instructions
+of the model, and a Jacobian table pointing to the variables, or literals, holding each derivative.
+Derivatives with respect to array variables are element-wise.
+"""
+
+from __future__ import annotations
+
+from numbers import Complex
+from typing import Any, Callable
+
+from .passes import FOLDABLE_CALLABLES
+from .types import Assign, Call, Load, Model, QuInstruct
+
+# An `Emit` function adds the assignment of a call to the derivative program and returns its
+# result, e.g. `emit("cos", x)`.
+Emit = Callable[..., Any]
+DerivativeRule = Callable[[tuple[Any, ...], Load, int, Emit], Any]
+
+
+def _add_rule(args: tuple[Any, ...], result: Load, position: int, emit: Emit) -> Any:
+    return 1
+
+
+def _sub_rule(args: tuple[Any, ...], result: Load, position: int, emit: Emit) -> Any:
+    return 1 if position == 0 else -1
+
+
+def _mul_rule(args: tuple[Any, ...], result: Load, position: int, emit: Emit) -> Any:
+    others = [arg for index, arg in enumerate(args) if index != position]
+    partial = others[0]
+    for other in others[1:]:
+        partial = emit("mul", partial, other)
+    return partial
+
+
+def _div_rule(args: tuple[Any, ...], result: Load, position: int, emit: Emit) -> Any:
+    if position == 0:
+        return emit("div", 1, args[1])
+    return emit("mul", -1, emit("div", result, args[1]))
+
+
+def _rem_rule(args: tuple[Any, ...], result: Load, position: int, emit: Emit) -> Any:
+    if position == 0:
+        return 1
+    return emit("mul", -1, emit("floor", emit("div", args[0], args[1])))
+
+
+def _pow_rule(args: tuple[Any, ...], result: Load, position: int, emit: Emit) -> Any:
+    base, exponent = args
+    if position == 0:
+        return emit("mul", exponent, emit("pow", base, emit("sub", exponent, 1)))
+    return emit("mul", result, emit("log", base))
+
+
+DERIVATIVES: dict[str, DerivativeRule] = {
+    "add": _add_rule,
+    "sub": _sub_rule,
+    "mul": _mul_rule,
+    "div": _div_rule,
+    "rem": _rem_rule,
+    "pow": _pow_rule,
+    "neg": lambda args, result, position, emit: -1,
+    "sin": lambda args, result, position, emit: emit("cos", args[0]),
+    "cos": lambda args, result, position, emit: emit("mul", -1, emit("sin", args[0])),
+    "tan": lambda args, result, position, emit: emit("add", 1, emit("pow", result, 2)),
+    "exp": lambda args, result, position, emit: result,
+    "log": lambda args, result, position, emit: emit("div", 1, args[0]),
+    "sqrt": lambda args, result, position, emit: emit("div", 0.5, result),
+}
+
+
+def register_derivative(name: str, rule: DerivativeRule) -> None:
+    """Registers the derivative rule of a callable.
+
+    Args:
+        name: The identifier of the callable, as used in `Call`.
+        rule: A function receiving the arguments of the call, the variable holding its result,
+            the position of the argument to differentiate with respect to, and an `emit`
+            function. It returns the partial derivative as a literal or as the result of `emit`,
+            which adds the assignment of a call to the derivative program, e.g.
+            `emit("cos", args[0])`.
+    """
+
+    DERIVATIVES[name] = rule
+
+
+class GradientProgram:
+    """The derivatives of the arguments of the parametric quantum instructions of a model.
+
+    Args:
+        instructions: The assignments computing the derivatives, to be evaluated after the
+            instructions of the model.
+        jacobian: The derivatives of the arguments, indexed by the index of the quantum instruction
+            in the model and the position of the argument. Each entry maps the trainable input
+            variables to the `Load` of the variable, or the literal, holding the derivative.
+            Arguments that do not depend on trainable variables are not in the table.
+    """
+
+    __slots__ = ("instructions", "jacobian")
+
+    def __init__(
+        self,
+        instructions: list[Assign],
+        jacobian: dict[tuple[int, int], dict[str, Any]],
+    ) -> None:
+        self.instructions = instructions
+        self.jacobian = jacobian
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({len(self.instructions)} instructions, "
+            f"{len(self.jacobian)} arguments)"
+        )
+
+    def __eq__(self, value: object) -> bool:
+        if not isinstance(value, GradientProgram):
+            return NotImplemented
+        return self.instructions == value.instructions and self.jacobian == value.jacobian
+
+
+def gradient_program(model: Model) -> GradientProgram:
+    """Differentiates the arguments of the quantum instructions w.r.t. the trainable inputs.
+
+    The local derivatives of each assignment are emitted once and shared by all the arguments
+    depending on it, and the derivatives of a variable are propagated once for all the arguments
+    loading it. New temporary variables are labeled after the largest `%n` of the model. Run
+    `passes.eliminate_common_subexpressions` on the model instructions followed by the program to
+    merge redundant derivative assignments.
+
+    Args:
+        model: The model to differentiate.
+
+    Returns:
+        The derivative program and the Jacobian of the arguments.
+
+    Raises:
+        ValueError: If an argument depends on a trainable variable through a callable without a
+            derivative rule.
+
+    Example:
+
+    ```python
+    >>> model = Model(
+    ...     AllocQubits(1),
+    ...     {"x": Alloc(1, trainable=True)},
+    ...     [
+    ...         Assign("%0", Call("sin", Load("x"))),
+    ...         QuInstruct("rx", Support((0,)), Load("%0")),
+    ...     ],
+    ... )
+    >>> program = gradient_program(model)
+    >>> program.instructions
+    [Assign('%1', Call('cos', Load('x')))]
+    >>> program.jacobian
+    {(1, 0): {'x': Load('%1')}}
+    ```
+    """
+
+    trainables = {name for name, alloc in model.inputs.items() if alloc.is_trainable}
+    assignments: dict[str, tuple[int, Assign]] = dict()
+    # The variables depending on trainable variables, through the assignments.
+    dependent = set(trainables)
+    for index, instruction in enumerate(model.instructions):
+        if isinstance(instruction, Assign):
+            assignments[instruction.variable] = (index, instruction)
+            if any(arg.variable in dependent for arg in _loads(instruction)):
+                dependent.add(instruction.variable)
+
+    counter = 1 + max((_index(name) for name in assignments), default=-1)
+    program: list[Assign] = []
+
+    def emit(identifier: str, *args: Any) -> Any:
+        nonlocal counter
+        if identifier in FOLDABLE_CALLABLES and all(isinstance(arg, Complex) for arg in args):
+            try:
+                return FOLDABLE_CALLABLES[identifier](*args)
+            except (ArithmeticError, TypeError, ValueError):
+                pass
+        if identifier == "mul":
+            if any(isinstance(arg, Complex) and arg == 0 for arg in args):
+                return 0
+            args = tuple(arg for arg in args if not (isinstance(arg, Complex) and arg == 1))
+            if len(args) < 2:
+                return args[0] if args else 1
+        if identifier == "add":
+            args = tuple(arg for arg in args if not (isinstance(arg, Complex) and arg == 0))
+            if len(args) < 2:
+                return args[0] if args else 0
+
+        label = f"%{counter}"
+        counter += 1
+        program.append(Assign(label, Call(identifier, *args)))
+        return Load(label)
+
+    partials: dict[tuple[str, int], Any] = dict()
+
+    def partial(variable: str, position: int) -> Any:
+        key = (variable, position)
+        if key not in partials:
+            value = assignments[variable][1].value
+            if not isinstance(value, Call):
+                partials[key] = 1
+            elif value.identifier not in DERIVATIVES:
+                raise ValueError(f"No derivative rule registered for '{value.identifier}'.")
+            else:
+                rule = DERIVATIVES[value.identifier]
+                partials[key] = rule(value.args, Load(variable), position, emit)
+        return partials[key]
+
+    # The derivatives of each variable loaded by the quantum instructions, propagated once and
+    # shared by all the arguments loading the variable.
+    gradients: dict[str, dict[str, Any]] = dict()
+    jacobian: dict[tuple[int, int], dict[str, Any]] = dict()
+    for index, instruction in enumerate(model.instructions):
+        if not isinstance(instruction, QuInstruct):
+            continue
+
+        for position, arg in enumerate(instruction.args):
+            if not isinstance(arg, Load) or arg.variable not in dependent:
+                continue
+
+            if arg.variable in gradients:
+                if gradients[arg.variable]:
+                    jacobian[(index, position)] = dict(gradients[arg.variable])
+                continue
+
+            adjoints: dict[str, Any] = {arg.variable: 1}
+            # Number of adjoints of assigned variables still to propagate.
+            pending = int(arg.variable in assignments)
+            previous = assignments[arg.variable][0] if pending else -1
+            while pending:
+                assignment = model.instructions[previous]
+                previous -= 1
+                if not isinstance(assignment, Assign) or assignment.variable not in adjoints:
+                    continue
+
+                adjoint = adjoints.pop(assignment.variable)
+                pending -= 1
+                for operand, load in enumerate(_operands(assignment)):
+                    if not isinstance(load, Load) or load.variable not in dependent:
+                        continue
+                    contribution = emit("mul", adjoint, partial(assignment.variable, operand))
+                    if load.variable in adjoints:
+                        contribution = emit("add", adjoints[load.variable], contribution)
+                    else:
+                        pending += load.variable in assignments
+                    adjoints[load.variable] = contribution
+
+            gradient = {name: adjoints[name] for name in model.inputs if name in adjoints}
+            gradients[arg.variable] = gradient
+            if gradient:
+                jacobian[(index, position)] = dict(gradient)
+
+    return GradientProgram(program, jacobian)
+
+
+def _operands(instruction: Assign) -> tuple[Any, ...]:
+    if isinstance(instruction.value, Call):
+        return instruction.value.args
+    return (instruction.value,)
+
+
+def _loads(instruction: Assign) -> list[Load]:
+    return [arg for arg in _operands(instruction) if isinstance(arg, Load)]
+
+
+def _index(variable: str) -> int:
+    if variable.startswith("%") and variable[1:].isdigit():
+        return int(variable[1:])
+    return -1
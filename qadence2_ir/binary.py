@@ -0,0 +1,227 @@
+"""Versioned binary serialization of a `Model`.
+
+This module defines a compact binary encoding of a `Model` meant to ship compiled IR between
+processes. The instructions are stored in the columnar layout of `qadence2-ir.columnar`, so every
+column is an array of fixed-width records that can be read in place from a `memoryview` or a
+memory-mapped file, without materializing all the instructions up front.
+
+Layout, in little-endian byte order:
+
+- Prefix: the magic bytes `Q2IR`, the format version (`uint16`), a reserved `uint16` and the
+    number of sections (`uint32`).
+- Section table: the offset and size in bytes (`uint64` each) of every section.
+- Sections, each aligned to 8 bytes:
+    - `metadata`: JSON with the register, inputs, directives and settings.
+    - `strings`: JSON list with the string table (opcodes and variable names).
+    - `objects`: JSON list with the object table (non-packed arguments and attributes).
+    - One section per column of `ColumnarInstructions`, in the order of `COLUMNS`.
+
+The JSON sections use the safe encoding of `qadence2-ir.codec`; no code is executed when loading.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import struct
+import sys
+from array import array
+from os import PathLike
+from typing import Any
+
+from .codec import decode_value, encode_value
+from .columnar import COLUMNS, TYPECODES, ColumnarInstructions
+from .types import Alloc, AllocQubits, Model
+
+MAGIC = b"Q2IR"
+VERSION = 1
+SECTIONS = ("metadata", "strings", "objects", *COLUMNS)
+
+_PREFIX = struct.Struct("<4sHHI")
+_SECTION = struct.Struct("<QQ")
+_ALIGNMENT = 8
+_NATIVE_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+class BinaryModel:
+    """A `Model` loaded from its binary encoding.
+
+    The register, inputs, directives and settings are decoded when loading, while the instructions
+    are a `ColumnarInstructions` whose columns are views on the underlying buffer. Instructions are
+    only materialized when accessed, or all at once with `to_model`.
+
+    Args:
+        register: The register of the model.
+        inputs: The input allocations of the model.
+        instructions: The columnar instructions of the model.
+        directives: The directives of the model.
+        settings: The settings of the model.
+    """
+
+    __slots__ = ("register", "inputs", "instructions", "directives", "settings")
+
+    def __init__(
+        self,
+        register: AllocQubits,
+        inputs: dict[str, Alloc],
+        instructions: ColumnarInstructions,
+        directives: dict[str, Any],
+        settings: dict[str, Any],
+    ) -> None:
+        self.register = register
+        self.inputs = inputs
+        self.instructions = instructions
+        self.directives = directives
+        self.settings = settings
+
+    def to_model(self) -> Model:
+        """Materializes all the instructions and returns the equivalent `Model`."""
+
+        return Model(
+            self.register,
+            self.inputs,
+            self.instructions.to_instructions(),
+            self.directives,
+            self.settings,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({self.register}, inputs={list(self.inputs)}, "
+            f"{self.instructions})"
+        )
+
+
+def dumps(model: Model) -> bytes:
+    """Encodes a `Model` in the binary format.
+
+    Args:
+        model: The model to encode.
+
+    Returns:
+        The binary encoding of the `model`.
+    """
+
+    table = ColumnarInstructions.from_instructions(model.instructions)
+    metadata = {
+        "register": encode_value(model.register),
+        "inputs": {name: encode_value(alloc) for name, alloc in model.inputs.items()},
+        "directives": encode_value(model.directives),
+        "settings": encode_value(model.settings),
+    }
+
+    sections = [
+        json.dumps(metadata).encode(),
+        json.dumps(table.strings).encode(),
+        json.dumps([encode_value(obj) for obj in table.objects]).encode(),
+    ]
+    for name in COLUMNS:
+        column = getattr(table, name)
+        if not _NATIVE_LITTLE_ENDIAN:
+            column = array(column.typecode, column)
+            column.byteswap()
+        sections.append(column.tobytes())
+
+    header_size = _PREFIX.size + _SECTION.size * len(sections)
+    offset = _aligned(header_size)
+    chunks = [_PREFIX.pack(MAGIC, VERSION, 0, len(sections))]
+    body = []
+    for section in sections:
+        chunks.append(_SECTION.pack(offset, len(section)))
+        padding = _aligned(len(section)) - len(section)
+        body.append(section + bytes(padding))
+        offset += len(section) + padding
+
+    chunks.append(bytes(_aligned(header_size) - header_size))
+    return b"".join(chunks + body)
+
+
+def loads(data: bytes | bytearray | memoryview | mmap.mmap) -> BinaryModel:
+    """Decodes a `Model` from its binary encoding without materializing the instructions.
+
+    The columns of the returned instructions are views on `data`, which must not be modified while
+    the model is in use.
+
+    Args:
+        data: A buffer holding the binary encoding of a model.
+
+    Returns:
+        The decoded model, with lazily materialized instructions.
+
+    Raises:
+        ValueError: If the buffer is not a valid encoding or has an unsupported version.
+    """
+
+    view = memoryview(data).cast("B")
+    if len(view) < _PREFIX.size:
+        raise ValueError("Buffer is too small to hold an encoded model.")
+
+    magic, version, _, num_sections = _PREFIX.unpack_from(view)
+    if magic != MAGIC:
+        raise ValueError("Buffer does not hold an encoded model.")
+    if version > VERSION:
+        raise ValueError(f"Unsupported format version {version}, the latest is {VERSION}.")
+    if num_sections != len(SECTIONS):
+        raise ValueError(f"Expected {len(SECTIONS)} sections, found {num_sections}.")
+
+    sections = {}
+    for index, name in enumerate(SECTIONS):
+        offset, size = _SECTION.unpack_from(view, _PREFIX.size + index * _SECTION.size)
+        if offset + size > len(view):
+            raise ValueError(f"Section '{name}' exceeds the buffer size.")
+        sections[name] = view[offset : offset + size]
+
+    metadata = json.loads(bytes(sections["metadata"]))
+    strings = json.loads(bytes(sections["strings"]))
+    objects = [decode_value(obj) for obj in json.loads(bytes(sections["objects"]))]
+
+    columns: dict[str, Any] = dict()
+    for name in COLUMNS:
+        typecode = TYPECODES[name]
+        if _NATIVE_LITTLE_ENDIAN:
+            columns[name] = sections[name].cast(typecode)
+        else:
+            column = array(typecode, bytes(sections[name]))
+            column.byteswap()
+            columns[name] = column
+
+    return BinaryModel(
+        decode_value(metadata["register"]),
+        {name: decode_value(alloc) for name, alloc in metadata["inputs"].items()},
+        ColumnarInstructions(strings, objects, **columns),
+        decode_value(metadata["directives"]),
+        decode_value(metadata["settings"]),
+    )
+
+
+def dump(model: Model, path: str | PathLike[str]) -> None:
+    """Writes the binary encoding of a `Model` to a file.
+
+    Args:
+        model: The model to encode.
+        path: The path of the file to write.
+    """
+
+    with open(path, "wb") as file:
+        file.write(dumps(model))
+
+
+def load(path: str | PathLike[str]) -> BinaryModel:
+    """Memory-maps a file holding the binary encoding of a `Model` and decodes it.
+
+    The instructions are read in place from the memory-mapped file when accessed.
+
+    Args:
+        path: The path of the file to read.
+
+    Returns:
+        The decoded model, with lazily materialized instructions.
+    """
+
+    with open(path, "rb") as file:
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    return loads(buffer)
+
+
+def _aligned(size: int) -> int:
+    return -(-size // _ALIGNMENT) * _ALIGNMENT
@@ -0,0 +1,243 @@
+"""Cache of compiled models for the compiler functions built by `ir_compiler_factory`.
+
+A `CompileCache` stores the `Model` compiled from an `AST`, keyed by the exact fingerprint of the
+AST, `ast_key` as defined in `qadence2-ir.fingerprint`, together with the register, directives and
+settings returned by the `IRBuilder`. When the same circuit is compiled again, the cached model is
+returned without lowering the AST. The cache is an LRU bounded in number of entries, and can
+optionally persist the models on disk, using the binary format defined in `qadence2-ir.binary`, to
+share them between processes and runs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import struct
+import tempfile
+from collections import OrderedDict
+from copy import deepcopy
+from pathlib import Path
+from threading import Lock
+from typing import Any, NamedTuple
+
+from . import binary
+from .codec import encode_value
+from .fingerprint import ast_key
+from .irast import AST
+from .types import Alloc, AllocQubits, Assign, Call, Load, Model, QuInstruct, Support
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int | None
+
+
+class CompileCache:
+    """LRU cache of compiled models, optionally backed by a directory on disk.
+
+    Args:
+        maxsize: Maximum number of models kept in memory, `None` for an unbounded cache. The least
+            recently used model is evicted when the cache is full.
+        directory: Optional directory where the compiled models are persisted. Models evicted from
+            memory, or compiled by other processes, are loaded from there on a memory miss.
+    """
+
+    __slots__ = ("maxsize", "directory", "hits", "misses", "evictions", "_models", "_lock")
+
+    def __init__(self, maxsize: int | None = 128, directory: str | Path | None = None) -> None:
+        self.maxsize = maxsize
+        self.directory = Path(directory) if directory is not None else None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._models: OrderedDict[str, Model] = OrderedDict()
+        self._lock = Lock()
+
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(
+        ast: AST,
+        register: AllocQubits,
+        directives: dict[str, Any],
+        settings: dict[str, Any],
+    ) -> str:
+        """Returns the key of the model compiled from the given AST and compilation metadata.
+
+        ASTs that are equal but lowered to different instructions, like `AST.numeric(1)` and
+        `AST.numeric(1.0)`, have different keys.
+
+        Args:
+            ast: The parsed AST to be compiled.
+            register: The register returned by the `IRBuilder`.
+            directives: The directives returned by the `IRBuilder`.
+            settings: The settings returned by the `IRBuilder`.
+
+        Returns:
+            A hexadecimal digest, stable across processes.
+
+        Raises:
+            TypeError: If any of the arguments holds a value that cannot be encoded.
+        """
+
+        digest = hashlib.sha256(ast_key(ast))
+        digest.update(_encode([register, directives, settings]))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Model | None:
+        """Returns a copy of the cached model for the `key`, or `None` on a cache miss.
+
+        The copy has its own instructions, so that changes to it do not affect the cache. Files on
+        disk that cannot be decoded, like truncated files, are treated as misses.
+
+        Args:
+            key: The key of the model, as returned by `CompileCache.key`.
+
+        Returns:
+            The cached model or `None`.
+        """
+
+        with self._lock:
+            model = self._models.get(key)
+            if model is not None:
+                self._models.move_to_end(key)
+
+        if model is None and self.directory is not None:
+            model = _load(self.directory / f"{key}.q2ir")
+            if model is not None:
+                self._store(key, model)
+
+        with self._lock:
+            if model is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        return _copy(model)
+
+    def put(self, key: str, model: Model) -> None:
+        """Stores a compiled model in the cache.
+
+        Args:
+            key: The key of the model, as returned by `CompileCache.key`.
+            model: The compiled model. A copy is stored so that later changes to `model`, or to
+                its instructions, do not affect the cache. Models holding values the binary format
+                cannot encode are only cached in memory.
+        """
+
+        model = _copy(model)
+        self._store(key, model)
+
+        if self.directory is not None:
+            try:
+                data = binary.dumps(model)
+            except (TypeError, ValueError):
+                return
+            # Each call writes its own temporary file, so that concurrent writers of the same key,
+            # in other threads or processes, only race on the atomic replacement.
+            descriptor, temporary = tempfile.mkstemp(".tmp", f"{key}.", self.directory)
+            try:
+                with os.fdopen(descriptor, "wb") as file:
+                    file.write(data)
+                os.replace(temporary, self.directory / f"{key}.q2ir")
+            except BaseException:
+                os.unlink(temporary)
+                raise
+
+    def _store(self, key: str, model: Model) -> None:
+        with self._lock:
+            self._models[key] = model
+            self._models.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._models) > self.maxsize:
+                    self._models.popitem(last=False)
+                    self.evictions += 1
+
+    def info(self) -> CacheInfo:
+        """Returns the hit, miss and eviction counters and the current size of the cache."""
+
+        with self._lock:
+            return CacheInfo(
+                self.hits, self.misses, self.evictions, len(self._models), self.maxsize
+            )
+
+    def clear(self) -> None:
+        """Removes all the models from memory and resets the counters.
+
+        The models persisted on disk are kept.
+        """
+
+        with self._lock:
+            self._models.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.info()})"
+
+
+def _load(path: Path) -> Model | None:
+    # Missing, truncated or corrupt files, and files in another version of the format, are misses.
+    # They are overwritten by the next `put` of their key.
+    try:
+        return binary.loads(path.read_bytes()).to_model()
+    except (OSError, ValueError, TypeError, KeyError, IndexError, struct.error):
+        return None
+
+
+def _copy(model: Model) -> Model:
+    return Model(
+        _copy_value(model.register),
+        _copy_value(model.inputs),
+        [_copy_value(instruction) for instruction in model.instructions],
+        _copy_value(model.directives),
+        _copy_value(model.settings),
+    )
+
+
+def _copy_value(value: Any) -> Any:
+    # Copies the mutable IR objects and containers, faster than `deepcopy` on IR instructions.
+    if value is None or isinstance(value, (str, int, float, complex, bytes)):
+        return value
+    if isinstance(value, QuInstruct):
+        return QuInstruct(
+            value.name,
+            Support(value.support.target, value.support.control),
+            *map(_copy_value, value.args),
+            **_copy_value(value.attrs),
+        )
+    if isinstance(value, Assign):
+        return Assign(value.variable, _copy_value(value.value))
+    if isinstance(value, Call):
+        return Call(value.identifier, *map(_copy_value, value.args))
+    if isinstance(value, Load):
+        return Load(value.variable)
+    if isinstance(value, Alloc):
+        return Alloc(value.size, value.is_trainable, **_copy_value(value.attrs))
+    if isinstance(value, AllocQubits):
+        return AllocQubits(
+            value.num_qubits,
+            _copy_value(value.qubit_positions),
+            value.grid_type,
+            value.grid_scale,
+            _copy_value(value.connectivity),
+            _copy_value(value.options),
+        )
+    if isinstance(value, tuple):
+        return tuple(map(_copy_value, value))
+    if isinstance(value, list):
+        return list(map(_copy_value, value))
+    if isinstance(value, dict):
+        return {key: _copy_value(item) for key, item in value.items()}
+    return deepcopy(value)
+
+
+def _encode(value: Any) -> bytes:
+    return json.dumps(encode_value(value), sort_keys=True, separators=(",", ":")).encode()
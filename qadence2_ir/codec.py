@@ -0,0 +1,135 @@
+"""Conversion of IR values to and from JSON-compatible data.
+
+This module defines a safe and stable encoding of the values found in a `Model`, used by the
+serialization formats of the IR. Unlike pickle, decoding never executes arbitrary code: only
+built-in data types and the IR types defined in `qadence2-ir.types` are supported.
+
+JSON scalars, strings and lists are encoded as themselves, and dictionaries with string keys as
+JSON objects. Other values are encoded as a JSON object with a single tag key starting with `$`:
+
+- `{"$tuple": [...]}`: A tuple.
+- `{"$complex": [real, imag]}`: A complex number.
+- `{"$dict": [[key, value], ...]}`: A dictionary with non-string keys.
+- `{"$load": variable}`: A `Load` instruction.
+- `{"$call": [identifier, *args]}`: A `Call` instruction.
+- `{"$support": [target, control]}`: A `Support`.
+- `{"$alloc": [size, trainable, attrs]}`: An `Alloc`.
+- `{"$qubits": {...}}`: An `AllocQubits` register, with its arguments by name.
+- `{"$assign": [variable, value]}`: An `Assign` instruction.
+- `{"$quinstruct": [name, support, args, attrs]}`: A `QuInstruct` instruction.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from .types import Alloc, AllocQubits, Assign, Call, Load, QuInstruct, Support
+
+
+def encode_value(value: Any) -> Any:
+    """Converts an IR value into JSON-compatible data.
+
+    Args:
+        value: A value made of built-in data types and IR types.
+
+    Returns:
+        The JSON-compatible representation of the `value`.
+
+    Raises:
+        TypeError: If the value contains an object of an unsupported type.
+    """
+
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, list):
+        return [encode_value(item) for item in value]
+    if isinstance(value, tuple):
+        return {"$tuple": [encode_value(item) for item in value]}
+    if isinstance(value, dict):
+        if all(isinstance(key, str) for key in value) and not (
+            len(value) == 1 and next(iter(value)).startswith("$")
+        ):
+            return {key: encode_value(item) for key, item in value.items()}
+        return {"$dict": [[encode_value(key), encode_value(item)] for key, item in value.items()]}
+    if isinstance(value, complex):
+        return {"$complex": [value.real, value.imag]}
+    if isinstance(value, Load):
+        return {"$load": value.variable}
+    if isinstance(value, Call):
+        return {"$call": [value.identifier, *map(encode_value, value.args)]}
+    if isinstance(value, Support):
+        return {"$support": [list(value.target), list(value.control)]}
+    if isinstance(value, Alloc):
+        return {"$alloc": [value.size, value.is_trainable, encode_value(value.attrs)]}
+    if isinstance(value, AllocQubits):
+        return {
+            "$qubits": {
+                "num_qubits": value.num_qubits,
+                "qubit_positions": encode_value(value.qubit_positions),
+                "grid_type": value.grid_type,
+                "grid_scale": value.grid_scale,
+                "connectivity": encode_value(value.connectivity),
+                "options": encode_value(value.options),
+            }
+        }
+    if isinstance(value, Assign):
+        return {"$assign": [value.variable, encode_value(value.value)]}
+    if isinstance(value, QuInstruct):
+        return {
+            "$quinstruct": [
+                value.name,
+                encode_value(value.support),
+                [encode_value(arg) for arg in value.args],
+                encode_value(value.attrs),
+            ]
+        }
+
+    raise TypeError(f"Cannot encode a value of type {type(value).__name__}.")
+
+
+def decode_value(data: Any) -> Any:
+    """Converts JSON-compatible data produced by `encode_value` back into an IR value.
+
+    Args:
+        data: The JSON-compatible representation of a value.
+
+    Returns:
+        The decoded value.
+
+    Raises:
+        ValueError: If the data contains an unknown tag.
+    """
+
+    if isinstance(data, list):
+        return [decode_value(item) for item in data]
+    if not isinstance(data, dict):
+        return data
+    if len(data) != 1 or not next(iter(data)).startswith("$"):
+        return {key: decode_value(item) for key, item in data.items()}
+
+    [(tag, content)] = data.items()
+    if tag == "$tuple":
+        return tuple(decode_value(item) for item in content)
+    if tag == "$complex":
+        return complex(*content)
+    if tag == "$dict":
+        return {decode_value(key): decode_value(item) for key, item in content}
+    if tag == "$load":
+        return Load(content)
+    if tag == "$call":
+        return Call(content[0], *map(decode_value, content[1:]))
+    if tag == "$support":
+        return Support(tuple(content[0]), tuple(content[1]))
+    if tag == "$alloc":
+        return Alloc(content[0], content[1], **decode_value(content[2]))
+    if tag == "$qubits":
+        return AllocQubits(**{key: decode_value(item) for key, item in content.items()})
+    if tag == "$assign":
+        return Assign(content[0], decode_value(content[1]))
+    if tag == "$quinstruct":
+        name, support, args, attrs = content
+        return QuInstruct(
+            name, decode_value(support), *map(decode_value, args), **decode_value(attrs)
+        )
+
+    raise ValueError(f"Unknown tag '{tag}' in encoded value.")
@@ -0,0 +1,269 @@
+"""Columnar (struct-of-arrays) storage for `Model` instructions.
+
+This module defines `ColumnarInstructions`, an alternative container for the list of
+instructions of a `Model`. Instead of one Python object per instruction, with its nested `Support`
+and tuple of arguments, each field is stored in a packed column:
+
+- `kinds`: The kind of each instruction, `QUANTUM` for `QuInstruct` and `ASSIGN` for `Assign`.
+- `opcodes`: The index in the string table of the `QuInstruct.name` or `Call.identifier`. An
+    `Assign` whose value is not a `Call` has opcode `-1` and its value stored as its only argument.
+- `labels`: The index in the string table of the `Assign.variable`, `-1` for quantum instructions.
+- `target_offsets`, `targets`, `control_offsets`, `controls`: The qubit indices of the `Support`,
+    where the indices of the instruction `i` are `targets[target_offsets[i]:target_offsets[i+1]]`.
+- `arg_offsets`, `arg_kinds`, `arg_values`, `arg_refs`: The arguments of the instructions. A float
+    argument is stored in `arg_values`, an integer argument in `arg_refs`, a `Load` argument as the
+    index of its variable in the string table and any other value as an index in the object table.
+- `attr_refs`: The index of the instruction attributes in the object table, `-1` if there are none.
+
+The columns are backed by `array.array` buffers and can be viewed as NumPy arrays without copy.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Any, Iterable, Iterator, Literal, Sequence
+
+from .types import Assign, Call, Load, QuInstruct, Support
+
+QUANTUM = 0
+ASSIGN = 1
+
+ARG_FLOAT = 0
+ARG_INT = 1
+ARG_LOAD = 2
+ARG_OBJECT = 3
+
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+
+COLUMNS = (
+    "kinds",
+    "opcodes",
+    "labels",
+    "target_offsets",
+    "targets",
+    "control_offsets",
+    "controls",
+    "arg_offsets",
+    "arg_kinds",
+    "arg_values",
+    "arg_refs",
+    "attr_refs",
+)
+
+TYPECODES: dict[str, Literal["B", "i", "I", "d", "q"]] = {
+    "kinds": "B",
+    "opcodes": "i",
+    "labels": "i",
+    "target_offsets": "I",
+    "targets": "i",
+    "control_offsets": "I",
+    "controls": "i",
+    "arg_offsets": "I",
+    "arg_kinds": "B",
+    "arg_values": "d",
+    "arg_refs": "q",
+    "attr_refs": "i",
+}
+
+
+class ColumnarInstructions:
+    """Struct-of-arrays container for a list of `QuInstruct` and `Assign` instructions.
+
+    Use `ColumnarInstructions.from_instructions` to build the container from the list form, and
+    `to_instructions` to convert it back. Indexing or iterating over the container materialises
+    the instructions one at a time.
+
+    Args:
+        strings: The string table holding the opcodes and variables names.
+        objects: The object table holding the arguments and attributes that are not packed.
+        columns: The packed columns, indexed by the names in `COLUMNS`. Any sequence supporting
+            indexing can be used, e.g. `array.array` or a typed `memoryview`.
+    """
+
+    __slots__ = ("strings", "objects", *COLUMNS)
+
+    strings: Sequence[str]
+    objects: Sequence[Any]
+    kinds: Sequence[int]
+    opcodes: Sequence[int]
+    labels: Sequence[int]
+    target_offsets: Sequence[int]
+    targets: Sequence[int]
+    control_offsets: Sequence[int]
+    controls: Sequence[int]
+    arg_offsets: Sequence[int]
+    arg_kinds: Sequence[int]
+    arg_values: Sequence[float]
+    arg_refs: Sequence[int]
+    attr_refs: Sequence[int]
+
+    def __init__(
+        self, strings: Sequence[str], objects: Sequence[Any], **columns: Sequence[Any]
+    ) -> None:
+        self.strings = strings
+        self.objects = objects
+        for name in COLUMNS:
+            setattr(self, name, columns[name])
+
+    @classmethod
+    def from_instructions(cls, instructions: Iterable[QuInstruct | Assign]) -> ColumnarInstructions:
+        """Packs a list of instructions into columns.
+
+        Args:
+            instructions: The quantum operations and assignments to pack, as in `Model`.
+
+        Returns:
+            The columnar representation of the `instructions`.
+        """
+
+        strings: list[str] = []
+        string_ids: dict[str, int] = dict()
+        objects: list[Any] = []
+        columns: dict[str, array[Any]] = {name: array(TYPECODES[name]) for name in COLUMNS}
+        for name in ("target_offsets", "control_offsets", "arg_offsets"):
+            columns[name].append(0)
+
+        def intern(string: str) -> int:
+            index = string_ids.get(string)
+            if index is None:
+                index = string_ids[string] = len(strings)
+                strings.append(string)
+            return index
+
+        kinds, opcodes, labels = columns["kinds"], columns["opcodes"], columns["labels"]
+        targets, controls = columns["targets"], columns["controls"]
+        arg_kinds, arg_values, arg_refs = (
+            columns["arg_kinds"],
+            columns["arg_values"],
+            columns["arg_refs"],
+        )
+        attr_refs = columns["attr_refs"]
+
+        for instruction in instructions:
+            if isinstance(instruction, QuInstruct):
+                kinds.append(QUANTUM)
+                opcodes.append(intern(instruction.name))
+                labels.append(-1)
+                targets.extend(instruction.support.target)
+                controls.extend(instruction.support.control)
+                args: Sequence[Any] = instruction.args
+                attrs = instruction.attrs
+            elif isinstance(instruction, Assign):
+                kinds.append(ASSIGN)
+                labels.append(intern(instruction.variable))
+                if isinstance(instruction.value, Call):
+                    opcodes.append(intern(instruction.value.identifier))
+                    args = instruction.value.args
+                else:
+                    opcodes.append(-1)
+                    args = (instruction.value,)
+                attrs = dict()
+            else:
+                raise TypeError(f"Unsupported instruction type: {type(instruction).__name__}.")
+
+            for arg in args:
+                if type(arg) is float:
+                    arg_kinds.append(ARG_FLOAT)
+                    arg_values.append(arg)
+                    arg_refs.append(0)
+                elif type(arg) is int and _INT64_MIN <= arg <= _INT64_MAX:
+                    arg_kinds.append(ARG_INT)
+                    arg_values.append(0.0)
+                    arg_refs.append(arg)
+                elif type(arg) is Load:
+                    arg_kinds.append(ARG_LOAD)
+                    arg_values.append(0.0)
+                    arg_refs.append(intern(arg.variable))
+                else:
+                    arg_kinds.append(ARG_OBJECT)
+                    arg_values.append(0.0)
+                    arg_refs.append(len(objects))
+                    objects.append(arg)
+
+            if attrs:
+                attr_refs.append(len(objects))
+                objects.append(attrs)
+            else:
+                attr_refs.append(-1)
+
+            columns["target_offsets"].append(len(targets))
+            columns["control_offsets"].append(len(controls))
+            columns["arg_offsets"].append(len(arg_kinds))
+
+        return cls(strings, objects, **columns)
+
+    def to_instructions(self) -> list[QuInstruct | Assign]:
+        """Unpacks the columns into the list form of the instructions used by `Model`."""
+
+        return list(self)
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def __iter__(self) -> Iterator[QuInstruct | Assign]:
+        for index in range(len(self.kinds)):
+            yield self[index]
+
+    def __getitem__(self, index: int) -> QuInstruct | Assign:
+        if index < 0:
+            index += len(self.kinds)
+        if not 0 <= index < len(self.kinds):
+            raise IndexError("instruction index out of range")
+
+        args = tuple(
+            self._arg(i) for i in range(self.arg_offsets[index], self.arg_offsets[index + 1])
+        )
+
+        if self.kinds[index] == ASSIGN:
+            label = self.strings[self.labels[index]]
+            opcode = self.opcodes[index]
+            if opcode < 0:
+                return Assign(label, args[0])
+            return Assign(label, Call(self.strings[opcode], *args))
+
+        support = Support(
+            tuple(self.targets[self.target_offsets[index] : self.target_offsets[index + 1]]),
+            tuple(self.controls[self.control_offsets[index] : self.control_offsets[index + 1]]),
+        )
+        attr_ref = self.attr_refs[index]
+        attrs = self.objects[attr_ref] if attr_ref >= 0 else dict()
+        return QuInstruct(self.strings[self.opcodes[index]], support, *args, **attrs)
+
+    def _arg(self, index: int) -> Any:
+        kind = self.arg_kinds[index]
+        if kind == ARG_FLOAT:
+            return self.arg_values[index]
+        if kind == ARG_INT:
+            return self.arg_refs[index]
+        if kind == ARG_LOAD:
+            return Load(self.strings[self.arg_refs[index]])
+        return self.objects[self.arg_refs[index]]
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes used by the packed columns."""
+
+        return sum(memoryview(getattr(self, name)).nbytes for name in COLUMNS)
+
+    def as_numpy(self) -> dict[str, Any]:
+        """Returns zero-copy NumPy views of the packed columns, indexed by column name.
+
+        Requires NumPy to be installed.
+        """
+
+        try:
+            import numpy as np
+        except ImportError as error:
+            raise ImportError("NumPy is required to view the columns as arrays.") from error
+
+        return {name: np.frombuffer(getattr(self, name), dtype=TYPECODES[name]) for name in COLUMNS}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self)} instructions, {self.nbytes} bytes)"
+
+    def __eq__(self, value: object) -> bool:
+        if not isinstance(value, ColumnarInstructions):
+            return NotImplemented
+
+        return len(self) == len(value) and all(lhs == rhs for lhs, rhs in zip(self, value))
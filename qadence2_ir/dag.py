@@ -0,0 +1,204 @@
+"""Dependency graph and layer scheduling of the instructions of a `Model`.
+
+`InstructionDAG` is a view on a list of instructions as a directed acyclic graph. A quantum
+instruction depends on the previous quantum instruction acting on each of its qubits, and any
+instruction depends on the assignments of the variables it loads. Instructions with
+`Support.target_all()` act on every qubit and separate the instructions before and after them.
+
+Quantum instructions are scheduled in layers, or moments, of instructions acting on disjoint qubits
+that can be executed in parallel. Assignments are classical and take no time; they are scheduled in
+the moment of the first quantum instruction that needs them.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from .types import Assign, Call, Load, QuInstruct
+
+
+class InstructionDAG:
+    """Dependency graph of a list of instructions.
+
+    The nodes of the graph are the indices of the instructions in the list.
+
+    Args:
+        instructions: A list of quantum operations and static single-assigned variables, in a
+            valid execution order.
+    """
+
+    __slots__ = ("instructions", "predecessors", "successors", "_asap", "_alap", "_depth")
+
+    def __init__(self, instructions: list[QuInstruct | Assign]) -> None:
+        self.instructions = instructions
+        self.predecessors: list[tuple[int, ...]] = []
+        self.successors: list[list[int]] = [[] for _ in instructions]
+
+        assignments: dict[str, int] = dict()
+        last: dict[int, int] = dict()
+        barrier: int | None = None
+        for index, instruction in enumerate(instructions):
+            deps = {
+                assignments[arg.variable]
+                for arg in _loads(instruction)
+                if arg.variable in assignments
+            }
+
+            if isinstance(instruction, Assign):
+                assignments[instruction.variable] = index
+            else:
+                qubits = (*instruction.support.target, *instruction.support.control)
+                if qubits:
+                    for q in qubits:
+                        previous = last.get(q, barrier)
+                        if previous is not None:
+                            deps.add(previous)
+                        last[q] = index
+                else:
+                    deps.update(last.values())
+                    if barrier is not None:
+                        deps.add(barrier)
+                    last.clear()
+                    barrier = index
+
+            self.predecessors.append(tuple(sorted(deps)))
+            for dep in deps:
+                self.successors[dep].append(index)
+
+        # Number of quantum instructions on the longest path ending, resp. starting, at each node.
+        self._asap = [0] * len(instructions)
+        for index, predecessors in enumerate(self.predecessors):
+            level = max((self._asap[dep] for dep in predecessors), default=0)
+            self._asap[index] = level + isinstance(instructions[index], QuInstruct)
+
+        self._alap = [0] * len(instructions)
+        for index in reversed(range(len(instructions))):
+            level = max((self._alap[succ] for succ in self.successors[index]), default=0)
+            self._alap[index] = level + isinstance(instructions[index], QuInstruct)
+
+        self._depth = max(self._asap, default=0)
+
+    @property
+    def depth(self) -> int:
+        """The number of layers of quantum instructions."""
+
+        return self._depth
+
+    def asap_layers(self) -> list[list[int]]:
+        """Returns the quantum instructions scheduled as soon as possible.
+
+        Returns:
+            A list of layers, each holding the indices of the quantum instructions executed in
+            parallel.
+        """
+
+        layers: list[list[int]] = [[] for _ in range(self._depth)]
+        for index, instruction in enumerate(self.instructions):
+            if isinstance(instruction, QuInstruct):
+                layers[self._asap[index] - 1].append(index)
+        return layers
+
+    def alap_layers(self) -> list[list[int]]:
+        """Returns the quantum instructions scheduled as late as possible.
+
+        Returns:
+            A list of layers, each holding the indices of the quantum instructions executed in
+            parallel.
+        """
+
+        layers: list[list[int]] = [[] for _ in range(self._depth)]
+        for index, instruction in enumerate(self.instructions):
+            if isinstance(instruction, QuInstruct):
+                layers[self._depth - self._alap[index]].append(index)
+        return layers
+
+    def critical_path(
+        self, duration: Callable[[QuInstruct], float] | None = None
+    ) -> tuple[list[int], float]:
+        """Returns the longest chain of dependent quantum instructions.
+
+        Args:
+            duration: Optional function returning the duration of a quantum instruction. By
+                default, every quantum instruction takes one unit of time.
+
+        Returns:
+            A tuple with the indices of the quantum instructions on the critical path, in order,
+            and the total duration of the path.
+        """
+
+        duration = duration or (lambda instruction: 1)
+        finish: list[float] = [0.0] * len(self.instructions)
+        parent: list[int | None] = [None] * len(self.instructions)
+        for index, instruction in enumerate(self.instructions):
+            start = 0.0
+            for dep in self.predecessors[index]:
+                if parent[index] is None or finish[dep] > start:
+                    start, parent[index] = finish[dep], dep
+            cost = duration(instruction) if isinstance(instruction, QuInstruct) else 0
+            finish[index] = start + cost
+
+        if not finish:
+            return [], 0.0
+
+        node: int | None = max(range(len(finish)), key=finish.__getitem__)
+        length = finish[node]  # type: ignore[index]
+        path = []
+        while node is not None:
+            if isinstance(self.instructions[node], QuInstruct):
+                path.append(node)
+            node = parent[node]
+        path.reverse()
+        return path, length
+
+    def moments(self, alap: bool = False) -> list[list[QuInstruct | Assign]]:
+        """Groups the instructions in moments of quantum instructions executed in parallel.
+
+        Each moment starts with the assignments needed by its quantum instructions and not computed
+        in an earlier moment, followed by the quantum instructions, in their original order.
+        Assignments not needed by any quantum instruction are placed in the last moment.
+
+        Args:
+            alap: Schedule the quantum instructions as late as possible instead of as soon as
+                possible.
+
+        Returns:
+            A list of moments, each holding a list of instructions.
+        """
+
+        layers = self.alap_layers() if alap else self.asap_layers()
+        moment = [len(layers) - 1] * len(self.instructions)
+        for layer, indices in enumerate(layers):
+            for index in indices:
+                moment[index] = layer
+
+        for index in reversed(range(len(self.instructions))):
+            if isinstance(self.instructions[index], Assign):
+                moment[index] = min(
+                    (moment[succ] for succ in self.successors[index]),
+                    default=max(len(layers) - 1, 0),
+                )
+
+        moments: list[list[Any]] = [[] for _ in range(max(len(layers), 1))]
+        for index, instruction in enumerate(self.instructions):
+            if isinstance(instruction, Assign):
+                moments[moment[index]].append(instruction)
+        for layer, indices in enumerate(layers):
+            moments[layer].extend(self.instructions[index] for index in indices)
+
+        return moments if self.instructions else []
+
+    def __len__(self) -> int:
+        return len(self.instructions)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self)} instructions, depth={self._depth})"
+
+
+def _loads(instruction: QuInstruct | Assign) -> list[Load]:
+    if isinstance(instruction, QuInstruct):
+        args: tuple[Any, ...] = instruction.args
+    elif isinstance(instruction.value, Call):
+        args = instruction.value.args
+    else:
+        args = (instruction.value,)
+    return [arg for arg in args if isinstance(arg, Load)]
@@ -0,0 +1,159 @@
+"""Structural comparison of `Model`s.
+
+`diff_models` reports where two models differ: the register, the input variables, directives and
+settings that were added, removed or changed, and the first instruction at which the two sequences
+of instructions diverge. It runs in linear time. Models compared repeatedly can be diffed by
+fingerprint, with `digests=True`, which only combines the cached digests of the instructions
+instead of comparing their fields, see `fingerprint.instructions_digest`.
+
+Example:
+
+```python
+>>> diff = diff_models(expected, model)
+>>> bool(diff)
+True
+>>> diff
+ModelDiff(inputs={'y': (None, Alloc(1, trainable=False))}, first_divergence=4)
+>>> diff.instructions
+(QuInstruct('rx', Support((0,)), Load('x')), QuInstruct('rx', Support((0,)), Load('y')))
+```
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from .fingerprint import instruction_digest, instructions_digest
+from .types import AllocQubits, Assign, Model, QuInstruct
+
+
+class ModelDiff:
+    """The differences between two models, `before` and `after`.
+
+    Args:
+        before: The first model compared.
+        after: The second model compared.
+        register: The registers of both models, if they differ.
+        inputs: The changed input variables, mapped to their allocations in both models, `None`
+            where the variable is absent.
+        directives: The changed directives, mapped to their values in both models, `None` where
+            the directive is absent.
+        settings: The changed settings, mapped to their values in both models, `None` where the
+            setting is absent.
+        first_divergence: The index of the first instruction that differs between the models, or
+            the length of the shortest one if it is a prefix of the other. `None` if the
+            instructions are equal.
+    """
+
+    __slots__ = (
+        "before",
+        "after",
+        "register",
+        "inputs",
+        "directives",
+        "settings",
+        "first_divergence",
+    )
+
+    def __init__(
+        self,
+        before: Model,
+        after: Model,
+        register: tuple[AllocQubits, AllocQubits] | None = None,
+        inputs: dict[str, tuple[Any, Any]] | None = None,
+        directives: dict[str, tuple[Any, Any]] | None = None,
+        settings: dict[str, tuple[Any, Any]] | None = None,
+        first_divergence: int | None = None,
+    ) -> None:
+        self.before = before
+        self.after = after
+        self.register = register
+        self.inputs = inputs or dict()
+        self.directives = directives or dict()
+        self.settings = settings or dict()
+        self.first_divergence = first_divergence
+
+    @property
+    def instructions(self) -> tuple[QuInstruct | Assign | None, QuInstruct | Assign | None]:
+        """The first divergent instruction in both models, `None` where the model is shorter."""
+
+        index = self.first_divergence
+        if index is None:
+            return None, None
+        return _get(self.before.instructions, index), _get(self.after.instructions, index)
+
+    def __bool__(self) -> bool:
+        return bool(
+            self.register is not None
+            or self.inputs
+            or self.directives
+            or self.settings
+            or self.first_divergence is not None
+        )
+
+    def __repr__(self) -> str:
+        fields = [
+            f"{name}={getattr(self, name)!r}"
+            for name in ("register", "inputs", "directives", "settings", "first_divergence")
+            if getattr(self, name) not in (None, dict())
+        ]
+        return f"{self.__class__.__name__}({', '.join(fields)})"
+
+
+def diff_models(before: Model, after: Model, digests: bool = False) -> ModelDiff:
+    """Compares two models and reports their differences.
+
+    The instructions are compared in order until the first divergence.
+
+    Args:
+        before: The first model.
+        after: The second model.
+        digests: Compare the instructions by their fingerprints, computed once and cached in the
+            instructions, instead of comparing their fields. Instructions modified in place after
+            being fingerprinted must be replaced in the list for the comparison to be exact.
+
+    Returns:
+        The differences between the models, empty, and false, if they are equal.
+    """
+
+    register = None if before.register == after.register else (before.register, after.register)
+    return ModelDiff(
+        before,
+        after,
+        register,
+        _diff_dict(before.inputs, after.inputs),
+        _diff_dict(before.directives, after.directives),
+        _diff_dict(before.settings, after.settings),
+        _first_divergence(before, after, digests),
+    )
+
+
+def _diff_dict(before: dict[str, Any], after: dict[str, Any]) -> dict[str, tuple[Any, Any]]:
+    changes = dict()
+    for key, value in before.items():
+        if key not in after or after[key] != value:
+            changes[key] = (value, after.get(key))
+    for key, value in after.items():
+        if key not in before:
+            changes[key] = (None, value)
+    return changes
+
+
+def _first_divergence(before: Model, after: Model, digests: bool) -> int | None:
+    lhs, rhs = before.instructions, after.instructions
+    if digests:
+        if len(lhs) == len(rhs) and instructions_digest(before) == instructions_digest(after):
+            return None
+        for index, (left, right) in enumerate(zip(lhs, rhs)):
+            if left is not right and instruction_digest(left) != instruction_digest(right):
+                return index
+    else:
+        for index, (left, right) in enumerate(zip(lhs, rhs)):
+            if left is not right and left != right:
+                return index
+
+    return None if len(lhs) == len(rhs) else min(len(lhs), len(rhs))
+
+
+def _get(instructions: list[QuInstruct | Assign], index: int) -> QuInstruct | Assign | None:
+    return instructions[index] if index < len(instructions) else None
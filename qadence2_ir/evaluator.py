@@ -0,0 +1,241 @@
+"""Reference evaluator of the classical instructions of a `Model` over batches of inputs.
+
+The `Evaluator` compiles the chain of `Assign` instructions of a model into a flat program of
+vectorized operations on NumPy arrays, and evaluates it for a whole batch of input values at once.
+Each input variable is given as an array of shape `(batch, size)`, with `size` the size of its
+`Alloc`, and the result holds the resolved arguments of every parametric `QuInstruct`.
+
+Callables are mapped to NumPy functions by name in `FUNCTIONS`. Functions for other callables
+are registered with `register_function`. Requires NumPy to be installed.
+"""
+
+from __future__ import annotations
+
+from numbers import Complex
+from typing import Any, Callable
+
+from .passes import allocate_slots
+from .types import Assign, Call, Load, Model, QuInstruct
+
+# Vectorized implementations of the callables, as functions or names of NumPy functions.
+FUNCTIONS: dict[str, Callable[..., Any] | str] = {
+    "add": "add",
+    "sub": "subtract",
+    "mul": "multiply",
+    "div": "true_divide",
+    "rem": "remainder",
+    "pow": "power",
+    "neg": "negative",
+    "abs": "abs",
+    "floor": "floor",
+    "sqrt": "sqrt",
+    "exp": "exp",
+    "log": "log",
+    "sin": "sin",
+    "cos": "cos",
+    "tan": "tan",
+    "arcsin": "arcsin",
+    "arccos": "arccos",
+    "arctan": "arctan",
+    "sinh": "sinh",
+    "cosh": "cosh",
+    "tanh": "tanh",
+}
+
+# Kinds of operands of the compiled program.
+_INPUT = 0
+_SLOT = 1
+_CONSTANT = 2
+
+
+def register_function(name: str, function: Callable[..., Any]) -> None:
+    """Registers the vectorized implementation of a callable.
+
+    Args:
+        name: The identifier of the callable, as used in `Call`.
+        function: A function of NumPy arrays of shape `(batch, size)`, broadcasting as the NumPy
+            universal functions.
+    """
+
+    FUNCTIONS[name] = function
+
+
+class Evaluator:
+    """Evaluates the arguments of the parametric quantum instructions of a `Model` in batches.
+
+    Only the assignments needed by the quantum instructions are compiled, and the temporary
+    variables share registers, as given by `passes.allocate_slots`, so that intermediate arrays
+    are released as soon as they are no longer used.
+
+    Args:
+        model: The model to evaluate.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+        ValueError: If the model calls a function without a registered implementation.
+
+    Example:
+
+    ```python
+    >>> evaluator = Evaluator(model)
+    >>> arguments = evaluator({"x": np.linspace(0, 1, 1000).reshape(-1, 1)})
+    >>> arguments[2]  # The arguments of `model.instructions[2]`, for the 1000 values of `x`.
+    (array([[0.], [0.002], ..., [2.]]),)
+    ```
+    """
+
+    __slots__ = ("model", "program", "num_slots", "_np")
+
+    def __init__(self, model: Model) -> None:
+        try:
+            import numpy as np
+        except ImportError as error:
+            raise ImportError("NumPy is required to evaluate models.") from error
+
+        self._np = np
+        self.model = model
+
+        instructions = _live(model.instructions)
+        slots = allocate_slots([instruction for _, instruction in instructions])
+        named: dict[str, int] = dict()
+        self.num_slots = max(slots.values(), default=-1) + 1
+
+        def operand(arg: Any) -> tuple[int, Any]:
+            if isinstance(arg, Load):
+                if arg.variable in slots:
+                    return _SLOT, slots[arg.variable]
+                if arg.variable in named:
+                    return _SLOT, named[arg.variable]
+                if arg.variable in model.inputs:
+                    return _INPUT, arg.variable
+                raise ValueError(f"Variable '{arg.variable}' is not assigned before use.")
+            return _CONSTANT, arg
+
+        # Steps `(function, slot, operands)` assign a slot, steps `(None, index, operands)` resolve
+        # the arguments of the quantum instruction at `index` in the model.
+        self.program: list[tuple[Callable[..., Any] | None, int, tuple[tuple[int, Any], ...]]] = []
+        for index, instruction in instructions:
+            if isinstance(instruction, QuInstruct):
+                self.program.append((None, index, tuple(map(operand, instruction.args))))
+                continue
+
+            value = instruction.value
+            if isinstance(value, Call):
+                function = self._function(value.identifier)
+                operands = tuple(map(operand, value.args))
+            else:
+                function = _identity
+                operands = (operand(value),)
+
+            if instruction.variable in slots:
+                slot = slots[instruction.variable]
+            else:
+                slot = named[instruction.variable] = self.num_slots
+                self.num_slots += 1
+            self.program.append((function, slot, operands))
+
+    def _function(self, name: str) -> Callable[..., Any]:
+        function = FUNCTIONS.get(name)
+        if isinstance(function, str):
+            return getattr(self._np, function)  # type: ignore[no-any-return]
+        if function is None:
+            raise ValueError(f"No vectorized implementation registered for '{name}'.")
+        return function
+
+    def __call__(
+        self, inputs: dict[str, Any], batch_size: int | None = None
+    ) -> dict[int, tuple[Any, ...]]:
+        """Evaluates the arguments of the parametric quantum instructions for a batch of inputs.
+
+        Args:
+            inputs: The values of the input variables of the model, as arrays of shape
+                `(batch, size)`. Arrays of shape `(batch,)` are accepted for variables of size 1.
+            batch_size: The size of the batch, required when the model has no input variables.
+
+        Returns:
+            A dictionary mapping the index of each parametric quantum instruction in
+            `model.instructions` to its arguments. Numeric arguments are arrays of shape
+            `(batch, size)`, other arguments are returned as they are.
+
+        Raises:
+            ValueError: If an input is missing or has the wrong shape.
+        """
+
+        np = self._np
+        arrays: dict[str, Any] = dict()
+        for name, alloc in self.model.inputs.items():
+            if name not in inputs:
+                raise ValueError(f"Missing value for the input variable '{name}'.")
+            array = np.asarray(inputs[name])
+            if array.ndim == 1 and alloc.size == 1:
+                array = array.reshape(-1, 1)
+            if array.ndim != 2 or array.shape[1] != alloc.size:
+                raise ValueError(
+                    f"Expected an array of shape (batch, {alloc.size}) for '{name}', "
+                    f"got {array.shape}."
+                )
+            if batch_size is None:
+                batch_size = array.shape[0]
+            elif array.shape[0] != batch_size:
+                raise ValueError(f"Expected a batch of {batch_size} values for '{name}'.")
+            arrays[name] = array
+
+        batch_size = 1 if batch_size is None else batch_size
+        registers: list[Any] = [None] * self.num_slots
+
+        def resolve(kind: int, ref: Any) -> Any:
+            if kind == _SLOT:
+                return registers[ref]
+            if kind == _INPUT:
+                return arrays[ref]
+            return ref
+
+        outputs: dict[int, tuple[Any, ...]] = dict()
+        for function, target, operands in self.program:
+            values = [resolve(kind, ref) for kind, ref in operands]
+            if function is not None:
+                registers[target] = function(*values)
+                continue
+
+            outputs[target] = tuple(_batched(np, value, batch_size) for value in values)
+
+        return outputs
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self.program)} steps, {self.num_slots} slots)"
+
+
+def _batched(np: Any, value: Any, batch_size: int) -> Any:
+    # Broadcasts numeric values to arrays of shape `(batch, size)`.
+    if isinstance(value, np.ndarray):
+        if value.ndim < 2:
+            value = value.reshape(1, -1)
+        return np.broadcast_to(value, (batch_size, value.shape[-1]))
+    if isinstance(value, Complex):
+        return np.full((batch_size, 1), value)
+    return value
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _live(instructions: list[QuInstruct | Assign]) -> list[tuple[int, QuInstruct | Assign]]:
+    # The parametric quantum instructions and the assignments they need, with their indices.
+    live: set[str] = set()
+    program: list[tuple[int, QuInstruct | Assign]] = []
+    for index in reversed(range(len(instructions))):
+        instruction = instructions[index]
+        if isinstance(instruction, QuInstruct):
+            if not instruction.args:
+                continue
+            args: tuple[Any, ...] = instruction.args
+        elif instruction.variable in live:
+            value = instruction.value
+            args = value.args if isinstance(value, Call) else (value,)
+        else:
+            continue
+        program.append((index, instruction))
+        live.update(arg.variable for arg in args if isinstance(arg, Load))
+    program.reverse()
+    return program
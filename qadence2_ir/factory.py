@@ -7,15 +7,36 @@ step of compilation, which is followed by a compilation from IR to the targeted
 
 from __future__ import annotations
 
-from typing import Callable
+import asyncio
+import os
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from itertools import islice
+from typing import Any, Awaitable, Callable, Generator, Iterable, Iterator
 
-from .factory_tools import build_instructions, extract_inputs_variables
-from .irast import InputType
-from .irbuilder import IRBuilder
-from .types import Model
+from .cache import CompileCache
+from .factory_tools import lower_ast
+from .irast import AST, Attributes, InputType
+from .irbuilder import AsyncIRBuilder, IRBuilder
+from .profiling import HOOKS, Recorder
+from .templates import ModelTemplate
+from .types import Alloc, AllocQubits, Assign, Model, QuInstruct
 
+Lowering = Callable[[AST], tuple[dict[str, Alloc], list[QuInstruct | Assign]]]
 
-def ir_compiler_factory(builder: IRBuilder[InputType]) -> Callable[[InputType], Model]:
+
+def ir_compiler_factory(
+    builder: IRBuilder[InputType],
+    cache: CompileCache | None = None,
+    lowering: Lowering = lower_ast,
+) -> Callable[[InputType], Model]:
     """Constructs an IR compiler function for a specific input type by using an `IRBuilder`.
 
     The factory function uses an `IRBuilder[InputType]` to create an IR compiler function that
@@ -25,20 +46,285 @@ def ir_compiler_factory(builder: IRBuilder[InputType]) -> Callable[[InputType],
     Args:
         builder: A concrete implementation of the generic class `IRBuilder` for a particular
             `InputType`.
+        cache: An optional `CompileCache`. When provided, the compiler returns the cached model
+            for ASTs that were already compiled with the same register, directives and settings.
+        lowering: The function converting the AST into the input allocations and instructions,
+            `lower_ast` by default. Use an `IncrementalLowering` to recompile edited circuits.
 
     Returns:
-        A function that compiles an `InputType` object to the Qadence-IR (`Model`).
+        A function that compiles an `InputType` object to the Qadence-IR (`Model`). While hooks are
+        registered in the `profiling` module, each stage of the compilation is measured.
     """
 
     def ir_compiler(input_obj: InputType) -> Model:
+        if HOOKS:
+            return _profiled_compile(builder, input_obj, cache, lowering)
+
         register = builder.set_register(input_obj)
         directives = builder.set_directives(input_obj)
         settings = builder.settings(input_obj)
 
         ast = builder.parse_sequence(input_obj)
-        input_variables = extract_inputs_variables(ast)
-        instructions = build_instructions(ast)
 
-        return Model(register, input_variables, instructions, directives, settings)
+        return _compile(ast, register, directives, settings, cache, lowering)
 
     return ir_compiler
+
+
+def ir_template_factory(
+    builder: IRBuilder[InputType],
+) -> Callable[[InputType], ModelTemplate]:
+    """Constructs a function compiling inputs into `ModelTemplate`s by using an `IRBuilder`.
+
+    The templates are compiled once, with the numeric values of the AST hoisted into a table of
+    constants, and bound to new values with `ModelTemplate.bind` without recompiling.
+
+    Args:
+        builder: A concrete implementation of the generic class `IRBuilder` for a particular
+            `InputType`.
+
+    Returns:
+        A function that compiles an `InputType` object to a `ModelTemplate`.
+    """
+
+    def ir_template_compiler(input_obj: InputType) -> ModelTemplate:
+        return ModelTemplate(
+            builder.parse_sequence(input_obj),
+            builder.set_register(input_obj),
+            builder.set_directives(input_obj),
+            builder.settings(input_obj),
+        )
+
+    return ir_template_compiler
+
+
+def async_ir_compiler_factory(
+    builder: AsyncIRBuilder[InputType],
+    executor: Executor | None = None,
+    cache: CompileCache | None = None,
+) -> Callable[[InputType], Awaitable[Model]]:
+    """Constructs an asynchronous IR compiler function by using an `AsyncIRBuilder`.
+
+    The compiler function awaits the four methods of the builder concurrently, then lowers the AST
+    in an executor, so that the event loop is not blocked while compiling large circuits. Only the
+    lowering runs in the executor, which can be a process pool: the cache is looked up and updated
+    in the calling process, in the event loop's default executor.
+
+    Args:
+        builder: A concrete implementation of the generic class `AsyncIRBuilder` for a particular
+            `InputType`.
+        executor: The executor used to lower the AST, by default the event loop's default
+            executor.
+        cache: An optional `CompileCache`, as in `ir_compiler_factory`.
+
+    Returns:
+        A coroutine function that compiles an `InputType` object to the Qadence-IR (`Model`).
+    """
+
+    async def ir_compiler(input_obj: InputType) -> Model:
+        register, directives, settings, ast = await asyncio.gather(
+            builder.set_register(input_obj),
+            builder.set_directives(input_obj),
+            builder.settings(input_obj),
+            builder.parse_sequence(input_obj),
+        )
+
+        loop = asyncio.get_running_loop()
+        if cache is not None:
+            key, model = await loop.run_in_executor(
+                None, _lookup, cache, ast, register, directives, settings
+            )
+            if model is not None:
+                return model
+
+        input_variables, instructions = await loop.run_in_executor(executor, lower_ast, ast)
+        model = Model(register, input_variables, instructions, directives, settings)
+        if cache is not None and key is not None:
+            await loop.run_in_executor(None, cache.put, key, model)
+        return model
+
+    return ir_compiler
+
+
+def ir_batch_compile(
+    builder: IRBuilder[InputType],
+    inputs: Iterable[InputType],
+    executor: str | Executor = "process",
+    max_workers: int | None = None,
+    chunksize: int = 1,
+    ordered: bool = True,
+    capture_errors: bool = False,
+) -> Generator[tuple[int, Model | Exception], None, None]:
+    """Compiles many inputs in parallel with the compiler function built from an `IRBuilder`.
+
+    The inputs are consumed lazily and sent to the workers in chunks, keeping a bounded number of
+    chunks in flight, so large or unbounded iterables can be compiled in constant memory. With a
+    process pool, the `builder` and the inputs must be picklable. A new pool is only started once
+    the results are iterated, and is shut down when they are exhausted or the generator is closed.
+
+    Args:
+        builder: A concrete implementation of the generic class `IRBuilder` for a particular
+            `InputType`.
+        inputs: The objects to compile.
+        executor: `"process"` or `"thread"` to compile in a new process or thread pool, or an
+            existing `Executor`, which is not shut down at the end.
+        max_workers: The number of workers of the new pool, by default the number of CPUs.
+        chunksize: The number of inputs compiled by a worker in a single task.
+        ordered: Yield the results in the order of the inputs. Otherwise, results are yielded as
+            soon as their chunk is compiled.
+        capture_errors: Yield the exception raised when compiling an input as its result, instead
+            of raising it and stopping the batch.
+
+    Returns:
+        A generator of tuples with the index of the input and the compiled `Model`, or the
+        exception raised when compiling it if `capture_errors` is set.
+
+    Raises:
+        ValueError: If `chunksize` is not positive or `executor` is unknown.
+    """
+
+    if chunksize < 1:
+        raise ValueError("The chunk size must be a positive integer.")
+    if not isinstance(executor, Executor) and executor not in ("process", "thread"):
+        raise ValueError(f"Unknown executor '{executor}', expected 'process' or 'thread'.")
+
+    return _batch_results(
+        builder, inputs, executor, max_workers, chunksize, ordered, capture_errors
+    )
+
+
+def _batch_results(
+    builder: IRBuilder[InputType],
+    inputs: Iterable[InputType],
+    executor: str | Executor,
+    max_workers: int | None,
+    chunksize: int,
+    ordered: bool,
+    capture_errors: bool,
+) -> Generator[tuple[int, Model | Exception], None, None]:
+    # The pool is created on the first iteration, and shut down when the iteration ends or the
+    # generator is closed, so that an iterator that is never consumed does not hold workers.
+    pool: Executor
+    if isinstance(executor, Executor):
+        pool, owned = executor, False
+    elif executor == "process":
+        pool, owned = ProcessPoolExecutor(max_workers), True
+    else:
+        pool, owned = ThreadPoolExecutor(max_workers), True
+
+    in_flight = 2 * (max_workers or os.cpu_count() or 1)
+    chunks = _chunks(enumerate(inputs), chunksize)
+    pending: deque[Future[list[tuple[int, Any]]]] = deque()
+
+    def submit() -> bool:
+        chunk = next(chunks, None)
+        if chunk is None:
+            return False
+        pending.append(pool.submit(_compile_chunk, builder, chunk, capture_errors))
+        return True
+
+    try:
+        while len(pending) < in_flight and submit():
+            pass
+
+        while pending:
+            if ordered:
+                future = pending.popleft()
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                future = next(f for f in pending if f in done)
+                pending.remove(future)
+
+            submit()
+            yield from future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        if owned:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _compile(
+    ast: AST,
+    register: AllocQubits,
+    directives: Attributes,
+    settings: Attributes,
+    cache: CompileCache | None,
+    lowering: Lowering = lower_ast,
+) -> Model:
+    if cache is None:
+        input_variables, instructions = lowering(ast)
+        return Model(register, input_variables, instructions, directives, settings)
+
+    key, model = _lookup(cache, ast, register, directives, settings)
+    if model is None:
+        input_variables, instructions = lowering(ast)
+        model = Model(register, input_variables, instructions, directives, settings)
+        if key is not None:
+            cache.put(key, model)
+
+    return model
+
+
+def _lookup(
+    cache: CompileCache,
+    ast: AST,
+    register: AllocQubits,
+    directives: Attributes,
+    settings: Attributes,
+) -> tuple[str | None, Model | None]:
+    # Returns the key of the compilation and the cached model, if any.
+    try:
+        key = cache.key(ast, register, directives, settings)
+    except TypeError:
+        # Inputs holding values that cannot be fingerprinted are compiled without cache.
+        return None, None
+    return key, cache.get(key)
+
+
+def _profiled_compile(
+    builder: IRBuilder[InputType],
+    input_obj: InputType,
+    cache: CompileCache | None,
+    lowering: Lowering,
+) -> Model:
+    recorder = Recorder()
+    try:
+        register = recorder.run("set_register", builder.set_register, input_obj)
+        directives = recorder.run("set_directives", builder.set_directives, input_obj)
+        settings = recorder.run("settings", builder.settings, input_obj)
+
+        ast = recorder.run("parse_sequence", builder.parse_sequence, input_obj)
+
+        model: Model = recorder.run(
+            "lower", _compile, ast, register, directives, settings, cache, lowering
+        )
+    finally:
+        recorder.stop()
+
+    recorder.finish(ast, model)
+    return model
+
+
+def _chunks(items: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _compile_chunk(
+    builder: IRBuilder[InputType],
+    chunk: list[tuple[int, InputType]],
+    capture_errors: bool,
+) -> list[tuple[int, Model | Exception]]:
+    # Module-level function, so that it can be sent to the workers of a process pool.
+    ir_compiler = ir_compiler_factory(builder)
+    results: list[tuple[int, Model | Exception]] = []
+    for index, input_obj in chunk:
+        try:
+            results.append((index, ir_compiler(input_obj)))
+        except Exception as error:
+            if not capture_errors:
+                raise
+            results.append((index, error))
+    return results
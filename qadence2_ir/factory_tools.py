@@ -6,12 +6,18 @@ tools the factory function in `qadence2-ir.factory` can build the instruction li
 
 from __future__ import annotations
 
+from contextvars import ContextVar
 from functools import reduce
-from typing import Callable, Iterable
+from typing import Any, Callable, Iterable
 
 from .irast import AST
+from .traversal import walk_filtered, walk_postorder
 from .types import Alloc, Assign, Call, Load, QuInstruct, Support
 
+# The counters of the memoisation of `Call` nodes, `[hits, misses]`, incremented by `lower_ast`
+# while a compilation is profiled.
+MEMO_COUNTERS: ContextVar[list[int] | None] = ContextVar("memo_counters", default=None)
+
 
 def filter_ast(predicate: Callable[[AST], bool], ast: AST) -> Iterable[AST]:
     """Filters the elements of the AST according to the `predicate` function.
@@ -32,14 +38,7 @@ def filter_ast(predicate: Callable[[AST], bool], ast: AST) -> Iterable[AST]:
     ```
     """
 
-    if predicate(ast):
-        yield ast
-
-    else:
-        for arg in ast.args:
-            if isinstance(arg, AST):
-                for term in filter_ast(predicate, arg):
-                    yield term
+    return walk_filtered(predicate, ast)
 
 
 def flatten_ast(ast: AST) -> Iterable[AST]:
@@ -66,12 +65,7 @@ def flatten_ast(ast: AST) -> Iterable[AST]:
     """
     # TODO update example because binar_op is not supported
 
-    for arg in ast.args:
-        if isinstance(arg, AST):
-            for term in flatten_ast(arg):
-                yield term
-
-    yield ast
+    return walk_postorder(ast)
 
 
 def extract_inputs_variables(ast: AST) -> dict[str, Alloc]:
@@ -124,12 +118,103 @@ def build_instructions(ast: AST) -> list[QuInstruct | Assign]:
         parametric quantum operations.
     """
 
-    instructions, _, _ = reduce(  # type: ignore
-        lambda acc, x: to_instruct(x, *acc), flatten_ast(ast), ([], dict(), 0)  # type: ignore
-    )
+    _, instructions = lower_ast(ast)
     return instructions
 
 
+def lower_ast(ast: AST) -> tuple[dict[str, Alloc], list[QuInstruct | Assign]]:
+    """Converts an AST into the input allocations and the list of `Model` instructions.
+
+    The AST is lowered in a single post-order traversal that collects the input variables and
+    emits the instructions at once, producing the same results as `extract_inputs_variables` and
+    `build_instructions`. Repeated references to an already lowered subtree are not visited again,
+    which covers all repetitions of structurally equal subtrees when using `AST.interning()`.
+
+    Args:
+        ast: A parsed tree containing the sequence of instructions to be added to the `Model`.
+
+    Returns:
+        A tuple with the dictionary of input variables allocations, indexed by the variables names,
+        and the list of quantum operations and temporary static single-assigned variables.
+    """
+
+    inputs, instructions, _ = _lower_ast(ast)
+    return inputs, instructions
+
+
+def _lower_ast(ast: AST) -> tuple[dict[str, Alloc], list[QuInstruct | Assign], list[AST]]:
+    # Also returns the `Call` nodes assigned to the temporary variables `%0` to `%n`, in order.
+    inputs: dict[str, Alloc] = dict()
+    instructions: list[QuInstruct | Assign] = []
+    calls: list[AST] = []
+    memoise: dict[AST, Load] = dict()
+    single_assign_index = 0
+    # Identity of the nodes already lowered, their subtrees don't need to be visited again. This
+    # avoids hashing a subtree before its arguments have their hashes cached.
+    lowered: set[int] = set()
+
+    Tag = AST.Tag
+    leaves = (Tag.Numeric, Tag.Support)
+    memoised = (Tag.Call, Tag.InputVariable)
+
+    # References to `Call` nodes reusing the temporary variable of an already lowered call.
+    hits = 0
+
+    stack = [(ast, iter(ast.args))]
+    while stack:
+        node, node_args = stack[-1]
+        for arg in node_args:
+            if isinstance(arg, AST) and arg.tag not in leaves:
+                if id(arg) not in lowered:
+                    stack.append((arg, iter(arg.args)))
+                    break
+                hits += arg.tag is Tag.Call
+        else:
+            stack.pop()
+            tag = node.tag
+
+            if tag in memoised:
+                lowered.add(id(node))
+                if node in memoise:
+                    hits += tag is Tag.Call
+                    continue
+
+                if tag is Tag.InputVariable:
+                    memoise[node] = Load(node.head)
+                    if node.head not in inputs:
+                        inputs[node.head] = Alloc(node.args[0], node.args[1], **node.attrs)
+                    continue
+
+            elif tag is not Tag.QuantumOperator:
+                continue
+
+            args: list[Any] = []
+            for arg in node.args:
+                if isinstance(arg, AST):
+                    if arg.tag is Tag.Numeric:
+                        args.append(arg.args[0])
+                    elif arg.tag is Tag.Support:
+                        args.append(Support(target=arg.args[0], control=arg.args[1]))
+                    else:
+                        args.append(memoise[arg])
+
+            if tag is Tag.Call:
+                label = f"%{single_assign_index}"
+                instructions.append(Assign(label, Call(node.head, *args)))
+                memoise[node] = Load(label)
+                calls.append(node)
+                single_assign_index += 1
+            else:
+                instructions.append(QuInstruct(node.head, *args, **node.attrs))
+
+    counters = MEMO_COUNTERS.get()
+    if counters is not None:
+        counters[0] += hits
+        counters[1] += single_assign_index
+
+    return inputs, instructions, calls
+
+
 def to_instruct(
     ast: AST,
     instructions_list: list[QuInstruct | Assign],
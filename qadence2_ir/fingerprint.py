@@ -0,0 +1,303 @@
+"""Deterministic structural fingerprints for `AST` nodes, `Model` objects and IR values.
+
+Python's `hash` is salted per process and cannot be stored or compared between workers. The
+fingerprints defined in this module are SHA-256 digests of a canonical encoding of the values,
+stable across processes, platforms and runs. They follow the equality semantics of the IR types:
+equal objects have the same fingerprint. In particular, numbers are compared by value
+(`AST.numeric(2) == AST.numeric(2.0)`), and the operands of `add` and `mul` nodes are treated as a
+set, as in `AST.__eq__`.
+
+The fingerprint of an `AST` is computed as a Merkle tree: the digest of a node combines the digests
+of its arguments. Digests are cached in the nodes, so fingerprinting a tree that shares subtrees
+with an already fingerprinted one only processes the new nodes.
+
+Likewise, the fingerprint of a `Model` combines the digests of its instructions, cached in each
+`QuInstruct` and `Assign`, so fingerprinting a model again only encodes the new instructions.
+Instructions are treated as immutable values once fingerprinted: replace them in the
+list instead of modifying their fields.
+
+Equal ASTs can still be lowered to different instructions, e.g. `AST.add(x, AST.numeric(1))` and
+`AST.add(AST.numeric(1.0), x)`. `ast_key` identifies an AST exactly instead, keeping the order of
+the operands and the types of the numbers, to key the results of the lowering.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from numbers import Complex, Integral, Real
+from typing import Any
+
+from .irast import AST
+from .types import Alloc, AllocQubits, Assign, Call, Load, Model, QuInstruct, Support
+
+
+def fingerprint(value: Any) -> str:
+    """Returns the structural fingerprint of an IR value as a hexadecimal string.
+
+    Args:
+        value: An `AST`, a `Model`, an IR instruction or any built-in value.
+
+    Returns:
+        The hexadecimal SHA-256 digest of the canonical encoding of the `value`.
+
+    Raises:
+        TypeError: If the value contains an object of an unsupported type.
+    """
+
+    return digest(value).hex()
+
+
+def digest(value: Any) -> bytes:
+    """Returns the structural fingerprint of an IR value as raw bytes.
+
+    Args:
+        value: An `AST`, a `Model`, an IR instruction or any built-in value.
+
+    Returns:
+        The SHA-256 digest of the canonical encoding of the `value`.
+
+    Raises:
+        TypeError: If the value contains an object of an unsupported type.
+    """
+
+    if isinstance(value, AST):
+        return ast_digest(value)
+    return hashlib.sha256(encode(value)).digest()
+
+
+def ast_digest(ast: AST) -> bytes:
+    """Returns the Merkle digest of an AST, computing and caching the digests of its nodes.
+
+    The tree is traversed iteratively, and the subtrees with a cached digest are not visited.
+
+    Args:
+        ast: The AST to fingerprint.
+
+    Returns:
+        The SHA-256 digest of the AST.
+
+    Raises:
+        TypeError: If the value contains an object of an unsupported type.
+    """
+
+    if ast._digest is not None:
+        return ast._digest
+
+    stack = [(ast, iter(ast.args))]
+    while stack:
+        node, args = stack[-1]
+        for arg in args:
+            if isinstance(arg, AST) and arg._digest is None:
+                stack.append((arg, iter(arg.args)))
+                break
+        else:
+            stack.pop()
+            node._digest = _node_digest(node)
+
+    return ast._digest  # type: ignore[return-value]
+
+
+def ast_key(ast: AST) -> bytes:
+    """Returns a digest identifying an AST exactly, as needed to key the results of its lowering.
+
+    ASTs with the same key are lowered to the same instructions. Unlike `ast_digest`, the operands
+    of `add` and `mul` nodes are kept in order, and numbers of different types, like `1` and `1.0`,
+    are told apart. The key is not cached in the nodes, but shared subtrees are encoded once.
+
+    Args:
+        ast: The AST to identify.
+
+    Returns:
+        The SHA-256 digest of the exact encoding of the AST.
+
+    Raises:
+        TypeError: If the value contains an object of an unsupported type.
+    """
+
+    keys: dict[int, bytes] = dict()
+    stack = [(ast, iter(ast.args))]
+    while stack:
+        node, args = stack[-1]
+        for arg in args:
+            if isinstance(arg, AST) and id(arg) not in keys:
+                stack.append((arg, iter(arg.args)))
+                break
+        else:
+            stack.pop()
+            frame = _frame(
+                b"A",
+                encode(node.tag.name),
+                encode(node.head),
+                *(
+                    _frame(b"T", keys[id(arg)]) if isinstance(arg, AST) else _exact(arg)
+                    for arg in node.args
+                ),
+                _exact(node.attrs),
+            )
+            keys[id(node)] = hashlib.sha256(frame).digest()
+
+    return keys[id(ast)]
+
+
+def instruction_digest(instruction: QuInstruct | Assign) -> bytes:
+    """Returns the digest of an instruction, computing and caching it in the instruction.
+
+    Args:
+        instruction: The instruction to fingerprint.
+
+    Returns:
+        The SHA-256 digest of the instruction.
+    """
+
+    if instruction._digest is None:
+        instruction._digest = hashlib.sha256(encode(instruction)).digest()
+    return instruction._digest
+
+
+def instructions_digest(model: Model) -> bytes:
+    """Returns the digest of the instructions of a model.
+
+    The digest combines the cached digests of the instructions, so only the instructions without
+    a cached digest, like the ones added since the last call, are encoded. Unlike `Model.__eq__`,
+    the digests do not reflect the instructions modified in place since they were fingerprinted.
+
+    Args:
+        model: The model whose instructions to fingerprint.
+
+    Returns:
+        The SHA-256 digest of the list of instructions.
+    """
+
+    combined = hashlib.sha256(b"I")
+    for instruction in model.instructions:
+        combined.update(instruction_digest(instruction))
+    return combined.digest()
+
+
+def _node_digest(node: AST) -> bytes:
+    args = [encode(arg) for arg in node.args]
+    if node.is_addition or node.is_multiplication:
+        args = sorted(set(args))
+
+    frame = _frame(b"A", encode(node.tag.name), encode(node.head), *args, encode(node.attrs))
+    return hashlib.sha256(frame).digest()
+
+
+def encode(value: Any) -> bytes:
+    """Returns the canonical binary encoding of a value, used to compute its fingerprint.
+
+    Every encoded value is framed by a type tag and its length, so that the concatenation of
+    encodings is unambiguous. Values of other types than the built-in and IR types are rejected,
+    as their `repr` does not identify them.
+
+    Args:
+        value: An `AST`, a `Model`, an IR instruction or any built-in value.
+
+    Returns:
+        The canonical encoding of the `value`.
+
+    Raises:
+        TypeError: If the value contains an object of an unsupported type.
+    """
+
+    if value is None:
+        return b"N0:"
+    if isinstance(value, str):
+        return _frame(b"S", value.encode())
+    if isinstance(value, (int, float)):
+        return _number(value)
+    if isinstance(value, (bytes, bytearray)):
+        return _frame(b"B", bytes(value))
+    if isinstance(value, AST):
+        return _frame(b"T", ast_digest(value))
+    if isinstance(value, tuple):
+        return _frame(b"t", *map(encode, value))
+    if isinstance(value, list):
+        return _frame(b"l", *map(encode, value))
+    if isinstance(value, dict):
+        return _frame(b"d", *sorted(_frame(b"p", encode(k), encode(v)) for k, v in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return _frame(b"s", *sorted(map(encode, value)))
+    if isinstance(value, Load):
+        return _frame(b"Load", encode(value.variable))
+    if isinstance(value, Call):
+        return _frame(b"Call", encode(value.identifier), encode(value.args))
+    if isinstance(value, Support):
+        return _frame(b"Support", encode(value.target), encode(value.control))
+    if isinstance(value, Assign):
+        return _frame(b"Assign", encode(value.variable), encode(value.value))
+    if isinstance(value, QuInstruct):
+        return _frame(
+            b"QuInstruct",
+            encode(value.name),
+            encode(value.support),
+            encode(value.args),
+            encode(value.attrs),
+        )
+    if isinstance(value, Alloc):
+        return _frame(b"Alloc", encode(value.size), encode(value.is_trainable), encode(value.attrs))
+    if isinstance(value, AllocQubits):
+        # Only the fields compared by `AllocQubits.__eq__` are part of the fingerprint.
+        return _frame(
+            b"AllocQubits",
+            encode(value.num_qubits),
+            encode(value.qubit_positions),
+            encode(value.grid_type),
+            encode(value.grid_scale),
+            encode(value.options),
+        )
+    if isinstance(value, Model):
+        return _frame(
+            b"Model",
+            encode(value.register),
+            encode(value.inputs),
+            _frame(b"I", instructions_digest(value)),
+            encode(value.directives),
+            encode(value.settings),
+        )
+    # Checked last, as `Complex` is an abstract class, slower to test against.
+    if isinstance(value, Complex):
+        return _number(value)
+
+    raise TypeError(f"Cannot fingerprint a value of type {type(value).__name__}.")
+
+
+def _number(value: Complex | float) -> bytes:
+    # Equal numbers of different types share the same encoding, e.g. 1, 1.0, 1+0j and True.
+    if isinstance(value, (int, Integral)):
+        return _frame(b"i", str(int(value)).encode())
+    if isinstance(value, (float, Real)):
+        real = float(value)
+    else:
+        number = complex(value)
+        if number.imag != 0:
+            return _frame(b"c", _number(number.real), _number(number.imag))
+        real = number.real
+
+    if real.is_integer():
+        return _frame(b"i", str(int(real)).encode())
+    return _frame(b"f", repr(real).encode())
+
+
+def _exact(value: Any) -> bytes:
+    # As `encode`, but tagging the numbers with their type, as in `1` and `1.0`.
+    if isinstance(value, (str, bytes, bytearray)) or value is None:
+        return encode(value)
+    if isinstance(value, AST):
+        return _frame(b"T", ast_key(value))
+    if isinstance(value, tuple):
+        return _frame(b"t", *map(_exact, value))
+    if isinstance(value, list):
+        return _frame(b"l", *map(_exact, value))
+    if isinstance(value, dict):
+        return _frame(b"d", *sorted(_frame(b"p", _exact(k), _exact(v)) for k, v in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return _frame(b"s", *sorted(map(_exact, value)))
+    if isinstance(value, Complex):
+        return _frame(b"n", type(value).__qualname__.encode(), repr(value).encode())
+    return encode(value)
+
+
+def _frame(tag: bytes, *payload: bytes) -> bytes:
+    content = b"".join(payload)
+    return b"%s%d:%s" % (tag, len(content), content)
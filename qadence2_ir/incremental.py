@@ -0,0 +1,163 @@
+"""Incremental lowering of an `AST` that is compiled repeatedly with local changes.
+
+`IncrementalLowering` is a drop-in replacement for `lower_ast` that keeps the instructions lowered
+from each element of the top-level `AST.sequence`, keyed by the exact fingerprint of the element,
+`fingerprint.ast_key`. Elements that are equal but lowered differently, like `add(x, 1)` and
+`add(1.0, x)`, have different slices. When the AST is lowered again after an edit, only the
+elements that changed are lowered; the other slices of instructions are spliced from the cache.
+
+Splicing renames the temporary variables of every slice to follow the numbering of the whole
+circuit, and removes the assignments already made by an earlier slice, so the result is equal to
+lowering the whole AST with `lower_ast`. The instructions and allocations returned are copies, so
+that the models compiled from the same slices do not share mutable objects.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from .cache import _copy_value
+from .factory_tools import _lower_ast
+from .fingerprint import ast_key
+from .irast import AST
+from .types import Alloc, Assign, Call, Load, QuInstruct, Support
+
+
+class _Slice:
+    """Instructions lowered from one element of the top-level sequence, with local labels."""
+
+    __slots__ = ("inputs", "instructions", "calls")
+
+    def __init__(
+        self,
+        inputs: dict[str, Alloc],
+        instructions: list[QuInstruct | Assign],
+        calls: list[AST],
+    ) -> None:
+        self.inputs = inputs
+        self.instructions = instructions
+        self.calls = calls
+
+
+class IncrementalLowering:
+    """Lowers ASTs reusing the instructions of the unchanged elements of the last lowered AST.
+
+    An instance is a callable with the same signature as `lower_ast`, and can be passed as the
+    `lowering` argument of `ir_compiler_factory`. It keeps the slices of the last lowered AST
+    only, so the memory used is proportional to the size of the last compiled circuit.
+
+    Example:
+
+    ```python
+    >>> lowering = IncrementalLowering()
+    >>> inputs, instructions = lowering(ast)
+    >>> inputs, instructions = lowering(edited_ast)  # Only the edited elements are lowered.
+    >>> lowering.hits, lowering.misses
+    ```
+    """
+
+    __slots__ = ("hits", "misses", "_slices", "_keys")
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._slices: dict[bytes, _Slice] = dict()
+        # The keys of the elements of the last lowered AST, by identity, with the element kept
+        # alive so that its identity is not reused.
+        self._keys: dict[int, tuple[AST, bytes]] = dict()
+
+    def __call__(self, ast: AST) -> tuple[dict[str, Alloc], list[QuInstruct | Assign]]:
+        """Converts an AST into the input allocations and the list of `Model` instructions.
+
+        Args:
+            ast: A parsed tree containing the sequence of instructions to be added to the `Model`.
+
+        Returns:
+            A tuple with the dictionary of input variables allocations, indexed by the variables
+            names, and the list of quantum operations and temporary static single-assigned
+            variables, equal to the result of `lower_ast(ast)`.
+        """
+
+        elements = ast.args if ast.is_sequence else (ast,)
+        slices: dict[bytes, _Slice] = dict()
+        keys: dict[int, tuple[AST, bytes]] = dict()
+        inputs: dict[str, Alloc] = dict()
+        instructions: list[QuInstruct | Assign] = []
+        memoise: dict[AST, Load] = dict()
+
+        for element in elements:
+            known = keys.get(id(element)) or self._keys.get(id(element))
+            key = known[1] if known is not None and known[0] is element else ast_key(element)
+            keys[id(element)] = (element, key)
+
+            slice_ = slices.get(key) or self._slices.get(key)
+            if slice_ is None:
+                self.misses += 1
+                slice_ = _Slice(*_lower_ast(element))
+            else:
+                self.hits += 1
+            slices[key] = slice_
+
+            for name, alloc in slice_.inputs.items():
+                if name not in inputs:
+                    inputs[name] = _copy_value(alloc)
+            _splice(slice_, instructions, memoise)
+
+        self._slices, self._keys = slices, keys
+        return inputs, instructions
+
+    def clear(self) -> None:
+        """Removes the cached slices and resets the counters."""
+
+        self._slices.clear()
+        self._keys.clear()
+        self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._slices)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(slices={len(self)}, hits={self.hits}, "
+            f"misses={self.misses})"
+        )
+
+
+def _splice(
+    slice_: _Slice, instructions: list[QuInstruct | Assign], memoise: dict[AST, Load]
+) -> None:
+    labels: dict[str, str] = dict()
+    removed: set[str] = set()
+    for index, call in enumerate(slice_.calls):
+        local = f"%{index}"
+        if call in memoise:
+            labels[local] = memoise[call].variable
+            removed.add(local)
+        else:
+            memoise[call] = Load(f"%{len(memoise)}")
+            labels[local] = memoise[call].variable
+
+    # The instructions are rebuilt with their temporary variables renamed, copying their values so
+    # that they are not shared with the instructions returned for other ASTs.
+    def rename(arg: Any) -> Any:
+        if isinstance(arg, Load):
+            return Load(labels.get(arg.variable, arg.variable))
+        return _copy_value(arg)
+
+    append = instructions.append
+    for instruction in slice_.instructions:
+        if isinstance(instruction, QuInstruct):
+            support = instruction.support
+            append(
+                QuInstruct(
+                    instruction.name,
+                    Support(support.target, support.control),
+                    *map(rename, instruction.args),
+                    **_copy_value(instruction.attrs),
+                )
+            )
+        elif instruction.variable not in removed:
+            call = instruction.value
+            append(
+                Assign(labels[instruction.variable], Call(call.identifier, *map(rename, call.args)))
+            )
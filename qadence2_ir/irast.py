@@ -8,13 +8,19 @@ can be used to manipulate an `AST` instance and build valid IR instructions from
 
 from __future__ import annotations
 
+from contextlib import contextmanager
+from contextvars import ContextVar
 from enum import Flag, auto
-from typing import Any, TypeVar
+from typing import Any, ClassVar, Iterable, Iterator, TypeVar
+from weakref import WeakValueDictionary
 
 InputType = TypeVar("InputType")
 Arguments = tuple[Any, ...]
 Attributes = dict[str, Any]
 
+# Whether the AST constructors intern the nodes, local to each thread and asynchronous task.
+_INTERNING: ContextVar[bool] = ContextVar("interning", default=False)
+
 
 class AST:
     """Represents an instruction sequence as an abstract syntax tree (AST).
@@ -35,6 +41,9 @@ class AST:
     - AST.div(lhs, rhs): For division, lhs / rhs.
     - AST.rem(lhs, rhs): For remainder, lhs % rhs.
     - AST.pow(base, power): For power, base ** power.
+
+    Inside the `AST.interning()` context, the constructors return hash-consed nodes: structurally
+    equal nodes are the same object and their hash is computed once at construction.
     """
 
     class Tag(Flag):
@@ -45,10 +54,26 @@ class AST:
         InputVariable = auto()
         Numeric = auto()
 
+    __slots__ = (
+        "_tag",
+        "_head",
+        "_args",
+        "_attrs",
+        "_hash",
+        "_digest",
+        "_interned",
+        "__weakref__",
+    )
+
     _tag: Tag
     _head: str
     _args: tuple[Any, ...]
     _attrs: dict[Any, Any]
+    _hash: int | None
+    _digest: bytes | None  # Cached structural fingerprint, see `qadence2-ir.fingerprint`.
+    _interned: bool
+
+    _intern_table: ClassVar[WeakValueDictionary[Any, AST]] = WeakValueDictionary()
 
     @property
     def tag(self) -> Tag:
@@ -91,8 +116,63 @@ class AST:
         token._head = head
         token._args = args
         token._attrs = attrs
+        token._hash = None
+        token._digest = None
+        token._interned = False
+
+        if not _INTERNING.get():
+            return token
+
+        try:
+            keys = tuple(map(_intern_key, args))
+            attr_keys = frozenset((name, _intern_key(value)) for name, value in attrs.items())
+            if token.is_addition or token.is_multiplication:
+                key: tuple[Any, ...] = (tag, head, frozenset(keys), attr_keys)
+            else:
+                key = (tag, head, keys, attr_keys)
+            interned = cls._intern_table.get(key)
+        except TypeError:
+            # Nodes holding unhashable arguments or attributes cannot be interned.
+            return token
+
+        if interned is not None:
+            return interned
+
+        token._hash = token.__hash__()
+        token._interned = True
+        cls._intern_table[key] = token
         return token
 
+    @classmethod
+    @contextmanager
+    def interning(cls, enabled: bool = True) -> Iterator[None]:
+        """Context manager to enable (or disable) hash-consing of the AST constructors.
+
+        While interning is enabled, constructing a node structurally equal to a living interned
+        node returns the existing object. Interned nodes have their hash computed once, at
+        construction, so memoisation lookups and equality checks between them run in O(1).
+        Nodes with unhashable arguments or attributes are constructed as regular nodes. Values of
+        different types, like `1` and `1.0`, are interned as different nodes. Interning is local to
+        the current thread or asynchronous task.
+
+        Args:
+            enabled: Whether the constructors should intern the nodes within the context.
+
+        Example:
+
+        ```python
+        >>> with AST.interning():
+        ...     AST.numeric(2) is AST.numeric(2)
+        True
+        ```
+        """
+
+        token = _INTERNING.set(enabled)
+        try:
+            yield
+        finally:
+            _INTERNING.reset(token)
+
     @classmethod
     def numeric(cls, value: complex | float) -> AST:
         """Create an AST-numeric object.
@@ -329,23 +409,73 @@ class AST:
     def is_sequence(self) -> bool:
         return self._tag == AST.Tag.Sequence
 
-    def __hash__(self) -> int:
-        if self.is_addition or self.is_multiplication:
-            return hash((self._tag, self._head, frozenset(self._args)))
+    @property
+    def is_interned(self) -> bool:
+        return self._interned
 
-        return hash((self._tag, self._head, self._args))
+    def __hash__(self) -> int:
+        if self._hash is not None:
+            return self._hash
+
+        # The hashes of the subtrees are computed bottom-up, without recursion, so that deep trees
+        # do not exceed the recursion limit.
+        stack = [(self, iter(self._args))]
+        while stack:
+            node, args = stack[-1]
+            for arg in args:
+                if isinstance(arg, AST) and arg._hash is None:
+                    stack.append((arg, iter(arg._args)))
+                    break
+            else:
+                stack.pop()
+                if node.is_addition or node.is_multiplication:
+                    node._hash = hash((node._tag, node._head, frozenset(node._args)))
+                else:
+                    node._hash = hash((node._tag, node._head, node._args))
+
+        return self._hash  # type: ignore[return-value]
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, AST):
             return NotImplemented
 
-        if self._tag != other._tag or self._head != other._head:
-            return False
-
-        if self.is_addition or self.is_multiplication:
-            return set(self._args) == set(other._args) and self._attrs == other._attrs
-
-        return self._args == other._args and self._attrs == other._attrs
+        # The pairs of subtrees still to compare, visited without recursion.
+        stack = [(self, other)]
+        while stack:
+            lhs, rhs = stack.pop()
+            if lhs is rhs:
+                continue
+
+            # Equal nodes have equal hashes, so nodes with different cached hashes, like different
+            # interned nodes, are told apart without comparing their subtrees.
+            if lhs._hash is not None and rhs._hash is not None and lhs._hash != rhs._hash:
+                return False
+
+            if lhs._tag != rhs._tag or lhs._head != rhs._head or lhs._attrs != rhs._attrs:
+                return False
+
+            args: Iterable[tuple[Any, Any]]
+            if lhs._tag == AST.Tag.Call and lhs._head in ("add", "mul"):
+                matched = _match_operands(lhs._args, rhs._args)
+                if matched is None:
+                    return False
+                args = matched
+            elif len(lhs._args) == len(rhs._args):
+                args = zip(lhs._args, rhs._args)
+            else:
+                return False
+
+            for left, right in args:
+                if isinstance(left, AST) and isinstance(right, AST):
+                    stack.append((left, right))
+                elif left != right:
+                    return False
+
+        return True
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Rebuild copies through the constructor so they are (re-)interned consistently.
+        return _rebuild, (self.__class__, self._tag, self._head, self._args, self._attrs)
 
     def __repr__(self) -> str:
         result = f"{self._tag}('{self._head}', "
@@ -354,3 +484,42 @@ class AST:
             result += ", "
             result += ", ".join([f"{key}={repr(val)}" for key, val in self._attrs.items()])
         return result + ")"
+
+
+def _match_operands(lhs: Arguments, rhs: Arguments) -> list[tuple[Any, Any]] | None:
+    # Pairs the operands of commutative nodes, compared as sets, by their hashes. Returns `None` if
+    # the sets differ. Operands sharing a hash, like repeated operands, are compared as sets.
+    lhs_hashes = [hash(arg) for arg in lhs]
+    rhs_hashes = [hash(arg) for arg in rhs]
+    if lhs_hashes == rhs_hashes and len(set(lhs_hashes)) == len(lhs_hashes):
+        return list(zip(lhs, rhs))
+
+    lhs_groups: dict[int, list[Any]] = dict()
+    rhs_groups: dict[int, list[Any]] = dict()
+    for args, hashes, groups in ((lhs, lhs_hashes, lhs_groups), (rhs, rhs_hashes, rhs_groups)):
+        for arg, key in zip(args, hashes):
+            groups.setdefault(key, []).append(arg)
+
+    if lhs_groups.keys() != rhs_groups.keys():
+        return None
+
+    pairs = []
+    for key, group in lhs_groups.items():
+        other = rhs_groups[key]
+        if len(group) == 1 and len(other) == 1:
+            pairs.append((group[0], other[0]))
+        elif set(group) != set(other):
+            return None
+    return pairs
+
+
+def _intern_key(value: Any) -> tuple[Any, ...]:
+    # Interned nodes are keyed by identity, other values by type and value, so that equal values of
+    # different types, e.g. `1` and `1.0`, are not merged.
+    if isinstance(value, AST) and value._interned:
+        return (AST, id(value))
+    return (type(value), value)
+
+
+def _rebuild(cls: type[AST], tag: AST.Tag, head: str, args: Arguments, attrs: Attributes) -> AST:
+    return cls.__construct__(tag, head, *args, **attrs)
@@ -3,7 +3,8 @@
 This module defines the interface to be used by Qadence 2 IR front-ends to compile to IR. A front-
 end must implement an `IRBuilder` for the front-end specific input type, so that
 `ir_compiler_factory`, defined in `qadence2-ir.factory` can generate a compiler function specific
-to the front-end.
+to the front-end. Front-ends whose builder steps are I/O-bound can implement an `AsyncIRBuilder`
+instead, to be used with `async_ir_compiler_factory`.
 """
 
 from __future__ import annotations
@@ -74,3 +75,61 @@ class IRBuilder(ABC, Generic[InputType]):
         Returns:
             An AST definition that represents the operations defined in an `input_obj`.
         """
+
+
+class AsyncIRBuilder(ABC, Generic[InputType]):
+    """Defines the interface of asynchronous Qadence 2 IR builders.
+
+    The asynchronous counterpart of `IRBuilder`, for front-ends that need to await I/O, e.g. to
+    fetch subcircuit definitions or calibration data, while building IR code. An `AsyncIRBuilder`
+    implementation can be used by the `async_ir_compiler_factory` function, defined in
+    `qadence2-ir.factory`, which runs the four methods concurrently.
+    """
+
+    @staticmethod
+    @abstractmethod
+    async def set_register(input_obj: InputType) -> AllocQubits:
+        """Returns a register definition based on an input object.
+
+        Args:
+            input_obj: Input for the compilation to IR native to a specific front-end.
+
+        Returns:
+            A register definition that is extracted or inferred from `input_obj`.
+        """
+
+    @staticmethod
+    @abstractmethod
+    async def set_directives(input_obj: InputType) -> Attributes:
+        """Returns directives based on an input object.
+
+        Args:
+            input_obj: Input for the compilation to IR native to a specific front-end.
+
+        Returns:
+            A specification of all directives that could be extracted from `input_obj`.
+        """
+
+    @staticmethod
+    @abstractmethod
+    async def settings(input_obj: InputType) -> Attributes:
+        """Returns settings based on an input object.
+
+        Args:
+            input_obj: Input for the compilation to IR native to a specific front-end.
+
+        Returns:
+            A specification of all settings that could be extracted from `input_obj`.
+        """
+
+    @staticmethod
+    @abstractmethod
+    async def parse_sequence(input_obj: InputType) -> AST:
+        """Returns an AST definition that represents the operations in input object.
+
+        Args:
+            input_obj: Input for the compilation to IR native to a specific front-end.
+
+        Returns:
+            An AST definition that represents the operations defined in an `input_obj`.
+        """
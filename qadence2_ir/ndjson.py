@@ -0,0 +1,149 @@
+"""Streaming NDJSON encoding of a `Model`.
+
+This module defines a text interchange format for `Model` that is written and read incrementally,
+one line at a time. The first line is a header record holding the register, inputs, directives and
+settings; every following line holds one instruction. Values use the safe encoding of
+`qadence2-ir.codec`.
+
+```
+{"format":"qadence2-ir","version":1,"register":{...},"inputs":{...},...}
+{"$assign":["%0",{"$call":["mul",0.5,{"$load":"x"}]}]}
+{"$quinstruct":["rx",{"$support":[[0],[]]},[{"$load":"%0"}],{}]}
+```
+
+The writers are generators and the readers consume any iterable of lines, such as an open file,
+so large models can be streamed to and from disk or a socket in constant memory.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Iterable, Iterator, TextIO
+
+from .codec import decode_value, encode_value
+from .types import Alloc, AllocQubits, Assign, Model, QuInstruct
+
+FORMAT = "qadence2-ir"
+VERSION = 1
+
+
+def encode_header(
+    register: AllocQubits,
+    inputs: dict[str, Alloc],
+    directives: dict[str, Any] | None = None,
+    settings: dict[str, Any] | None = None,
+) -> str:
+    """Encodes the header record of a model as a line of JSON.
+
+    Args:
+        register: The register of the model.
+        inputs: The input allocations of the model.
+        directives: The directives of the model.
+        settings: The settings of the model.
+
+    Returns:
+        The header line, terminated by a newline.
+    """
+
+    record = {
+        "format": FORMAT,
+        "version": VERSION,
+        "register": encode_value(register),
+        "inputs": {name: encode_value(alloc) for name, alloc in inputs.items()},
+        "directives": encode_value(directives or dict()),
+        "settings": encode_value(settings or dict()),
+    }
+    return json.dumps(record, separators=(",", ":")) + "\n"
+
+
+def encode_instruction(instruction: QuInstruct | Assign) -> str:
+    """Encodes an instruction record as a line of JSON.
+
+    Args:
+        instruction: The quantum operation or assignment to encode.
+
+    Returns:
+        The instruction line, terminated by a newline.
+    """
+
+    return json.dumps(encode_value(instruction), separators=(",", ":")) + "\n"
+
+
+def iter_lines(model: Model) -> Iterator[str]:
+    """Yields the lines encoding a model, starting with the header record.
+
+    Args:
+        model: The model to encode.
+
+    Returns:
+        An iterator over the lines of the encoding.
+    """
+
+    yield encode_header(model.register, model.inputs, model.directives, model.settings)
+    for instruction in model.instructions:
+        yield encode_instruction(instruction)
+
+
+def dump(model: Model, file: TextIO) -> None:
+    """Writes the encoding of a model, line by line, to a text file-like object.
+
+    Args:
+        model: The model to encode.
+        file: A text file-like object open for writing.
+    """
+
+    for line in iter_lines(model):
+        file.write(line)
+
+
+def read_stream(lines: Iterable[str]) -> tuple[dict[str, Any], Iterator[QuInstruct | Assign]]:
+    """Reads the header record and returns a lazy iterator over the instruction records.
+
+    Args:
+        lines: An iterable of lines of the encoding, e.g. a text file open for reading.
+
+    Returns:
+        A tuple with the decoded header, a dictionary with the `register`, `inputs`, `directives`
+        and `settings` of the model, and an iterator that decodes the instructions on demand.
+
+    Raises:
+        ValueError: If the header is missing, has an unknown format or an unsupported version.
+    """
+
+    lines = iter(lines)
+    record = json.loads(next((line for line in lines if line.strip()), "null"))
+    if not isinstance(record, dict) or record.get("format") != FORMAT:
+        raise ValueError("The stream does not start with a model header record.")
+    if record["version"] > VERSION:
+        raise ValueError(
+            f"Unsupported format version {record['version']}, the latest is {VERSION}."
+        )
+
+    header = {
+        "register": decode_value(record["register"]),
+        "inputs": {name: decode_value(alloc) for name, alloc in record["inputs"].items()},
+        "directives": decode_value(record["directives"]),
+        "settings": decode_value(record["settings"]),
+    }
+    instructions = (decode_value(json.loads(line)) for line in lines if line.strip())
+    return header, instructions
+
+
+def load(file: TextIO | Iterable[str]) -> Model:
+    """Reads a model from a text file-like object or an iterable of lines.
+
+    Args:
+        file: A text file-like object open for reading or an iterable of lines of the encoding.
+
+    Returns:
+        The decoded model.
+    """
+
+    header, instructions = read_stream(file)
+    return Model(
+        header["register"],
+        header["inputs"],
+        list(instructions),
+        header["directives"],
+        header["settings"],
+    )
@@ -0,0 +1,457 @@
+"""Optimization passes over the classical instructions of a `Model`.
+
+The passes in this module rewrite the list of instructions produced by `build_instructions`, or
+held in `Model.instructions`. They operate on the temporary variables, the static single-assigned
+variables labeled `%0` to `%n`, and keep the quantum instructions in their original order.
+"""
+
+from __future__ import annotations
+
+import heapq
+import operator
+from numbers import Complex, Integral
+from typing import Any, Callable, TypeGuard, Union
+
+from .fingerprint import encode
+from .types import Assign, Call, Load, QuInstruct
+
+# Associative and commutative callables, their chains of operands are canonicalized.
+COMMUTATIVE_CALLABLES = frozenset({"add", "mul"})
+
+# Largest number of bits of the integers folded at compile time. Larger results, like
+# `pow(10, 10**8)`, are left to the backend instead of being computed by the compiler.
+MAX_FOLDED_BITS = 4096
+
+
+def _pow(base: Any, exponent: Any) -> Any:
+    # Integer powers are bounded before being computed, as their size grows with the exponent.
+    if isinstance(base, Integral) and isinstance(exponent, Integral):
+        if abs(int(base)).bit_length() * (int(exponent) - 1) > MAX_FOLDED_BITS:
+            raise OverflowError("Integer power too large to fold.")
+    return operator.pow(base, exponent)
+
+
+# Pure callables evaluated at compile time when all their arguments are numeric literals.
+FOLDABLE_CALLABLES: dict[str, Callable[..., Any]] = {
+    "add": operator.add,
+    "sub": operator.sub,
+    "mul": operator.mul,
+    "div": operator.truediv,
+    "rem": operator.mod,
+    "pow": _pow,
+}
+
+# Sentinel returned by `_fold` for values that cannot be evaluated at compile time.
+_UNFOLDED = object()
+
+# An operand is identified by a value number (`("#", n)`), the name of a non-temporary variable
+# (`("load", name)`) or a literal (`("lit", type, encoding)`, or `("obj", id)` for literals that
+# cannot be encoded).
+_Operand = tuple[Any, ...]
+_Expression = Union[tuple[str, str, tuple[_Operand, ...]], tuple[str, _Operand]]
+
+
+def is_temporary(instruction: QuInstruct | Assign) -> TypeGuard[Assign]:
+    """Checks if an instruction assigns a temporary variable, labeled `%0` to `%n`."""
+
+    return isinstance(instruction, Assign) and instruction.variable.startswith("%")
+
+
+def eliminate_common_subexpressions(
+    instructions: list[QuInstruct | Assign],
+) -> tuple[list[QuInstruct | Assign], int]:
+    """Removes the redundant assignments of temporary variables.
+
+    Each temporary variable is numbered by the value it computes, so that assignments computing the
+    same value are merged into one. Chains of commutative and associative callables, `add` and
+    `mul`, are flattened and their operands sorted, so that `add(add(a, b), c)` and
+    `add(a, add(b, c))` are recognized as the same value and share their common prefixes. Temporary
+    variables that are not used are removed, and the remaining ones are relabeled densely, in order
+    of first use.
+
+    Args:
+        instructions: A list of quantum operations and temporary static single-assigned variables.
+
+    Returns:
+        A tuple with the optimized list of instructions and the number of assignments of temporary
+        variables that were removed.
+
+    Example:
+
+    ```python
+    >>> eliminate_common_subexpressions([
+    ...     Assign("%0", Call("add", Load("a"), Load("b"))),
+    ...     Assign("%1", Call("add", Load("%0"), Load("c"))),
+    ...     Assign("%2", Call("add", Load("b"), Load("c"))),
+    ...     Assign("%3", Call("add", Load("a"), Load("%2"))),
+    ...     QuInstruct("rx", Support((0,)), Load("%1")),
+    ...     QuInstruct("rx", Support((1,)), Load("%3")),
+    ... ])
+    ([
+        Assign('%0', Call('add', Load('a'), Load('b'))),
+        Assign('%1', Call('add', Load('%0'), Load('c'))),
+        QuInstruct('rx', Support((0,)), Load('%1')),
+        QuInstruct('rx', Support((1,)), Load('%1')),
+    ], 2)
+    ```
+    """
+
+    temporaries = {ins.variable: ins.value for ins in instructions if is_temporary(ins)}
+
+    # A commutative chain absorbs the operands of a temporary variable computed by the same
+    # callable when it is its only use, flattening `add(add(a, b), c)` into `add(a, b, c)`.
+    uses: dict[str, int] = dict()
+    users: dict[str, QuInstruct | Assign] = dict()
+    for instruction in instructions:
+        for arg in _arguments(instruction):
+            if isinstance(arg, Load) and arg.variable in temporaries:
+                uses[arg.variable] = uses.get(arg.variable, 0) + 1
+                users[arg.variable] = instruction
+
+    def absorbed(label: str, value: Any) -> bool:
+        user = users.get(label)
+        return (
+            user is not None
+            and uses.get(label) == 1
+            and isinstance(value, Call)
+            and value.identifier in COMMUTATIVE_CALLABLES
+            and is_temporary(user)
+            and isinstance(user.value, Call)
+            and user.value.identifier == value.identifier
+        )
+
+    numbers: dict[_Expression, int] = dict()
+    expressions: list[_Expression] = []
+    literals: dict[_Operand, Any] = dict()
+    operands_of: dict[str, _Operand] = dict()
+    chains: dict[str, list[_Operand]] = dict()
+
+    def number(expression: _Expression) -> _Operand:
+        index = numbers.get(expression)
+        if index is None:
+            index = numbers[expression] = len(expressions)
+            expressions.append(expression)
+        return ("#", index)
+
+    def operand(arg: Any) -> _Operand:
+        if isinstance(arg, Load):
+            return operands_of.get(arg.variable, ("load", arg.variable))
+        try:
+            key: _Operand = ("lit", type(arg).__qualname__, encode(arg))
+        except TypeError:
+            # Literals that cannot be fingerprinted are only merged with themselves.
+            key = ("obj", id(arg))
+        literals[key] = arg
+        return key
+
+    for label, value in temporaries.items():
+        if not isinstance(value, Call):
+            operands_of[label] = number(("value", operand(value)))
+            continue
+
+        if value.identifier not in COMMUTATIVE_CALLABLES:
+            args = tuple(map(operand, value.args))
+            operands_of[label] = number(("call", value.identifier, args))
+            continue
+
+        chain: list[_Operand] = []
+        for arg in value.args:
+            if isinstance(arg, Load) and arg.variable in chains:
+                chain.extend(chains.pop(arg.variable))
+            else:
+                chain.append(operand(arg))
+
+        if len(chain) < 2:
+            operands_of[label] = number(("call", value.identifier, tuple(chain)))
+        elif absorbed(label, value):
+            chains[label] = chain
+        else:
+            chain.sort()
+            result = chain[0]
+            for term in chain[1:]:
+                result = number(("call", value.identifier, (result, term)))
+            operands_of[label] = result
+
+    # Materialize the values on demand, in order of first use.
+    labels: dict[int, str] = dict()
+    optimized: list[QuInstruct | Assign] = []
+
+    def resolve(key: _Operand) -> Any:
+        if key[0] == "#":
+            return Load(labels[key[1]])
+        if key[0] == "load":
+            return Load(key[1])
+        return literals[key]
+
+    def materialize(key: _Operand) -> Any:
+        stack = [key[1]] if key[0] == "#" else []
+        while stack:
+            index = stack[-1]
+            if index in labels:
+                stack.pop()
+                continue
+
+            expression = expressions[index]
+            args = expression[2] if expression[0] == "call" else (expression[1],)
+            pending = [arg[1] for arg in args if arg[0] == "#" and arg[1] not in labels]
+            if pending:
+                stack.extend(pending)
+                continue
+
+            stack.pop()
+            label = labels[index] = f"%{len(labels)}"
+            if expression[0] == "call":
+                optimized.append(Assign(label, Call(expression[1], *map(resolve, args))))
+            else:
+                optimized.append(Assign(label, resolve(expression[1])))
+
+        return resolve(key)
+
+    def rewrite(arg: Any) -> Any:
+        if isinstance(arg, Load) and arg.variable in operands_of:
+            return materialize(operands_of[arg.variable])
+        return arg
+
+    for instruction in instructions:
+        if is_temporary(instruction):
+            continue
+        if isinstance(instruction, QuInstruct):
+            rewritten = [rewrite(arg) for arg in instruction.args]
+            optimized.append(
+                QuInstruct(instruction.name, instruction.support, *rewritten, **instruction.attrs)
+            )
+        elif isinstance(instruction.value, Call):
+            call = Call(instruction.value.identifier, *map(rewrite, instruction.value.args))
+            optimized.append(Assign(instruction.variable, call))
+        else:
+            optimized.append(Assign(instruction.variable, rewrite(instruction.value)))
+
+    return optimized, len(temporaries) - len(labels)
+
+
+def register_foldable(name: str, function: Callable[..., Any]) -> None:
+    """Declares a callable as pure, so that `fold_constants` can evaluate it at compile time.
+
+    Args:
+        name: The identifier of the callable, as used in `Call`.
+        function: A function computing the value of the callable from numeric arguments.
+    """
+
+    FOLDABLE_CALLABLES[name] = function
+
+
+def fold_constants(
+    instructions: list[QuInstruct | Assign],
+) -> tuple[list[QuInstruct | Assign], int]:
+    """Evaluates the temporary variables computed from numeric literals only.
+
+    Calls to the callables in `FOLDABLE_CALLABLES` whose arguments are all numbers are evaluated,
+    and the resulting value is inlined in the instructions using it. Folding propagates, so fully
+    numeric subtrees collapse into a single literal. Calls raising an error, e.g. a division by
+    zero, and integer results larger than `MAX_FOLDED_BITS` bits are kept to be reported, or
+    computed, by the backend. The remaining temporary variables are relabeled
+    densely.
+
+    Args:
+        instructions: A list of quantum operations and temporary static single-assigned variables.
+
+    Returns:
+        A tuple with the optimized list of instructions and the number of assignments of temporary
+        variables that were folded.
+
+    Example:
+
+    ```python
+    >>> fold_constants([
+    ...     Assign("%0", Call("mul", 2.0, 3.0)),
+    ...     Assign("%1", Call("add", Load("x"), Load("%0"))),
+    ...     QuInstruct("rx", Support((0,)), Load("%0")),
+    ...     QuInstruct("ry", Support((0,)), Load("%1")),
+    ... ])
+    ([
+        Assign('%0', Call('add', Load('x'), 6.0)),
+        QuInstruct('rx', Support((0,)), 6.0),
+        QuInstruct('ry', Support((0,)), Load('%0')),
+    ], 1)
+    ```
+    """
+
+    constants: dict[str, Any] = dict()
+    labels: dict[str, str] = dict()
+
+    def rewrite(arg: Any) -> Any:
+        if isinstance(arg, Load):
+            if arg.variable in constants:
+                return constants[arg.variable]
+            if arg.variable in labels:
+                return Load(labels[arg.variable])
+        return arg
+
+    folded: list[QuInstruct | Assign] = []
+    for instruction in instructions:
+        if isinstance(instruction, QuInstruct):
+            args = [rewrite(arg) for arg in instruction.args]
+            folded.append(
+                QuInstruct(instruction.name, instruction.support, *args, **instruction.attrs)
+            )
+            continue
+
+        value = instruction.value
+        if isinstance(value, Call):
+            value = Call(value.identifier, *map(rewrite, value.args))
+        else:
+            value = rewrite(value)
+
+        if is_temporary(instruction):
+            constant = _fold(value)
+            if constant is not _UNFOLDED:
+                constants[instruction.variable] = constant
+                continue
+            labels[instruction.variable] = f"%{len(labels)}"
+            folded.append(Assign(labels[instruction.variable], value))
+        else:
+            folded.append(Assign(instruction.variable, value))
+
+    return folded, len(constants)
+
+
+def liveness(instructions: list[QuInstruct | Assign]) -> dict[str, int]:
+    """Returns the index of the last instruction using each temporary variable.
+
+    A temporary variable is live from its assignment to its last use. Temporary variables that are
+    never used are mapped to the index of their own assignment.
+
+    Args:
+        instructions: A list of quantum operations and temporary static single-assigned variables.
+
+    Returns:
+        A dictionary mapping the temporary variables to the index of their last use.
+    """
+
+    last_use: dict[str, int] = dict()
+    for index, instruction in enumerate(instructions):
+        if is_temporary(instruction):
+            last_use[instruction.variable] = index  # type: ignore[union-attr]
+        for arg in _arguments(instruction):
+            if isinstance(arg, Load) and arg.variable in last_use:
+                last_use[arg.variable] = index
+    return last_use
+
+
+def eliminate_dead_assignments(
+    instructions: list[QuInstruct | Assign],
+) -> tuple[list[QuInstruct | Assign], int]:
+    """Removes the assignments of temporary variables that are never used.
+
+    The instructions are traversed backwards, so that temporary variables only used by dead
+    assignments are removed as well. The remaining temporary variables are relabeled densely.
+
+    Args:
+        instructions: A list of quantum operations and temporary static single-assigned variables.
+
+    Returns:
+        A tuple with the optimized list of instructions and the number of assignments of temporary
+        variables that were removed.
+    """
+
+    live: set[str] = set()
+    alive: list[QuInstruct | Assign] = []
+    for instruction in reversed(instructions):
+        if is_temporary(instruction) and instruction.variable not in live:  # type: ignore[union-attr]
+            continue
+        alive.append(instruction)
+        live.update(arg.variable for arg in _arguments(instruction) if isinstance(arg, Load))
+    alive.reverse()
+
+    return _relabel(alive), len(instructions) - len(alive)
+
+
+def allocate_slots(instructions: list[QuInstruct | Assign]) -> dict[str, int]:
+    """Assigns a buffer slot to each temporary variable, reusing the slots of dead variables.
+
+    Slots are allocated by a linear scan over the live ranges given by `liveness`. A slot is
+    released after the last use of its variable and handed out again, lowest first, to the next
+    assignments, so backends need as many parameter buffers as the maximum number of simultaneously
+    live temporary variables instead of one per variable.
+
+    Args:
+        instructions: A list of quantum operations and temporary static single-assigned variables.
+
+    Returns:
+        A dictionary mapping the temporary variables to their slot index.
+    """
+
+    last_use = liveness(instructions)
+    slots: dict[str, int] = dict()
+    free: list[int] = []
+    size = 0
+    expiring: list[tuple[int, int]] = []
+    for index, instruction in enumerate(instructions):
+        while expiring and expiring[0][0] < index:
+            heapq.heappush(free, heapq.heappop(expiring)[1])
+        if not is_temporary(instruction):
+            continue
+
+        if free:
+            slot = heapq.heappop(free)
+        else:
+            slot, size = size, size + 1
+        slots[instruction.variable] = slot  # type: ignore[union-attr]
+        heapq.heappush(expiring, (last_use[instruction.variable], slot))  # type: ignore[union-attr]
+    return slots
+
+
+def _relabel(instructions: list[QuInstruct | Assign]) -> list[QuInstruct | Assign]:
+    labels: dict[str, str] = dict()
+
+    def rewrite(arg: Any) -> Any:
+        if isinstance(arg, Load) and arg.variable in labels:
+            return Load(labels[arg.variable])
+        return arg
+
+    relabeled: list[QuInstruct | Assign] = []
+    for instruction in instructions:
+        if isinstance(instruction, QuInstruct):
+            args = [rewrite(arg) for arg in instruction.args]
+            relabeled.append(
+                QuInstruct(instruction.name, instruction.support, *args, **instruction.attrs)
+            )
+            continue
+
+        value = instruction.value
+        if isinstance(value, Call):
+            value = Call(value.identifier, *map(rewrite, value.args))
+        else:
+            value = rewrite(value)
+
+        variable = instruction.variable
+        if is_temporary(instruction):
+            labels[variable] = f"%{len(labels)}"
+            variable = labels[variable]
+        relabeled.append(Assign(variable, value))
+    return relabeled
+
+
+def _fold(value: Any) -> Any:
+    if isinstance(value, Complex):
+        return value
+    if not isinstance(value, Call) or value.identifier not in FOLDABLE_CALLABLES:
+        return _UNFOLDED
+    if not all(isinstance(arg, Complex) for arg in value.args):
+        return _UNFOLDED
+
+    try:
+        result = FOLDABLE_CALLABLES[value.identifier](*value.args)
+    except (ArithmeticError, TypeError, ValueError):
+        return _UNFOLDED
+    if isinstance(result, Integral) and int(result).bit_length() > MAX_FOLDED_BITS:
+        return _UNFOLDED
+    return result
+
+
+def _arguments(instruction: QuInstruct | Assign) -> tuple[Any, ...]:
+    if isinstance(instruction, QuInstruct):
+        return instruction.args
+    if isinstance(instruction.value, Call):
+        return instruction.value.args
+    return (instruction.value,)
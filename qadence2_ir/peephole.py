@@ -0,0 +1,187 @@
+"""Peephole optimizer over the quantum instructions of a `Model`.
+
+The optimizer scans the instructions once and applies local rewrite rules to pairs of quantum
+instructions acting on the same support with no other instruction acting on their qubits between
+them. Instructions acting on disjoint qubits commute, so `rx(0) rx(1) rx(0)` is treated as two
+adjacent `rx` on qubit 0. Instructions with `Support.target_all()` act on every qubit and are never
+reordered.
+
+Rules are registered by instruction name in `RULES`. A rule receives the earlier and the later
+instruction and a function returning fresh temporary variable labels, and returns the list of
+instructions replacing the pair, or `None` when it does not apply. The default rules merge
+consecutive rotations and cancel pairs of self-inverse gates.
+"""
+
+from __future__ import annotations
+
+from numbers import Complex
+from typing import Any, Callable, Optional
+
+from .types import Assign, Call, Load, QuInstruct
+
+Rule = Callable[[QuInstruct, QuInstruct, Callable[[], str]], Optional[list[Any]]]
+
+RULES: dict[str, list[Rule]] = dict()
+
+
+def register_rule(name: str, rule: Rule) -> None:
+    """Registers a rewrite rule for pairs of instructions with the given name.
+
+    Args:
+        name: The name of the quantum instructions the rule applies to.
+        rule: A function receiving the earlier and the later instruction, with equal supports, and
+            a function returning fresh temporary variable labels. It returns the list of
+            instructions replacing the pair, or `None` if the rule does not apply. The replacement
+            must hold fewer quantum instructions than the pair.
+    """
+
+    RULES.setdefault(name, []).append(rule)
+
+
+def merge_rotations(
+    previous: QuInstruct, current: QuInstruct, fresh: Callable[[], str]
+) -> list[Any] | None:
+    """Merges two rotations about the same axis into one, adding their angles.
+
+    The sum of literal angles is computed directly and a rotation by zero is removed. Otherwise,
+    the sum is assigned to a new temporary variable.
+    """
+
+    if previous.attrs != current.attrs or len(previous.args) != 1 or len(current.args) != 1:
+        return None
+
+    (lhs,), (rhs,) = previous.args, current.args
+    if isinstance(lhs, Complex) and isinstance(rhs, Complex):
+        angle = lhs + rhs
+        if angle == 0:
+            return []
+        return [QuInstruct(current.name, current.support, angle, **current.attrs)]
+
+    label = fresh()
+    return [
+        Assign(label, Call("add", lhs, rhs)),
+        QuInstruct(current.name, current.support, Load(label), **current.attrs),
+    ]
+
+
+def cancel_inverses(
+    previous: QuInstruct, current: QuInstruct, fresh: Callable[[], str]
+) -> list[Any] | None:
+    """Removes two consecutive applications of the same self-inverse gate."""
+
+    if previous.attrs != current.attrs or previous.args or current.args:
+        return None
+    return []
+
+
+for _name in ("rx", "ry", "rz"):
+    register_rule(_name, merge_rotations)
+    register_rule(_name.upper(), merge_rotations)
+for _name in ("x", "y", "z", "h", "cnot", "cz", "swap"):
+    register_rule(_name, cancel_inverses)
+    register_rule(_name.upper(), cancel_inverses)
+
+
+def optimize_gates(
+    instructions: list[QuInstruct | Assign],
+) -> tuple[list[QuInstruct | Assign], int]:
+    """Applies the rules in `RULES` to the quantum instructions until none applies.
+
+    Each quantum instruction is compared with the last instruction acting on its qubits. When both
+    have the same support and a rule applies, the pair is replaced by the instructions returned by
+    the rule, placed at the position of the later one. New temporary variables are labeled after
+    the largest existing `%n`, use `passes.eliminate_dead_assignments` to relabel them densely.
+
+    Args:
+        instructions: A list of quantum operations and temporary static single-assigned variables.
+
+    Returns:
+        A tuple with the optimized list of instructions and the number of quantum instructions that
+        were removed.
+
+    Example:
+
+    ```python
+    >>> optimize_gates([
+    ...     QuInstruct("rx", Support((0,)), Load("a")),
+    ...     QuInstruct("h", Support((1,))),
+    ...     QuInstruct("rx", Support((0,)), Load("b")),
+    ...     QuInstruct("h", Support((1,))),
+    ... ])
+    ([
+        Assign('%0', Call('add', Load('a'), Load('b'))),
+        QuInstruct('rx', Support((0,)), Load('%0')),
+    ], 3)
+    ```
+    """
+
+    counter = 1 + max(
+        (_index(ins.variable) for ins in instructions if isinstance(ins, Assign)), default=-1
+    )
+
+    def fresh() -> str:
+        nonlocal counter
+        counter += 1
+        return f"%{counter - 1}"
+
+    optimized: list[Any] = []
+    # The positions in `optimized` of the quantum instructions acting on each qubit, in order.
+    stacks: dict[int, list[int]] = dict()
+    for instruction in instructions:
+        if not isinstance(instruction, QuInstruct):
+            optimized.append(instruction)
+            continue
+
+        qubits = (*instruction.support.target, *instruction.support.control)
+        if not qubits:
+            stacks.clear()
+            optimized.append(instruction)
+            continue
+
+        pending = [instruction]
+        while pending:
+            current = pending.pop()
+            qubits = (*current.support.target, *current.support.control)
+            replacement = None
+
+            tops = {stacks[q][-1] if stacks.get(q) else None for q in qubits}
+            position = tops.pop() if len(tops) == 1 else None
+            if position is not None:
+                previous = optimized[position]
+                if previous.name == current.name and previous.support == current.support:
+                    replacement = _rewrite(previous, current, fresh)
+
+            if replacement is None:
+                for q in qubits:
+                    stacks.setdefault(q, []).append(len(optimized))
+                optimized.append(current)
+                continue
+
+            optimized[position] = None  # type: ignore[index]
+            for q in qubits:
+                stacks[q].pop()
+
+            # The quantum instructions of the replacement may combine with earlier ones.
+            gates = [ins for ins in replacement if isinstance(ins, QuInstruct)]
+            optimized.extend(ins for ins in replacement if not isinstance(ins, QuInstruct))
+            pending.extend(reversed(gates))
+
+    optimized = [ins for ins in optimized if ins is not None]
+    removed = sum(isinstance(ins, QuInstruct) for ins in instructions) - sum(
+        isinstance(ins, QuInstruct) for ins in optimized
+    )
+    return optimized, removed
+
+
+def _rewrite(previous: QuInstruct, current: QuInstruct, fresh: Callable[[], str]) -> Any:
+    for rule in RULES.get(current.name, ()):
+        replacement = rule(previous, current, fresh)
+        if replacement is not None:
+            return replacement
+    return None
+
+
+def _index(variable: str) -> int:
+    if variable.startswith("%") and variable[1:].isdigit():
+        return int(variable[1:])
+    return -1
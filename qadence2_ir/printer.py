@@ -0,0 +1,122 @@
+"""Pretty-printer of `Model`s writing to text streams.
+
+`write_model` writes the representation of a model, as given by `repr`, piece by piece to any
+object with a `write` method, like an open file, `sys.stdout` or an `io.StringIO`, so that large
+models are printed in linear time without building the whole text in memory. Long lists of
+instructions can be elided, keeping only the first and last instructions.
+
+Example:
+
+```python
+>>> write_model(model, sys.stdout, head=2, tail=1)
+Model(
+  AllocQubits(2),
+  {
+    'x': Alloc(1, trainable=True),
+  },
+  [
+    Assign('%0', Call('sin', Load('x'))),
+    QuInstruct('rx', Support((0,)), Load('%0')),
+    ...  # 997 more instructions
+    QuInstruct('h', Support((1,))),
+  ]
+)
+```
+"""
+
+from __future__ import annotations
+
+from io import StringIO
+from typing import TYPE_CHECKING, Any, Protocol
+
+if TYPE_CHECKING:
+    from .types import Model
+
+INDENT = "  "
+
+
+class TextWriter(Protocol):
+    """A text stream, with a `write` method."""
+
+    def write(self, text: str, /) -> Any: ...
+
+
+def write_model(
+    model: Model,
+    fp: TextWriter,
+    head: int | None = None,
+    tail: int = 0,
+) -> None:
+    """Writes the representation of a model to a text stream.
+
+    Args:
+        model: The model to print.
+        fp: The stream where the representation is written.
+        head: The number of instructions printed from the start of the model. All the instructions
+            are printed when `None`.
+        tail: The number of instructions printed from the end of the model, when `head` is given.
+            The instructions in between are replaced with their count.
+
+    Raises:
+        ValueError: If `head` or `tail` is negative.
+    """
+
+    if (head is not None and head < 0) or tail < 0:
+        raise ValueError(f"Expected non-negative head and tail, got {head} and {tail}.")
+
+    write = fp.write
+    write(f"{model.__class__.__name__}(\n")
+    write(f"{INDENT}{model.register},\n")
+    _write_dict(write, model.inputs)
+    write(",\n")
+
+    instructions = model.instructions
+    total = len(instructions)
+    elided = 0 if head is None else total - head - tail
+    write(f"{INDENT}[\n")
+    if elided > 0:
+        for index in range(head):  # type: ignore[arg-type]
+            write(f"{INDENT}{INDENT}{instructions[index]},\n")
+        write(f"{INDENT}{INDENT}...  # {elided} more instructions\n")
+        for index in range(total - tail, total):
+            write(f"{INDENT}{INDENT}{instructions[index]},\n")
+    else:
+        for instruction in instructions:
+            write(f"{INDENT}{INDENT}{instruction},\n")
+    write(f"{INDENT}]")
+
+    if model.directives:
+        write(",\n")
+        _write_dict(write, model.directives, "directives=")
+    if model.settings:
+        write(",\n")
+        _write_dict(write, model.settings, "settings=")
+    write("\n)")
+
+
+def format_model(model: Model, head: int | None = None, tail: int = 0) -> str:
+    """Returns the representation of a model, eliding instructions as in `write_model`.
+
+    Args:
+        model: The model to print.
+        head: The number of instructions printed from the start of the model. All the instructions
+            are printed when `None`.
+        tail: The number of instructions printed from the end of the model, when `head` is given.
+
+    Returns:
+        The representation of the model.
+
+    Raises:
+        ValueError: If `head` or `tail` is negative.
+    """
+
+    stream = StringIO()
+    write_model(model, stream, head, tail)
+    return stream.getvalue()
+
+
+def _write_dict(write: Any, values: dict[str, Any], prefix: str = "") -> None:
+    write(f"{INDENT}{prefix}{'{'}\n")
+    for key, value in values.items():
+        write(f"{INDENT}{INDENT}'{key}': {value},\n")
+    write(f"{INDENT}{'}'}")
@@ -0,0 +1,215 @@
+"""Opt-in instrumentation of the compiler functions built by `ir_compiler_factory`.
+
+While at least one profiling hook is registered, every compilation records, for each stage, the
+wall time and optionally the peak memory allocated, together with the number of AST nodes, the
+number of instructions and the hit rate of the memoisation of repeated subexpressions. Each hook is
+called with the `CompileProfile` of every compilation. When no hook is registered, the compiler
+runs uninstrumented.
+
+Example:
+
+```python
+>>> with profile_compilation(trace_memory=True) as profiles:
+...     model = ir_compiler(input_obj)
+>>> profiles[0]
+CompileProfile(total_time=0.0132, nodes=2048, instructions=512, memo_hit_rate=0.5)
+>>> [stage.name for stage in profiles[0].stages]
+['set_register', 'set_directives', 'settings', 'parse_sequence', 'lower']
+```
+"""
+
+from __future__ import annotations
+
+import time
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import Token
+from typing import Any, Callable, Iterator, NamedTuple, Protocol
+
+from .factory_tools import MEMO_COUNTERS
+from .irast import AST
+from .types import Model
+
+
+class StageRecord(NamedTuple):
+    name: str
+    wall_time: float
+    peak_memory: int | None = None
+
+
+class CompileProfile:
+    """Measurements of a single compilation.
+
+    Args:
+        stages: The records of the stages, in order of execution.
+        nodes: The number of nodes of the parsed AST, counting once a node referenced several times.
+        instructions: The number of instructions of the compiled model.
+        memo_hits: The number of references to calls lowered by reusing a temporary variable.
+        memo_misses: The number of calls assigned to a new temporary variable. Both counters are
+            measured by `lower_ast`, and are zero when the model is returned by a cache.
+    """
+
+    __slots__ = ("stages", "nodes", "instructions", "memo_hits", "memo_misses")
+
+    def __init__(
+        self,
+        stages: list[StageRecord],
+        nodes: int = 0,
+        instructions: int = 0,
+        memo_hits: int = 0,
+        memo_misses: int = 0,
+    ) -> None:
+        self.stages = stages
+        self.nodes = nodes
+        self.instructions = instructions
+        self.memo_hits = memo_hits
+        self.memo_misses = memo_misses
+
+    @property
+    def total_time(self) -> float:
+        """The wall time of all the stages, in seconds."""
+
+        return sum(stage.wall_time for stage in self.stages)
+
+    @property
+    def memo_hit_rate(self) -> float:
+        """The fraction of references to calls reusing an already assigned temporary variable."""
+
+        lookups = self.memo_hits + self.memo_misses
+        return self.memo_hits / lookups if lookups else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(total_time={self.total_time:.4g}, nodes={self.nodes}, "
+            f"instructions={self.instructions}, memo_hit_rate={self.memo_hit_rate:.3g})"
+        )
+
+
+class ProfilingHook(Protocol):
+    """A function called with the profile of every compilation."""
+
+    def __call__(self, profile: CompileProfile, /) -> None: ...
+
+
+# The registered hooks, with a flag to trace the memory allocations. The compilers only check if
+# this list is empty, so it must be modified in place.
+HOOKS: list[tuple[ProfilingHook, bool]] = []
+
+
+def add_hook(hook: ProfilingHook, trace_memory: bool = False) -> None:
+    """Registers a hook called with the profile of every compilation.
+
+    Args:
+        hook: The function receiving the `CompileProfile` of each compilation.
+        trace_memory: Record the peak memory allocated by each stage with `tracemalloc`, which
+            slows down the compilation.
+    """
+
+    HOOKS.append((hook, trace_memory))
+
+
+def remove_hook(hook: ProfilingHook) -> None:
+    """Unregisters a hook added with `add_hook`.
+
+    Args:
+        hook: The function to unregister.
+    """
+
+    HOOKS[:] = [(registered, trace) for registered, trace in HOOKS if registered != hook]
+
+
+@contextmanager
+def profile_compilation(trace_memory: bool = False) -> Iterator[list[CompileProfile]]:
+    """Context manager collecting the profiles of the compilations run within the context.
+
+    Args:
+        trace_memory: Record the peak memory allocated by each stage.
+
+    Returns:
+        The list where the profiles are appended.
+    """
+
+    profiles: list[CompileProfile] = []
+    hook = profiles.append
+    add_hook(hook, trace_memory)
+    try:
+        yield profiles
+    finally:
+        remove_hook(hook)
+
+
+class Recorder:
+    """Runs and measures the stages of a compilation, and reports the profile to the hooks."""
+
+    __slots__ = ("profile", "trace_memory", "_started_tracing", "_memo_counters", "_token")
+
+    def __init__(self) -> None:
+        self.profile = CompileProfile([])
+        self.trace_memory = any(trace for _, trace in HOOKS)
+        self._started_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start()
+        self._memo_counters = [0, 0]
+        self._token: Token[list[int] | None] | None = MEMO_COUNTERS.set(self._memo_counters)
+
+    def run(self, name: str, fn: Callable[..., Any], *args: Any) -> Any:
+        """Runs a stage of the compilation and records its measurements.
+
+        Args:
+            name: The name of the stage.
+            fn: The function running the stage.
+            args: The arguments of `fn`.
+
+        Returns:
+            The result of `fn(*args)`.
+        """
+
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+
+        start = time.perf_counter()
+        result = fn(*args)
+        wall_time = time.perf_counter() - start
+
+        peak = tracemalloc.get_traced_memory()[1] - baseline if self.trace_memory else None
+        self.profile.stages.append(StageRecord(name, wall_time, peak))
+        return result
+
+    def stop(self) -> None:
+        """Stops the memoisation counters, and tracing the memory allocations if started here."""
+
+        if self._token is not None:
+            MEMO_COUNTERS.reset(self._token)
+            self._token = None
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def finish(self, ast: AST, model: Model) -> None:
+        """Counts the nodes and instructions of the compilation and calls the hooks.
+
+        Args:
+            ast: The parsed AST.
+            model: The compiled model.
+        """
+
+        profile = self.profile
+        profile.nodes = _count_nodes(ast)
+        profile.instructions = len(model.instructions)
+        profile.memo_hits, profile.memo_misses = self._memo_counters
+
+        for hook, _ in list(HOOKS):
+            hook(profile)
+
+
+def _count_nodes(ast: AST) -> int:
+    # Visits each node object once, so that shared subtrees are not counted, nor walked, again.
+    visited = {id(ast)}
+    stack = [ast]
+    while stack:
+        for arg in stack.pop().args:
+            if isinstance(arg, AST) and id(arg) not in visited:
+                visited.add(id(arg))
+                stack.append(arg)
+    return len(visited)
@@ -0,0 +1,172 @@
+"""Parametric templates of a `Model` with fast re-binding of numeric constants.
+
+A `ModelTemplate` is compiled once from an AST whose numeric leaves are hoisted into a table of
+constants. Every occurrence of `AST.numeric` is replaced by a placeholder before lowering, and the
+positions where the placeholders land in the instructions are recorded. Binding a new vector of
+constants then patches those positions only, producing a `Model` that shares all the other
+instructions with the template, without walking or lowering the AST again.
+
+Since every occurrence of a numeric leaf becomes a distinct constant, subtrees that only differed
+by their numeric values are not merged by the lowering. The bound models are equivalent to the
+models compiled from the AST with the same constants, but may hold more temporary variables.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Sequence
+
+from .factory_tools import lower_ast
+from .irast import AST, Attributes
+from .types import AllocQubits, Assign, Call, Load, Model, QuInstruct
+
+# Prefix of the names of the placeholders replacing the numeric leaves while lowering.
+PLACEHOLDER_PREFIX = "#"
+
+
+class ModelTemplate:
+    """A compiled model whose numeric constants can be replaced without recompiling.
+
+    Args:
+        ast: The parsed AST to be compiled.
+        register: The register of the model.
+        directives: The directives of the model.
+        settings: The settings of the model.
+
+    Raises:
+        ValueError: If the AST has input variables named as the placeholders.
+    """
+
+    __slots__ = (
+        "register",
+        "inputs",
+        "directives",
+        "settings",
+        "constants",
+        "_instructions",
+        "_plan",
+    )
+
+    def __init__(
+        self,
+        ast: AST,
+        register: AllocQubits,
+        directives: Attributes | None = None,
+        settings: Attributes | None = None,
+    ) -> None:
+        hoisted, constants = _hoist(ast)
+        inputs, instructions = lower_ast(hoisted)
+
+        self.register = register
+        self.directives = directives or dict()
+        self.settings = settings or dict()
+        self.constants = tuple(constants)
+        self.inputs = {
+            name: alloc for name, alloc in inputs.items() if not name.startswith(PLACEHOLDER_PREFIX)
+        }
+
+        # The instruction indices, with the argument positions and constant slots to patch.
+        self._plan: list[tuple[int, tuple[tuple[int, int], ...]]] = []
+        for index, instruction in enumerate(instructions):
+            args = (
+                instruction.args if isinstance(instruction, QuInstruct) else instruction.value.args
+            )
+            patches = tuple(
+                (position, int(arg.variable[len(PLACEHOLDER_PREFIX) :]))
+                for position, arg in enumerate(args)
+                if isinstance(arg, Load) and arg.variable.startswith(PLACEHOLDER_PREFIX)
+            )
+            if patches:
+                self._plan.append((index, patches))
+
+        self._instructions = instructions
+
+    def bind(self, values: Sequence[Any] | None = None) -> Model:
+        """Returns the model with the numeric constants replaced by the given values.
+
+        Only the instructions holding a constant are rebuilt; the other ones are shared with the
+        template and the other bound models.
+
+        Args:
+            values: The new values of the constants, in the order of `constants`. By default, the
+                original values of the AST.
+
+        Returns:
+            The bound model.
+
+        Raises:
+            ValueError: If the number of values does not match the number of constants.
+        """
+
+        if values is None:
+            values = self.constants
+        elif len(values) != len(self.constants):
+            raise ValueError(f"Expected {len(self.constants)} values, got {len(values)}.")
+
+        instructions = list(self._instructions)
+        for index, patches in self._plan:
+            instruction = instructions[index]
+            if isinstance(instruction, QuInstruct):
+                args = list(instruction.args)
+                for position, slot in patches:
+                    args[position] = values[slot]
+                instructions[index] = QuInstruct(
+                    instruction.name, instruction.support, *args, **instruction.attrs
+                )
+            else:
+                args = list(instruction.value.args)
+                for position, slot in patches:
+                    args[position] = values[slot]
+                instructions[index] = Assign(
+                    instruction.variable, Call(instruction.value.identifier, *args)
+                )
+
+        return Model(
+            self.register,
+            dict(self.inputs),
+            instructions,
+            dict(self.directives),
+            dict(self.settings),
+        )
+
+    def __len__(self) -> int:
+        return len(self.constants)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({self.register}, constants={len(self)}, "
+            f"instructions={len(self._instructions)})"
+        )
+
+
+def _hoist(ast: AST) -> tuple[AST, list[Any]]:
+    # Rebuilds the AST replacing every occurrence of a numeric leaf by a placeholder variable, in
+    # depth-first order, and returns the values of the replaced leaves.
+    constants: list[Any] = []
+    result = ast
+    stack: list[tuple[AST, Any, list[Any]]] = [(ast, iter(ast.args), [])]
+    while stack:
+        node, node_args, rebuilt = stack[-1]
+        for arg in node_args:
+            if not isinstance(arg, AST) or arg.is_support:
+                rebuilt.append(arg)
+            elif arg.is_numeric:
+                name = f"{PLACEHOLDER_PREFIX}{len(constants)}"
+                rebuilt.append(AST.input_variable(name, 1, False))
+                constants.append(arg.args[0])
+            elif arg.is_input_variable:
+                if arg.head.startswith(PLACEHOLDER_PREFIX):
+                    raise ValueError(
+                        f"Input variable '{arg.head}' uses the reserved prefix "
+                        f"'{PLACEHOLDER_PREFIX}'."
+                    )
+                rebuilt.append(arg)
+            else:
+                stack.append((arg, iter(arg.args), []))
+                break
+        else:
+            stack.pop()
+            result = AST.__construct__(node.tag, node.head, *rebuilt, **node.attrs)
+            if stack:
+                stack[-1][2].append(result)
+
+    return result, constants
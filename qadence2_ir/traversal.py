@@ -0,0 +1,126 @@
+"""Iterative traversal of an `AST`.
+
+This module defines explicit-stack walks over an `AST`. Unlike nested recursive generators, these
+walks yield each node in constant time, independent of its depth, and do not hit the interpreter
+recursion limit on deeply nested sequences or expression chains. They are used by the tools in
+`qadence2-ir.factory_tools` to process an AST during compilation.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Iterator
+
+from .irast import AST
+
+
+def walk_preorder(ast: AST) -> Iterator[AST]:
+    """Yields the nodes of the AST in pre-order; a node appears before its arguments.
+
+    Args:
+        ast: A parsed tree containing the sequence of instructions to be added to the `Model`.
+
+    Returns:
+        An iterator over all the nodes of the AST.
+
+    Example:
+
+    ```python
+    >>> ast = AST.div(AST.numeric(2), AST.callable("fn", AST.numeric(3)))
+    >>> list(walk_preorder(ast))
+    [
+        AST.div(AST.numeric(2), AST.callable("fn", AST.numeric(3))),
+        AST.numeric(2),
+        AST.callable("fn", AST.numeric(3)),
+        AST.numeric(3),
+    ]
+    ```
+    """
+
+    stack = [ast]
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(arg for arg in reversed(node.args) if isinstance(arg, AST))
+
+
+def walk_postorder(ast: AST) -> Iterator[AST]:
+    """Yields the nodes of the AST in post-order; the arguments appear before the node.
+
+    Args:
+        ast: A parsed tree containing the sequence of instructions to be added to the `Model`.
+
+    Returns:
+        An iterator over all the nodes of the AST.
+
+    Example:
+
+    ```python
+    >>> ast = AST.div(AST.numeric(2), AST.callable("fn", AST.numeric(3)))
+    >>> list(walk_postorder(ast))
+    [
+        AST.numeric(2),
+        AST.numeric(3),
+        AST.callable("fn", AST.numeric(3)),
+        AST.div(AST.numeric(2), AST.callable("fn", AST.numeric(3))),
+    ]
+    ```
+    """
+
+    stack = [(ast, iter(ast.args))]
+    while stack:
+        node, args = stack[-1]
+        for arg in args:
+            if isinstance(arg, AST):
+                stack.append((arg, iter(arg.args)))
+                break
+        else:
+            stack.pop()
+            yield node
+
+
+def walk_filtered(predicate: Callable[[AST], bool], ast: AST) -> Iterator[AST]:
+    """Yields, in pre-order, the nodes of the AST that satisfy the `predicate`.
+
+    The arguments of a node that satisfies the `predicate` are not visited.
+
+    Args:
+        predicate: A function that checks if a specific property is present in the `ast`.
+        ast: A parsed tree containing the sequence of instructions to be added to the `Model`.
+
+    Returns:
+        An iterator over the selected nodes of the AST.
+    """
+
+    stack = [ast]
+    while stack:
+        node = stack.pop()
+        if predicate(node):
+            yield node
+        else:
+            stack.extend(arg for arg in reversed(node.args) if isinstance(arg, AST))
+
+
+def postorder_array(ast: AST) -> list[AST]:
+    """Returns a precomputed list of the nodes of the AST in post-order.
+
+    The list is built in a single pass, which is cheaper than consuming `walk_postorder` when the
+    whole traversal is needed or has to be reused several times.
+
+    Args:
+        ast: A parsed tree containing the sequence of instructions to be added to the `Model`.
+
+    Returns:
+        A list of all the nodes of the AST where the arguments appear before the node.
+    """
+
+    # Visiting the arguments from right to left and reversing the visiting order yields the
+    # post-order with the arguments from left to right.
+    nodes = []
+    stack = [ast]
+    while stack:
+        node = stack.pop()
+        nodes.append(node)
+        stack.extend(arg for arg in node.args if isinstance(arg, AST))
+
+    nodes.reverse()
+    return nodes
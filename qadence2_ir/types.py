@@ -21,6 +21,8 @@ from __future__ import annotations
 
 from typing import Any, Literal
 
+from .printer import format_model
+
 
 class Alloc:
     """Memory allocation for a parameter that is either a scalar value or an array of values.
@@ -37,6 +39,8 @@ class Alloc:
             backend.
     """
 
+    __slots__ = ("size", "is_trainable", "attrs")
+
     def __init__(self, size: int, trainable: bool, **attributes: Any) -> None:
         self.size = size
         self.is_trainable = trainable
@@ -65,9 +69,14 @@ class Assign:
         value: The value to be assigned to the variable.
     """
 
+    __slots__ = ("variable", "value", "_digest")
+
+    _digest: bytes | None  # Cached structural fingerprint, see `qadence2-ir.fingerprint`.
+
     def __init__(self, variable_name: str, value: Any) -> None:
         self.variable = variable_name
         self.value = value
+        self._digest = None
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({repr(self.variable)}, {self.value})"
@@ -88,6 +97,8 @@ class Load:
         variable_name: The name of the variable to load.
     """
 
+    __slots__ = ("variable",)
+
     def __init__(self, variable_name: str) -> None:
         self.variable = variable_name
 
@@ -109,6 +120,8 @@ class Call:
         args: The arguments that the function should be called with.
     """
 
+    __slots__ = ("identifier", "args")
+
     def __init__(self, identifier: str, *args: Any) -> None:
         self.identifier = identifier
         self.args = args
@@ -141,6 +154,8 @@ class Support:
         control: Index or indices of qubits which to which the operation is conditioned to.
     """
 
+    __slots__ = ("target", "control")
+
     def __init__(
         self,
         target: tuple[int, ...],
@@ -183,11 +198,16 @@ class QuInstruct:
             backend.
     """
 
+    __slots__ = ("name", "support", "args", "attrs", "_digest")
+
+    _digest: bytes | None  # Cached structural fingerprint, see `qadence2-ir.fingerprint`.
+
     def __init__(self, name: str, support: Support, *args: Any, **attributes: Any):
         self.name = name
         self.support = support
         self.args = args
         self.attrs = attributes
+        self._digest = None
 
     def __repr__(self) -> str:
         params = f"{repr(self.name)}, {self.support}"
@@ -228,6 +248,15 @@ class AllocQubits:
         options: Extra register related properties that may not be supported by all backends.
     """
 
+    __slots__ = (
+        "num_qubits",
+        "qubit_positions",
+        "grid_type",
+        "grid_scale",
+        "connectivity",
+        "options",
+    )
+
     def __init__(
         self,
         num_qubits: int,
@@ -273,6 +302,72 @@ class AllocQubits:
         return lhs == rhs
 
 
+class ModelMetrics:
+    """Circuit metrics of a `Model`, as computed by `Model.metrics`.
+
+    Args:
+        gate_counts: The number of quantum instructions by name.
+        two_qubit_gates: The number of quantum instructions acting on exactly two qubits, counting
+            targets and controls.
+        depth: The number of layers of the circuit, where each quantum instruction is placed after
+            the last instruction acting on any of its qubits. Instructions on `Support.target_all()`
+            act on every qubit.
+        num_temporaries: The number of temporary variables, `%n`, assigned by the instructions.
+        input_sizes: The size of each input variable.
+        num_qubits: The number of qubits of the register.
+        used_qubits: The number of qubits acted on by at least one quantum instruction.
+    """
+
+    __slots__ = (
+        "gate_counts",
+        "two_qubit_gates",
+        "depth",
+        "num_temporaries",
+        "input_sizes",
+        "num_qubits",
+        "used_qubits",
+    )
+
+    def __init__(
+        self,
+        gate_counts: dict[str, int],
+        two_qubit_gates: int,
+        depth: int,
+        num_temporaries: int,
+        input_sizes: dict[str, int],
+        num_qubits: int,
+        used_qubits: int,
+    ) -> None:
+        self.gate_counts = gate_counts
+        self.two_qubit_gates = two_qubit_gates
+        self.depth = depth
+        self.num_temporaries = num_temporaries
+        self.input_sizes = input_sizes
+        self.num_qubits = num_qubits
+        self.used_qubits = used_qubits
+
+    @property
+    def num_gates(self) -> int:
+        """The total number of quantum instructions."""
+
+        return sum(self.gate_counts.values())
+
+    @property
+    def qubit_utilisation(self) -> float:
+        """The fraction of the qubits of the register acted on by the quantum instructions."""
+
+        return self.used_qubits / self.num_qubits if self.num_qubits else 0.0
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{self.__class__.__name__}({fields})"
+
+    def __eq__(self, value: object) -> bool:
+        if not isinstance(value, ModelMetrics):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(value, name) for name in self.__slots__)
+
+
 class Model:
     """Aggregates the minimal information to construct sequence of instructions to execute on a QPU.
 
@@ -290,6 +385,15 @@ class Model:
             type like `int64`.
     """
 
+    __slots__ = (
+        "register",
+        "directives",
+        "settings",
+        "inputs",
+        "_instructions",
+        "_metrics",
+    )
+
     def __init__(
         self,
         register: AllocQubits,
@@ -304,36 +408,121 @@ class Model:
         self.inputs = inputs
         self.instructions = instructions
 
+    @property
+    def instructions(self) -> list[QuInstruct | Assign]:
+        return self._instructions
+
+    @instructions.setter
+    def instructions(self, instructions: list[QuInstruct | Assign]) -> None:
+        # The list is kept as given, not copied, so the caller can keep building it.
+        self._instructions = instructions
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Discards the cached metrics, to be called after modifying the instructions in place."""
+
+        self._metrics: tuple[int, tuple[Any, ...]] | None = None
+
+    def metrics(self, cached: bool = False) -> ModelMetrics:
+        """Computes the circuit metrics of the model in a single pass over the instructions.
+
+        Args:
+            cached: Reuse the results of the last pass unless the number of qubits of the register
+                changed, `instructions` was reassigned or `invalidate` was called since. Changes
+                made in place, like `model.instructions.append(...)`, are not detected.
+
+        Returns:
+            The gate counts, depth, number of temporary variables, input sizes and qubit usage.
+
+        Example:
+
+        ```python
+        >>> model = Model(
+        ...     AllocQubits(3),
+        ...     {"x": Alloc(1, trainable=True)},
+        ...     [
+        ...         Assign("%0", Call("sin", Load("x"))),
+        ...         QuInstruct("rx", Support((0,)), Load("%0")),
+        ...         QuInstruct("x", Support((1,), control=(0,))),
+        ...     ],
+        ... )
+        >>> metrics = model.metrics()
+        >>> metrics.gate_counts, metrics.two_qubit_gates, metrics.depth, metrics.used_qubits
+        ({'rx': 1, 'x': 1}, 1, 2, 2)
+        ```
+        """
+
+        num_qubits = self.register.num_qubits
+        if not cached or self._metrics is None or self._metrics[0] != num_qubits:
+            self._metrics = (num_qubits, _scan(self._instructions, num_qubits))
+
+        gate_counts, two_qubit_gates, depth, num_temporaries, used_qubits = self._metrics[1]
+        return ModelMetrics(
+            dict(gate_counts),
+            two_qubit_gates,
+            depth,
+            num_temporaries,
+            {name: alloc.size for name, alloc in self.inputs.items()},
+            num_qubits,
+            used_qubits,
+        )
+
     def __repr__(self) -> str:
-        indent = "  "
-        result = f"{self.__class__.__name__}(\n"
-        result += f"{indent}{self.register},\n"
-        result += f"{indent}{'{'}\n"
-        for key, value in self.inputs.items():
-            result += f"{indent}{indent}'{key}': {value},\n"
-        result += f"{indent}{'}'},\n"
-        result += f"{indent}[\n"
-        for item in self.instructions:
-            result += f"{indent}{indent}{item},\n"
-        result += f"{indent}]"
-
-        if self.directives != dict():
-            result += f",\n{indent}directives={'{'}\n"
-            for key, value in self.directives.items():
-                result += f"{indent}{indent}'{key}': {value},\n"
-            result += f"{indent}{'}'}"
-        if self.settings != dict():
-            result += f",\n{indent}settings={'{'}\n"
-            for key, value in self.settings.items():
-                result += f"{indent}{indent}'{key}': {value},\n"
-            result += f"{indent}{'}'}"
-        result += "\n)"
-        return result
+        return format_model(self)
 
     def __eq__(self, value: object) -> bool:
         if not isinstance(value, Model):
             return NotImplemented
-
-        lhs = (self.register, self.inputs, self.instructions, self.directives, self.settings)
-        rhs = (value.register, value.inputs, value.instructions, value.directives, value.settings)
-        return lhs == rhs
+        if self is value:
+            return True
+
+        lhs = (self.register, self.inputs, self.directives, self.settings)
+        rhs = (value.register, value.inputs, value.directives, value.settings)
+        if lhs != rhs or len(self._instructions) != len(value._instructions):
+            return False
+        return self._instructions == value._instructions
+
+
+def _scan(instructions: list[QuInstruct | Assign], num_qubits: int) -> tuple[Any, ...]:
+    gate_counts: dict[str, int] = dict()
+    two_qubit_gates = 0
+    temporaries: set[str] = set()
+    # Depth of the last instruction on each qubit, at least `floor`, the depth of the last
+    # instruction acting on every qubit.
+    levels: dict[int, int] = dict()
+    floor = depth = 0
+    acts_on_all = False
+
+    get_level = levels.get
+    add_temporary = temporaries.add
+    for instruction in instructions:
+        if isinstance(instruction, Assign):
+            variable = instruction.variable
+            if variable[:1] == "%":
+                add_temporary(variable)
+            continue
+
+        name = instruction.name
+        gate_counts[name] = gate_counts.get(name, 0) + 1
+        support = instruction.support
+        if not support.target:
+            acts_on_all = True
+            two_qubit_gates += num_qubits + len(support.control) == 2
+            floor = depth = depth + 1
+            continue
+
+        qubits = support.target + support.control if support.control else support.target
+        two_qubit_gates += len(qubits) == 2
+        level = floor
+        for qubit in qubits:
+            qubit_level = get_level(qubit, 0)
+            if qubit_level > level:
+                level = qubit_level
+        level += 1
+        for qubit in qubits:
+            levels[qubit] = level
+        if level > depth:
+            depth = level
+
+    used_qubits = num_qubits if acts_on_all else len(levels)
+    return gate_counts, two_qubit_gates, depth, len(temporaries), used_qubits
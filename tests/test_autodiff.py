@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import pytest
+
+from qadence2_ir.autodiff import DERIVATIVES, gradient_program, register_derivative
+from qadence2_ir.types import Alloc, AllocQubits, Assign, Call, Load, Model, QuInstruct, Support
+
+
+@pytest.fixture
+def model() -> Model:
+    return Model(
+        AllocQubits(2),
+        {"x": Alloc(1, True), "y": Alloc(1, True), "z": Alloc(1, False)},
+        [
+            Assign("%0", Call("mul", Load("x"), Load("y"))),
+            Assign("%1", Call("sin", Load("%0"))),
+            Assign("%2", Call("div", Load("%1"), Load("y"))),
+            Assign("%3", Call("pow", Load("%2"), 2)),
+            Assign("%4", Call("sub", Load("%3"), Load("x"))),
+            Assign("%5", Call("rem", Load("%4"), 3.0)),
+            Assign("%6", Call("exp", Load("z"))),
+            QuInstruct("rx", Support((0,)), Load("%5")),
+            QuInstruct("ry", Support((1,)), Load("%6"), Load("x")),
+            QuInstruct("rz", Support((1,)), Load("%0"), 0.5),
+        ],
+    )
+
+
+def test_gradient_program(model: Model) -> None:
+    program = gradient_program(model)
+    assert set(program.jacobian) == {(7, 0), (8, 1), (9, 0)}
+    assert program.jacobian[(8, 1)] == {"x": 1}
+    assert program.jacobian[(9, 0)] == {"x": Load("y"), "y": Load("x")}
+    assert all(int(ins.variable[1:]) > 6 for ins in program.instructions)
+
+
+def test_shared_arguments() -> None:
+    gates = [QuInstruct("rx", Support((i % 2,)), Load("%2")) for i in range(1000)]
+    model = Model(
+        AllocQubits(2),
+        {"x": Alloc(1, True)},
+        [
+            Assign("%0", Call("mul", Load("x"), Load("x"))),
+            Assign("%1", Call("cos", Load("%0"))),
+            Assign("%2", Call("sin", Load("%1"))),
+            *gates,
+        ],
+    )
+    program = gradient_program(model)
+    # The chain is differentiated once: cos, sin, and the products of the adjoints.
+    assert len(program.instructions) == 7
+    assert len(program.jacobian) == 1000
+    gradient = program.jacobian[(3, 0)]
+    assert all(program.jacobian[(index, 0)] == gradient for index in range(3, 1003))
+    assert program.jacobian[(3, 0)] is not program.jacobian[(4, 0)]
+
+
+def test_gradient_values(model: Model) -> None:
+    np = pytest.importorskip("numpy")
+    from qadence2_ir.evaluator import Evaluator
+
+    program = gradient_program(model)
+    # Evaluate the derivatives as the arguments of an extra quantum instruction.
+    derivatives = [
+        value for key in sorted(program.jacobian) for value in program.jacobian[key].values()
+    ]
+    extended = Model(
+        model.register,
+        model.inputs,
+        [
+            *model.instructions,
+            *program.instructions,
+            QuInstruct("grad", Support((0,)), *derivatives),
+        ],
+    )
+
+    inputs = {"x": np.array([0.3, 0.7]), "y": np.array([1.1, -0.4]), "z": np.array([0.2, 0.1])}
+    values = Evaluator(extended)(inputs)[len(extended.instructions) - 1]
+    evaluate = Evaluator(model)
+
+    epsilon = 1e-6
+    index = 0
+    for key in sorted(program.jacobian):
+        for name in program.jacobian[key]:
+            shifted = {**inputs, name: inputs[name] + epsilon}
+            numeric = (
+                evaluate(shifted)[key[0]][key[1]] - evaluate(inputs)[key[0]][key[1]]
+            ) / epsilon
+            np.testing.assert_allclose(values[index], numeric, rtol=1e-4, atol=1e-4)
+            index += 1
+
+
+def test_register_derivative() -> None:
+    model = Model(
+        AllocQubits(1),
+        {"x": Alloc(1, True)},
+        [Assign("%0", Call("cube", Load("x"))), QuInstruct("rx", Support((0,)), Load("%0"))],
+    )
+    with pytest.raises(ValueError):
+        gradient_program(model)
+
+    register_derivative(
+        "cube", lambda args, result, position, emit: emit("mul", 3, emit("pow", args[0], 2))
+    )
+    try:
+        program = gradient_program(model)
+    finally:
+        del DERIVATIVES["cube"]
+    assert program.instructions == [
+        Assign("%1", Call("pow", Load("x"), 2)),
+        Assign("%2", Call("mul", 3, Load("%1"))),
+    ]
+    assert program.jacobian == {(1, 0): {"x": Load("%2")}}
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import struct
+from pathlib import Path
+
+import pytest
+
+from qadence2_ir import binary
+from qadence2_ir.types import Alloc, AllocQubits, Assign, Call, Load, Model, QuInstruct, Support
+
+
+@pytest.fixture
+def model() -> Model:
+    return Model(
+        AllocQubits(3, [(0, 0), (1, 0), (0, 1)], connectivity={(0, 1): 1.0}),
+        {"x": Alloc(1, False), "theta": Alloc(3, True, group="rotations")},
+        [
+            Assign("%0", Call("mul", 0.5, Load("x"))),
+            Assign("%1", Call("fn", Load("%0"), 1j, (1, 2))),
+            QuInstruct("rx", Support((0,)), Load("%0")),
+            QuInstruct("CNOT", Support((1,), (0,))),
+            QuInstruct("rz", Support.target_all(), Load("theta"), 3, duration=1.5),
+        ],
+        {"dmm": {"targets": [0, 1]}},
+        {"dtype": "float64"},
+    )
+
+
+def test_round_trip(model: Model, simple_model: Model) -> None:
+    data = binary.dumps(model)
+    assert data[:4] == binary.MAGIC
+    loaded = binary.loads(data)
+    assert loaded.register == model.register
+    assert loaded.inputs == model.inputs
+    assert loaded.directives == model.directives
+    assert loaded.settings == model.settings
+    assert loaded.instructions[2] == model.instructions[2]
+    assert loaded.to_model() == model
+    assert binary.loads(binary.dumps(simple_model)).to_model() == simple_model
+
+    empty = Model(AllocQubits(1), {}, [])
+    assert binary.loads(binary.dumps(empty)).to_model() == empty
+
+
+def test_zero_copy(model: Model) -> None:
+    data = bytearray(binary.dumps(model))
+    loaded = binary.loads(data)
+    assert isinstance(loaded.instructions.kinds, memoryview)
+
+    assert loaded.instructions.arg_values[0] == 0.5
+
+    # The columns are views on the buffer.
+    position = data.find(struct.pack("<d", 0.5))
+    data[position : position + 8] = struct.pack("<d", 0.25)
+    assert loaded.instructions.arg_values[0] == 0.25
+    assert loaded.instructions[0] == Assign("%0", Call("mul", 0.25, Load("x")))
+
+
+def test_file(model: Model, tmp_path: Path) -> None:
+    path = tmp_path / "model.q2ir"
+    binary.dump(model, path)
+    loaded = binary.load(path)
+    assert loaded.to_model() == model
+
+
+def test_errors(model: Model) -> None:
+    data = binary.dumps(model)
+    with pytest.raises(ValueError, match="does not hold"):
+        binary.loads(b"XXXX" + data[4:])
+    with pytest.raises(ValueError, match="version"):
+        binary.loads(data[:4] + (binary.VERSION + 1).to_bytes(2, "little") + data[6:])
+    with pytest.raises(ValueError, match="too small"):
+        binary.loads(data[:4])
+    with pytest.raises(ValueError, match="exceeds"):
+        binary.loads(data[:-8])
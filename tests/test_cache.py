@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from qadence2_ir import AST, AllocQubits, ir_compiler_factory
+from qadence2_ir.cache import CacheInfo, CompileCache
+from qadence2_ir.types import QuInstruct
+
+from .conftest import InputTypeTest, IRBuilderTest
+
+
+def rotation(angle: AST) -> AST:
+    return AST.sequence(AST.quantum_op("rx", (0,), (), angle), AST.quantum_op("h", (1,), ()))
+
+
+def test_key() -> None:
+    x = AST.input_variable("x", 1, True)
+    register = AllocQubits(2)
+
+    key = CompileCache.key(rotation(AST.add(x, AST.numeric(1))), register, {}, {})
+    assert key == CompileCache.key(rotation(AST.add(x, AST.numeric(1))), register, {}, {})
+    # Equal ASTs lowered to different instructions have different keys.
+    assert key != CompileCache.key(rotation(AST.add(AST.numeric(1), x)), register, {}, {})
+    assert key != CompileCache.key(rotation(AST.add(x, AST.numeric(1.0))), register, {}, {})
+    assert key != CompileCache.key(rotation(AST.sub(x, AST.numeric(1))), register, {}, {})
+    assert key != CompileCache.key(rotation(AST.add(x, AST.numeric(1))), AllocQubits(3), {}, {})
+    assert key != CompileCache.key(rotation(AST.add(x, AST.numeric(1))), register, {"a": 1}, {})
+
+    # The position of the AST arguments among the other arguments is part of the key.
+    lhs = AST.quantum_op("rx", (0,), (), AST.numeric(1), "flag")
+    rhs = AST.quantum_op("rx", (0,), (), "flag", AST.numeric(1))
+    assert CompileCache.key(lhs, register, {}, {}) != CompileCache.key(rhs, register, {}, {})
+
+
+def test_lru(builder: IRBuilderTest) -> None:
+    cache = CompileCache(maxsize=2)
+    compiler = ir_compiler_factory(builder, cache=cache)
+    x = AST.input_variable("x", 1, True)
+    inputs = [InputTypeTest(2, {}, {}, rotation(AST.mul(x, AST.numeric(i)))) for i in range(3)]
+
+    first = compiler(inputs[0])
+    assert cache.info() == CacheInfo(hits=0, misses=1, evictions=0, size=1, maxsize=2)
+
+    again = compiler(inputs[0])
+    assert again == first and again is not first
+    assert cache.info().hits == 1
+
+    # The cached model is not affected by changes on the returned models.
+    again.instructions.clear()
+    assert compiler(inputs[0]) == first
+
+    compiler(inputs[1])
+    compiler(inputs[2])
+    assert cache.info() == CacheInfo(hits=2, misses=3, evictions=1, size=2, maxsize=2)
+
+    compiler(inputs[0])
+    assert cache.info().misses == 4
+
+    cache.clear()
+    assert cache.info() == CacheInfo(0, 0, 0, 0, 2)
+
+
+def test_numeric_types(builder: IRBuilderTest) -> None:
+    compiler = ir_compiler_factory(builder, cache=CompileCache())
+    for value in (1, 1.0, 1 + 0j, 1):
+        model = compiler(InputTypeTest(2, {}, {}, rotation(AST.numeric(value))))
+        instruction = model.instructions[0]
+        assert isinstance(instruction, QuInstruct)
+        assert type(instruction.args[0]) is type(value)
+
+
+def test_unhashable_inputs(builder: IRBuilderTest) -> None:
+    cache = CompileCache()
+    compiler = ir_compiler_factory(builder, cache=cache)
+    input_ = InputTypeTest(2, {"option": {1, 2}}, {}, rotation(AST.numeric(1.0)))
+    assert compiler(input_) == ir_compiler_factory(builder)(input_)
+    assert len(cache) == 0
+
+
+def test_unfingerprintable_inputs(builder: IRBuilderTest) -> None:
+    class Opaque:
+        def __init__(self, value: int) -> None:
+            self.value = value
+
+        def __repr__(self) -> str:
+            return "Opaque"
+
+        def __eq__(self, other: object) -> bool:
+            return isinstance(other, Opaque) and other.value == self.value
+
+    cache = CompileCache()
+    compiler = ir_compiler_factory(builder, cache=cache)
+    for value in (1, 2):
+        ast = AST.sequence(AST.quantum_op("rx", (0,), (), AST.numeric(1.0), meta=Opaque(value)))
+        model = compiler(InputTypeTest(2, {}, {}, ast))
+        instruction = model.instructions[-1]
+        assert isinstance(instruction, QuInstruct)
+        assert instruction.attrs["meta"] == Opaque(value)
+    assert len(cache) == 0
+
+
+def test_disk(builder: IRBuilderTest, quantum_ast: AST, tmp_path: Path) -> None:
+    input_ = InputTypeTest(2, {"option": True}, {"dtype": "f64"}, quantum_ast)
+    model = ir_compiler_factory(builder, cache=CompileCache(directory=tmp_path))(input_)
+    assert len(list(tmp_path.glob("*.q2ir"))) == 1
+
+    cache = CompileCache(directory=tmp_path)
+    assert ir_compiler_factory(builder, cache=cache)(input_) == model
+    assert cache.info().hits == 1
+
+
+def test_disk_concurrent_writes(builder: IRBuilderTest, quantum_ast: AST, tmp_path: Path) -> None:
+    model = ir_compiler_factory(builder)(InputTypeTest(2, {}, {}, quantum_ast))
+    cache = CompileCache(directory=tmp_path)
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(lambda _: cache.put("key", model), range(64)))
+
+    assert [path.name for path in tmp_path.iterdir()] == ["key.q2ir"]
+    assert CompileCache(directory=tmp_path).get("key") == model
+
+
+def test_disk_corrupt(builder: IRBuilderTest, quantum_ast: AST, tmp_path: Path) -> None:
+    input_ = InputTypeTest(2, {}, {}, quantum_ast)
+    expected = ir_compiler_factory(builder, cache=CompileCache(directory=tmp_path))(input_)
+    (path,) = tmp_path.glob("*.q2ir")
+    data = path.read_bytes()
+
+    # Truncated, overwritten and written in a later version of the format.
+    newer = data[:4] + (99).to_bytes(2, "little") + data[6:]
+    for corrupt in (data[: len(data) // 2], data[:8], b"\x00" * len(data), newer):
+        path.write_bytes(corrupt)
+        cache = CompileCache(directory=tmp_path)
+        assert ir_compiler_factory(builder, cache=cache)(input_) == expected
+        assert cache.info().misses == 1
+        # The corrupt file is replaced by the compiled model.
+        assert path.read_bytes() == data
+
+
+def test_instruction_changes(builder: IRBuilderTest, quantum_ast: AST) -> None:
+    compiler = ir_compiler_factory(builder, cache=CompileCache())
+    input_ = InputTypeTest(2, {}, {}, quantum_ast)
+    model = compiler(input_)
+    expected = ir_compiler_factory(builder)(input_)
+
+    # In-place changes to the instructions of the models do not affect the cache.
+    instruction = model.instructions[-1]
+    assert isinstance(instruction, QuInstruct)
+    instruction.args = (99.0,)
+    cached = compiler(input_)
+    assert cached == expected
+    instruction = cached.instructions[-1]
+    assert isinstance(instruction, QuInstruct)
+    instruction.support.target = (5,)
+    assert compiler(input_) == expected
+
+    # Nor are changes to the register and the inputs of the models.
+    cached.register.num_qubits = 99
+    cached.inputs["x"].size = 7
+    assert compiler(input_) == expected
+
+
+def test_disk_unencodable(builder: IRBuilderTest, tmp_path: Path) -> None:
+    ast = AST.sequence(AST.quantum_op("rx", (0,), (), AST.numeric(1.0), mask=b"\x01"))
+    cache = CompileCache(directory=tmp_path)
+    compiler = ir_compiler_factory(builder, cache=cache)
+    input_ = InputTypeTest(2, {}, {}, ast)
+
+    model = compiler(input_)
+    assert model == ir_compiler_factory(builder)(input_)
+    assert len(cache) == 1
+    assert not list(tmp_path.glob("*.q2ir"))
+    assert compiler(input_) == model
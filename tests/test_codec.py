@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from qadence2_ir.codec import decode_value, encode_value
+from qadence2_ir.types import Alloc, AllocQubits, Assign, Call, Load, QuInstruct, Support
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        None,
+        True,
+        3,
+        2.5,
+        "text",
+        [1, (2, 3)],
+        (1, [2.0, "a"]),
+        1 - 2j,
+        {"a": 1, "b": {"c": (1,)}},
+        {(0, 1): 1.0, 2: "x"},
+        {"$tuple": 1},
+        Load("x"),
+        Call("fn", Load("x"), 2.0, Call("g")),
+        Support((0, 1), (2,)),
+        Support.target_all(),
+        Alloc(4, True, attr=[1, 2]),
+        AllocQubits(3, [(0, 0), (1, 0)], "square", 2.0, {(0, 1): 0.5}, {"opt": True}),
+        Assign("%0", Call("mul", 0.5, Load("x"))),
+        QuInstruct("rx", Support((0,), (1,)), Load("%0"), 1j, duration=2.0),
+    ],
+)
+def test_round_trip(value: object) -> None:
+    data = json.loads(json.dumps(encode_value(value)))
+    assert decode_value(data) == value
+    assert type(decode_value(data)) is type(value)
+
+
+def test_errors() -> None:
+    with pytest.raises(TypeError):
+        encode_value({1, 2})
+
+    with pytest.raises(ValueError):
+        decode_value({"$unknown": 1})
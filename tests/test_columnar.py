@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from array import array
+
+import pytest
+
+from qadence2_ir.columnar import ASSIGN, QUANTUM, ColumnarInstructions
+from qadence2_ir.types import Assign, Call, Load, Model, QuInstruct, Support
+
+
+@pytest.fixture
+def instructions() -> list[QuInstruct | Assign]:
+    return [
+        Assign("var1", 10),
+        Assign("%0", Call("mul", 0.5, Load("x"))),
+        Assign("%1", Call("fn", Load("%0"), 2, True, 1j, "label")),
+        QuInstruct("rx", Support((0,)), Load("%0")),
+        QuInstruct("CNOT", Support((1,), (0,))),
+        QuInstruct("rx", Support.target_all(), 3.14, duration=2.0),
+        QuInstruct("ccz", Support((2,), (0, 1)), 2**70),
+    ]
+
+
+def test_round_trip(instructions: list[QuInstruct | Assign], simple_model: Model) -> None:
+    table = ColumnarInstructions.from_instructions(instructions)
+    assert len(table) == len(instructions)
+    assert table.to_instructions() == instructions
+    assert table[-1] == instructions[-1]
+    assert list(table.kinds) == [ASSIGN] * 3 + [QUANTUM] * 4
+    assert table.strings[table.opcodes[3]] == table.strings[table.opcodes[5]] == "rx"
+    assert list(table.targets) == [0, 1, 2]
+    assert list(table.controls) == [0, 0, 1]
+    assert table == ColumnarInstructions.from_instructions(instructions)
+
+    with pytest.raises(IndexError):
+        table[len(instructions)]
+
+    with pytest.raises(TypeError):
+        ColumnarInstructions.from_instructions([Load("x")])  # type: ignore
+
+    empty = ColumnarInstructions.from_instructions([])
+    assert len(empty) == 0
+    assert empty.to_instructions() == []
+    assert ColumnarInstructions.from_instructions(simple_model.instructions).to_instructions() == (
+        simple_model.instructions
+    )
+
+
+def test_as_numpy(instructions: list[QuInstruct | Assign]) -> None:
+    np = pytest.importorskip("numpy")
+
+    table = ColumnarInstructions.from_instructions(instructions)
+    columns = table.as_numpy()
+    assert np.array_equal(columns["kinds"], [ASSIGN] * 3 + [QUANTUM] * 4)
+    assert np.array_equal(columns["target_offsets"], [0, 0, 0, 0, 1, 2, 2, 3])
+    assert columns["arg_values"][table.arg_offsets[5]] == 3.14
+
+    # The arrays are views on the columns' buffers.
+    assert isinstance(table.arg_values, array)
+    table.arg_values[table.arg_offsets[5]] = 1.0
+    assert columns["arg_values"][table.arg_offsets[5]] == 1.0
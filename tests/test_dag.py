@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from qadence2_ir.dag import InstructionDAG
+from qadence2_ir.types import Assign, Call, Load, QuInstruct, Support
+
+INSTRUCTIONS: list[QuInstruct | Assign] = [
+    QuInstruct("h", Support((0,))),
+    Assign("%0", Call("mul", 2, Load("x"))),
+    QuInstruct("rx", Support((1,)), Load("%0")),
+    QuInstruct("cnot", Support((1,), (0,))),
+    QuInstruct("x", Support((2,))),
+    Assign("%1", Call("sin", Load("%0"))),
+    QuInstruct("rz", Support((0,)), Load("%1")),
+    QuInstruct("dyn_pulse", Support.target_all(), 1.0),
+    QuInstruct("z", Support((2,))),
+]
+
+
+def test_dependencies() -> None:
+    dag = InstructionDAG(INSTRUCTIONS)
+    assert dag.predecessors == [(), (), (1,), (0, 2), (), (1,), (3, 5), (3, 4, 6), (7,)]
+    assert dag.successors[1] == [2, 5]
+    assert len(dag) == len(INSTRUCTIONS)
+
+
+def test_layers() -> None:
+    dag = InstructionDAG(INSTRUCTIONS)
+    assert dag.depth == 5
+    assert dag.asap_layers() == [[0, 2, 4], [3], [6], [7], [8]]
+    assert dag.alap_layers() == [[0, 2], [3], [4, 6], [7], [8]]
+
+
+def test_critical_path() -> None:
+    dag = InstructionDAG(INSTRUCTIONS)
+    assert dag.critical_path() == ([0, 3, 6, 7, 8], 5)
+
+    durations = {"x": 10.0, "dyn_pulse": 1.0}
+    path, length = dag.critical_path(lambda ins: durations.get(ins.name, 0.5))
+    assert path == [4, 7, 8]
+    assert length == 11.5
+
+
+def test_moments() -> None:
+    dag = InstructionDAG(INSTRUCTIONS)
+    assert dag.moments() == [
+        [INSTRUCTIONS[1], INSTRUCTIONS[0], INSTRUCTIONS[2], INSTRUCTIONS[4]],
+        [INSTRUCTIONS[3]],
+        [INSTRUCTIONS[5], INSTRUCTIONS[6]],
+        [INSTRUCTIONS[7]],
+        [INSTRUCTIONS[8]],
+    ]
+    assert dag.moments(alap=True)[2] == [INSTRUCTIONS[5], INSTRUCTIONS[4], INSTRUCTIONS[6]]
+
+
+def test_classical_only() -> None:
+    instructions: list[QuInstruct | Assign] = [
+        Assign("%0", Call("sin", Load("x"))),
+        Assign("y", Load("%0")),
+    ]
+    dag = InstructionDAG(instructions)
+    assert dag.depth == 0
+    assert dag.critical_path() == ([], 0)
+    assert dag.moments() == [instructions]
+    assert InstructionDAG([]).moments() == []
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from copy import deepcopy
+
+from qadence2_ir.diff import diff_models
+from qadence2_ir.fingerprint import digest, instructions_digest
+from qadence2_ir.types import Alloc, AllocQubits, Load, Model, QuInstruct, Support
+
+
+def test_equal_models(simple_model: Model) -> None:
+    other = deepcopy(simple_model)
+    diff = diff_models(simple_model, other)
+    assert not diff
+    assert diff.first_divergence is None
+    assert diff.instructions == (None, None)
+    assert repr(diff) == "ModelDiff()"
+
+
+def test_diff_models(model_with_directives_settings: Model) -> None:
+    before = model_with_directives_settings
+    after = deepcopy(before)
+    after.register = AllocQubits(5)
+    after.inputs["y"] = Alloc(1, False)
+    after.directives = dict()
+    after.instructions[1] = QuInstruct("rx", Support((0,)), Load("y"))
+
+    diff = diff_models(before, after)
+    assert diff
+    assert diff.register == (before.register, after.register)
+    assert diff.inputs == {"y": (None, Alloc(1, False))}
+    assert diff.directives == {key: (value, None) for key, value in before.directives.items()}
+    assert diff.settings == dict()
+    assert diff.first_divergence == 1
+    assert diff.instructions == (before.instructions[1], after.instructions[1])
+
+    after = deepcopy(before)
+    after.instructions.append(QuInstruct("h", Support((0,))))
+    diff = diff_models(before, after)
+    assert diff.first_divergence == len(before.instructions)
+    assert diff.instructions == (None, after.instructions[-1])
+
+
+def test_digest_diff(simple_model: Model) -> None:
+    other = deepcopy(simple_model)
+    other.instructions[-1] = QuInstruct("ry", Support((0,)), 1.0)
+    assert simple_model != other
+    assert not diff_models(simple_model, deepcopy(simple_model), digests=True)
+    diff = diff_models(simple_model, other, digests=True)
+    assert diff.first_divergence == len(other.instructions) - 1
+    assert simple_model.instructions[-1]._digest is not None
+
+    other.instructions[-1] = deepcopy(simple_model.instructions[-1])
+    assert simple_model == other
+    assert not diff_models(simple_model, other, digests=True)
+    assert digest(simple_model) == digest(other)
+
+
+def test_fingerprinted_instructions_edited_in_place() -> None:
+    def model(duration: float) -> Model:
+        return Model(AllocQubits(1), {}, [QuInstruct("h", Support((0,)), duration=duration)])
+
+    before, after = model(1.0), model(2.0)
+    assert instructions_digest(before) != instructions_digest(after)
+
+    instruction = after.instructions[0]
+    assert isinstance(instruction, QuInstruct)
+    instruction.attrs["duration"] = 1.0
+    assert before == after
+    assert not diff_models(before, after)
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from qadence2_ir.evaluator import FUNCTIONS, Evaluator, register_function
+from qadence2_ir.types import Alloc, AllocQubits, Assign, Call, Load, Model, QuInstruct, Support
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def model() -> Model:
+    return Model(
+        AllocQubits(2),
+        {"x": Alloc(1, True), "v": Alloc(2, False)},
+        [
+            Assign("%0", Call("mul", 2.0, Load("x"))),
+            Assign("%1", Call("sin", Load("%0"))),
+            Assign("%2", Call("cos", Load("x"))),
+            QuInstruct("rx", Support((0,)), Load("%1")),
+            QuInstruct("h", Support((1,))),
+            Assign("%3", Call("add", Load("v"), Load("%0"))),
+            Assign("theta", Call("pow", Load("%3"), 2)),
+            QuInstruct("ry", Support((1,)), Load("theta"), 0.5),
+            QuInstruct("dyn_pulse", Support.target_all(), Load("x"), "local"),
+        ],
+    )
+
+
+def test_evaluate(model: Model) -> None:
+    x = np.linspace(0.0, 1.0, 7)
+    v = np.arange(14.0).reshape(7, 2)
+    evaluator = Evaluator(model)
+    outputs = evaluator({"x": x, "v": v})
+
+    assert sorted(outputs) == [3, 7, 8]
+    (rx,) = outputs[3]
+    np.testing.assert_allclose(rx, np.sin(2 * x).reshape(-1, 1))
+
+    theta, constant = outputs[7]
+    np.testing.assert_allclose(theta, (v + 2 * x.reshape(-1, 1)) ** 2)
+    np.testing.assert_array_equal(constant, np.full((7, 1), 0.5))
+
+    angle, mode = outputs[8]
+    assert angle.shape == (7, 1) and mode == "local"
+
+    # The per-sample evaluation gives the same results.
+    for i in range(7):
+        assert math.isclose(rx[i, 0], math.sin(2 * x[i]))
+
+
+def test_dead_assignments_are_not_compiled(model: Model) -> None:
+    evaluator = Evaluator(model)
+    assert len(evaluator.program) == 7
+    assert evaluator.num_slots == 3
+
+
+def test_errors(model: Model) -> None:
+    evaluator = Evaluator(model)
+    with pytest.raises(ValueError):
+        evaluator({"x": np.zeros(3)})
+    with pytest.raises(ValueError):
+        evaluator({"x": np.zeros(3), "v": np.zeros((3, 3))})
+    with pytest.raises(ValueError):
+        evaluator({"x": np.zeros(3), "v": np.zeros((4, 2))})
+
+    unknown = Model(
+        AllocQubits(1),
+        {},
+        [Assign("%0", Call("erf", 0.5)), QuInstruct("rx", Support((0,)), Load("%0"))],
+    )
+    with pytest.raises(ValueError):
+        Evaluator(unknown)
+
+    register_function("erf", np.vectorize(math.erf))
+    try:
+        (value,) = Evaluator(unknown)({}, batch_size=2)[1]
+        np.testing.assert_allclose(value, np.full((2, 1), math.erf(0.5)))
+    finally:
+        del FUNCTIONS["erf"]
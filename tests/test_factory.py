@@ -1,6 +1,22 @@
 from __future__ import annotations
 
-from qadence2_ir import AST, AllocQubits, ir_compiler_factory
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from qadence2_ir import (
+    AST,
+    AllocQubits,
+    AsyncIRBuilder,
+    async_ir_compiler_factory,
+    factory,
+    ir_batch_compile,
+    ir_compiler_factory,
+)
+from qadence2_ir.cache import CompileCache
+from qadence2_ir.irast import Attributes
 from qadence2_ir.types import Alloc, Assign, Call, Load, Model, QuInstruct, Support
 
 from .conftest import InputTypeTest, IRBuilderTest
@@ -22,3 +38,124 @@ def test_init(quantum_ast: AST, builder: IRBuilderTest) -> None:
         {"my-setting": 8},
     )
     assert model == expected
+
+
+def _batch_inputs(count: int) -> list[InputTypeTest]:
+    return [
+        InputTypeTest(
+            2,
+            {},
+            {},
+            AST.quantum_op(
+                "rx", (0,), (), AST.mul(AST.numeric(i), AST.input_variable("x", 1, False))
+            ),
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.parametrize("executor", ["process", "thread"])
+def test_batch_compile(builder: IRBuilderTest, executor: str) -> None:
+    inputs = _batch_inputs(10)
+    ir_compiler = ir_compiler_factory(builder)
+    results = list(ir_batch_compile(builder, inputs, executor, max_workers=2, chunksize=3))
+    assert results == [(i, ir_compiler(input_)) for i, input_ in enumerate(inputs)]
+
+
+def test_batch_compile_unordered(builder: IRBuilderTest) -> None:
+    inputs = _batch_inputs(20)
+    ir_compiler = ir_compiler_factory(builder)
+    with ThreadPoolExecutor(4) as pool:
+        results = ir_batch_compile(builder, iter(inputs), pool, max_workers=4, ordered=False)
+        assert sorted(results, key=lambda result: result[0]) == [
+            (i, ir_compiler(input_)) for i, input_ in enumerate(inputs)
+        ]
+
+
+def test_batch_compile_errors(builder: IRBuilderTest) -> None:
+    inputs: list[Any] = [*_batch_inputs(2), None, *_batch_inputs(1)]
+    results = list(ir_batch_compile(builder, inputs, "thread", capture_errors=True))
+    assert [index for index, _ in results] == [0, 1, 2, 3]
+    assert isinstance(results[2][1], AttributeError)
+    assert isinstance(results[3][1], Model)
+
+    with pytest.raises(AttributeError):
+        list(ir_batch_compile(builder, inputs, "process", max_workers=2))
+
+    with pytest.raises(ValueError):
+        ir_batch_compile(builder, inputs, "cluster")
+    with pytest.raises(ValueError):
+        ir_batch_compile(builder, inputs, "thread", chunksize=0)
+
+
+def test_batch_compile_shuts_down_pool(
+    builder: IRBuilderTest, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pools: list[ThreadPoolExecutor] = []
+
+    class Pool(ThreadPoolExecutor):
+        def __init__(self, max_workers: int | None = None) -> None:
+            super().__init__(max_workers)
+            pools.append(self)
+
+    monkeypatch.setattr(factory, "ThreadPoolExecutor", Pool)
+    results = ir_batch_compile(builder, _batch_inputs(10), "thread", max_workers=2)
+    assert not pools
+
+    # A partially consumed iterator shuts down its pool when closed.
+    next(results)
+    results.close()
+    assert len(pools) == 1 and pools[0]._shutdown
+
+
+class AsyncIRBuilderTest(AsyncIRBuilder[InputTypeTest]):
+    # `set_register` only completes once `parse_sequence` started, i.e. if they run concurrently.
+    parsing: asyncio.Event
+
+    @staticmethod
+    async def set_register(input_obj: InputTypeTest) -> AllocQubits:
+        await AsyncIRBuilderTest.parsing.wait()
+        return AllocQubits(input_obj.qubit_count)
+
+    @staticmethod
+    async def set_directives(input_obj: InputTypeTest) -> Attributes:
+        return input_obj.directives
+
+    @staticmethod
+    async def settings(input_obj: InputTypeTest) -> Attributes:
+        return input_obj.settings
+
+    @staticmethod
+    async def parse_sequence(input_obj: InputTypeTest) -> AST:
+        AsyncIRBuilderTest.parsing.set()
+        await asyncio.sleep(0)
+        return input_obj.ast
+
+
+def test_async_compiler(quantum_ast: AST, builder: IRBuilderTest) -> None:
+    input_ = InputTypeTest(10, {"my-directive": False}, {"my-setting": 8}, quantum_ast)
+
+    async def compile_all() -> list[Model]:
+        AsyncIRBuilderTest.parsing = asyncio.Event()
+        ir_compiler = async_ir_compiler_factory(AsyncIRBuilderTest())
+        with ThreadPoolExecutor(2) as pool:
+            pooled_compiler = async_ir_compiler_factory(AsyncIRBuilderTest(), executor=pool)
+            return list(await asyncio.gather(ir_compiler(input_), pooled_compiler(input_)))
+
+    models = asyncio.run(asyncio.wait_for(compile_all(), timeout=10))
+    assert models == [ir_compiler_factory(builder)(input_)] * 2
+
+
+def test_async_compiler_process_pool_cache(quantum_ast: AST, builder: IRBuilderTest) -> None:
+    input_ = InputTypeTest(10, {"my-directive": False}, {"my-setting": 8}, quantum_ast)
+    cache = CompileCache()
+
+    async def compile_twice() -> list[Model]:
+        AsyncIRBuilderTest.parsing = asyncio.Event()
+        with ProcessPoolExecutor(1) as pool:
+            ir_compiler = async_ir_compiler_factory(AsyncIRBuilderTest(), pool, cache)
+            return [await ir_compiler(input_), await ir_compiler(input_)]
+
+    models = asyncio.run(asyncio.wait_for(compile_twice(), timeout=30))
+    assert models == [ir_compiler_factory(builder)(input_)] * 2
+    assert (cache.info().hits, cache.info().misses) == (1, 1)
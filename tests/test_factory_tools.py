@@ -5,6 +5,7 @@ from qadence2_ir.factory_tools import (
     extract_inputs_variables,
     filter_ast,
     flatten_ast,
+    lower_ast,
     to_alloc,
     to_instruct,
 )
@@ -64,6 +65,36 @@ def test_build_instructions(quantum_ast: AST) -> None:
     assert res == target
 
 
+def test_lower_ast(quantum_ast: AST) -> None:
+    x = AST.input_variable("x", 1, False)
+    y = AST.input_variable("y", 2, True, attr="value")
+    expr = AST.mul(AST.add(x, AST.numeric(1)), y)
+    ast = AST.sequence(
+        quantum_ast,
+        AST.quantum_op("ry", (1,), (), expr, flag=True),
+        AST.quantum_op("CNOT", (1,), (0,)),
+        AST.quantum_op("rz", (0,), (), AST.mul(y, AST.add(AST.numeric(1), x))),
+        AST.quantum_op("rz", (1,), (), AST.numeric(0.5)),
+    )
+
+    inputs, instructions = lower_ast(ast)
+    assert inputs == extract_inputs_variables(ast)
+    assert inputs == {"x": Alloc(1, False), "y": Alloc(2, True, attr="value")}
+    assert instructions == [
+        Assign("%0", Call("div", Load("x"), 3)),
+        Assign("%1", Call("fn", Load("%0"), Load("x"))),
+        QuInstruct("rx", Support((0,), (1,)), Load("%1")),
+        Assign("%2", Call("add", Load("x"), 1)),
+        Assign("%3", Call("mul", Load("%2"), Load("y"))),
+        QuInstruct("ry", Support((1,)), Load("%3"), flag=True),
+        QuInstruct("CNOT", Support((1,), (0,))),
+        QuInstruct("rz", Support((0,)), Load("%3")),
+        QuInstruct("rz", Support((1,)), 0.5),
+    ]
+    assert lower_ast(AST.numeric(1)) == ({}, [])
+    assert lower_ast(x) == ({"x": Alloc(1, False)}, [])
+
+
 def test_to_instruct() -> None:
     assert to_instruct(AST.numeric(3), [], {}, 0) == ([], {}, 0)
     assert to_instruct(AST.support((0,), (1,)), [], {}, 0) == ([], {}, 0)
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from copy import deepcopy
+
+import pytest
+
+from qadence2_ir.fingerprint import ast_digest, ast_key, fingerprint
+from qadence2_ir.irast import AST
+from qadence2_ir.types import Alloc, Call, Load, Model, QuInstruct, Support
+
+SCRIPT = """
+from qadence2_ir.fingerprint import fingerprint
+from qadence2_ir.irast import AST
+x = AST.input_variable("x", 1, True, group={"a": 1, "b": 2})
+print(fingerprint(AST.quantum_op("rx", (0,), (), AST.add(x, AST.numeric(0.5)))))
+"""
+
+
+def test_ast_fingerprint(quantum_ast: AST) -> None:
+    x = AST.input_variable("x", 1, True)
+    assert fingerprint(quantum_ast) == fingerprint(deepcopy(quantum_ast))
+    assert fingerprint(AST.add(x, AST.numeric(2))) == fingerprint(AST.add(AST.numeric(2.0), x))
+    assert fingerprint(AST.mul(x, x)) == fingerprint(AST.mul(x, deepcopy(x)))
+    assert fingerprint(AST.sub(x, AST.numeric(2))) != fingerprint(AST.sub(AST.numeric(2), x))
+    assert fingerprint(AST.numeric(2)) != fingerprint(AST.numeric(2.5))
+    assert fingerprint(AST.numeric(1j)) != fingerprint(AST.numeric(1))
+    assert fingerprint(AST.input_variable("x", 1, True, a=1)) != fingerprint(x)
+    assert fingerprint(AST.quantum_op("rx", (0,), ())) != fingerprint(
+        AST.quantum_op("rx", (1,), ())
+    )
+
+    # Digests are cached in the nodes.
+    ast = AST.callable("fn", x)
+    assert ast._digest is None
+    assert ast_digest(ast) is ast._digest and x._digest is not None
+
+
+def test_deep_ast() -> None:
+    expr = AST.input_variable("x", 1, True)
+    for _ in range(10 * sys.getrecursionlimit()):
+        expr = AST.add(AST.numeric(1), expr)
+    assert len(fingerprint(expr)) == 64
+
+
+def test_ast_key() -> None:
+    x = AST.input_variable("x", 1, True)
+    key = ast_key(AST.add(x, AST.numeric(1)))
+    assert key == ast_key(AST.add(x, AST.numeric(1)))
+    assert key != ast_key(AST.add(AST.numeric(1), x))
+    assert key != ast_key(AST.add(x, AST.numeric(1.0)))
+    assert key != ast_key(AST.add(x, AST.numeric(True)))
+    assert ast_key(AST.quantum_op("rx", (0,), (), duration=1)) != ast_key(
+        AST.quantum_op("rx", (0,), (), duration=1.0)
+    )
+
+    # Shared subtrees are encoded once.
+    for _ in range(100):
+        x = AST.add(x, AST.callable("sin", x))
+    assert len(ast_key(x)) == 32
+
+
+def test_stable_across_processes() -> None:
+    digests = set()
+    for seed in ("1", "2"):
+        env = dict(os.environ, PYTHONHASHSEED=seed, PYTHONPATH=os.getcwd())
+        result = subprocess.run(
+            [sys.executable, "-c", SCRIPT], env=env, capture_output=True, text=True, check=True
+        )
+        digests.add(result.stdout.strip())
+    assert len(digests) == 1
+
+
+def test_model_fingerprint(simple_model: Model, model_with_directives_settings: Model) -> None:
+    assert fingerprint(simple_model) == fingerprint(deepcopy(simple_model))
+    assert fingerprint(simple_model) != fingerprint(model_with_directives_settings)
+
+    model = deepcopy(simple_model)
+    model.inputs = dict(reversed(model.inputs.items()))
+    assert fingerprint(model) == fingerprint(simple_model)
+
+    model.instructions[2] = QuInstruct("RX", Support.target_all(), 3.0)
+    assert fingerprint(model) != fingerprint(simple_model)
+
+
+def test_value_fingerprint() -> None:
+    assert fingerprint(Call("fn", 1, Load("x"))) == fingerprint(Call("fn", 1.0, Load("x")))
+    assert fingerprint(Call("fn", Load("x"))) != fingerprint(Call("fn", Load("y")))
+    assert fingerprint((1, 2)) != fingerprint([1, 2])
+    assert fingerprint({"a": 1, "b": 2}) == fingerprint({"b": 2, "a": 1})
+    assert fingerprint(Alloc(1, True)) == fingerprint(Alloc(1, 1))  # type: ignore[arg-type]
+    assert fingerprint(("ab", "c")) != fingerprint(("a", "bc"))
+
+
+class Opaque:
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+    def __repr__(self) -> str:
+        return "Opaque"
+
+
+def test_unsupported_values() -> None:
+    with pytest.raises(TypeError):
+        fingerprint(Opaque(1))
+    with pytest.raises(TypeError):
+        fingerprint(AST.quantum_op("rx", (0,), (), meta=Opaque(1)))
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from qadence2_ir.factory import ir_compiler_factory
+from qadence2_ir.factory_tools import lower_ast
+from qadence2_ir.incremental import IncrementalLowering
+from qadence2_ir.irast import AST
+from qadence2_ir.types import Assign, QuInstruct
+
+from .conftest import InputTypeTest, IRBuilderTest
+
+
+def _layer(index: int, scale: float = 1.0) -> AST:
+    x = AST.input_variable("x", 1, True)
+    y = AST.input_variable(f"y{index}", 1, False)
+    theta = AST.mul(AST.numeric(scale), AST.callable("sin", x))
+    return AST.sequence(
+        AST.quantum_op("rx", (0,), (), theta),
+        AST.quantum_op("ry", (1,), (), AST.add(y, theta)),
+        AST.quantum_op("cz", (1,), (0,)),
+    )
+
+
+def test_incremental_lowering() -> None:
+    layers = [_layer(i % 4) for i in range(10)]
+    lowering = IncrementalLowering()
+
+    ast = AST.sequence(*layers)
+    assert lowering(ast) == lower_ast(ast)
+    assert (lowering.hits, lowering.misses, len(lowering)) == (6, 4, 4)
+
+    for edited in ([_layer(0, 7.0), *layers[1:]], [*layers[:5], _layer(5, 0.5), *layers[6:]]):
+        ast = AST.sequence(*edited)
+        hits, misses = lowering.hits, lowering.misses
+        assert lowering(ast) == lower_ast(ast)
+        assert lowering.misses - misses == 1
+        assert lowering.hits - hits == 9
+
+    # Inserting and removing elements shifts the labels of the following slices.
+    for edited in ([_layer(1, 9.0), *layers], layers[3:], [layers[0]]):
+        ast = AST.sequence(*edited)
+        assert lowering(ast) == lower_ast(ast)
+
+
+def test_incremental_lowering_single_element() -> None:
+    lowering = IncrementalLowering()
+    ast = _layer(0).args[1]
+    assert lowering(ast) == lower_ast(ast)
+    assert lowering(ast) == lower_ast(ast)
+    assert (lowering.hits, lowering.misses) == (1, 1)
+
+    lowering.clear()
+    assert (lowering.hits, lowering.misses, len(lowering)) == (0, 0, 0)
+
+
+def test_incremental_lowering_exact_elements() -> None:
+    x = AST.input_variable("x", 1, True)
+    lowering = IncrementalLowering()
+    for theta in (
+        AST.add(x, AST.numeric(1)),
+        AST.add(AST.numeric(1), x),
+        AST.add(x, AST.numeric(1.0)),
+        AST.add(x, AST.numeric(1 + 0j)),
+        AST.add(x, AST.numeric(1)),
+    ):
+        ast = AST.sequence(AST.quantum_op("rx", (0,), (), theta), AST.quantum_op("h", (1,), ()))
+        inputs, instructions = lowering(ast)
+        expected = lower_ast(ast)
+        assert (inputs, instructions) == expected
+        # Equal numbers of different types are equal, their types are compared separately.
+        assign, expected_assign = instructions[0], expected[1][0]
+        assert isinstance(assign, Assign) and isinstance(expected_assign, Assign)
+        assert list(map(type, assign.value.args)) == list(map(type, expected_assign.value.args))
+    assert (lowering.hits, lowering.misses) == (4, 6)
+
+
+def test_incremental_lowering_copies() -> None:
+    lowering = IncrementalLowering()
+    ast = AST.sequence(_layer(0), _layer(1))
+    inputs, instructions = lowering(ast)
+    expected = lower_ast(ast)
+
+    inputs["x"].size = 7
+    for instruction in instructions:
+        if isinstance(instruction, QuInstruct):
+            instruction.support.target = (5,)
+            instruction.attrs["duration"] = 1.0
+    assert lowering(ast) == expected
+    assert lowering.hits == 2
+
+
+def test_incremental_lowering_deep_element() -> None:
+    def element() -> AST:
+        theta = AST.input_variable("x", 1, True)
+        for index in range(5000):
+            theta = AST.callable("sin", AST.add(theta, AST.numeric(index)))
+        return AST.sequence(AST.quantum_op("rx", (0,), (), theta), AST.quantum_op("h", (1,), ()))
+
+    lowering = IncrementalLowering()
+    expected = lower_ast(element())
+    assert lowering(element()) == expected
+    assert lowering(element()) == expected
+    assert (lowering.hits, lowering.misses) == (2, 2)
+
+
+def test_incremental_compiler(builder: IRBuilderTest) -> None:
+    ir_compiler = ir_compiler_factory(builder, lowering=IncrementalLowering())
+    for scale in (1.0, 2.0):
+        input_ = InputTypeTest(2, {}, {}, AST.sequence(_layer(0), _layer(1, scale)))
+        assert ir_compiler(input_) == ir_compiler_factory(builder)(input_)
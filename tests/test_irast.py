@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+
 import pytest
 
 from qadence2_ir import AST
@@ -112,3 +116,55 @@ def test_repr() -> None:
     ast_kwargs = AST.input_variable("my-var", 8, False, kwarg1=3, kwarg2="value")
     expected_kwargs = "Tag.InputVariable('my-var', 8, False, kwarg1=3, kwarg2='value')"
     assert repr(ast_kwargs) == expected_kwargs
+
+
+def test_interning() -> None:
+    with AST.interning():
+        x = AST.input_variable("x", 1, False)
+        lhs = AST.add(AST.numeric(2), x)
+        rhs = AST.add(x, AST.numeric(2))
+        q_op = AST.quantum_op("rx", (0,), (), AST.mul(lhs, AST.numeric(3)))
+
+        assert lhs is rhs
+        assert lhs.is_interned
+        assert AST.input_variable("x", 1, False) is x
+        assert AST.input_variable("x", 1, True) is not x
+        assert AST.quantum_op("rx", (0,), (), AST.mul(AST.numeric(3), rhs)) is q_op
+        assert q_op.args[0] is AST.support((0,), ())
+
+        # Unhashable attributes fall back to regular nodes.
+        assert not AST.input_variable("y", 1, False, meta=[1, 2]).is_interned
+
+    assert not AST.numeric(2).is_interned
+    assert AST.numeric(2) is not AST.numeric(2)
+    assert AST.add(AST.numeric(2), AST.input_variable("x", 1, False)) == lhs
+    assert hash(AST.add(AST.input_variable("x", 1, False), AST.numeric(2))) == hash(lhs)
+
+
+def test_interning_numeric_types() -> None:
+    with AST.interning():
+        one = AST.numeric(1)
+        assert AST.numeric(1.0) is not one
+        assert AST.numeric(1.0).args[0] == 1.0 and isinstance(AST.numeric(1.0).args[0], float)
+        assert isinstance(AST.numeric(0j).args[0], complex)
+        assert AST.numeric(1.0) == one
+        assert AST.add(AST.numeric(1.0), one) == AST.add(one, one)
+
+
+def test_interning_is_context_local() -> None:
+    with AST.interning():
+        with ThreadPoolExecutor(1) as executor:
+            assert not executor.submit(lambda: AST.numeric(2).is_interned).result()
+        assert AST.numeric(2).is_interned
+
+
+def test_interning_copy() -> None:
+    with AST.interning():
+        ast = AST.callable("fn", AST.numeric(1), AST.input_variable("x", 1, False))
+        assert deepcopy(ast) is ast
+        assert pickle.loads(pickle.dumps(ast)) is ast
+
+    copied = deepcopy(ast)
+    assert copied is not ast
+    assert not copied.is_interned
+    assert copied == ast
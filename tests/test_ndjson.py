@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import io
+import json
+from typing import Iterator
+
+import pytest
+
+from qadence2_ir import ndjson
+from qadence2_ir.types import Alloc, AllocQubits, Assign, Call, Load, Model, QuInstruct, Support
+
+
+def test_round_trip(simple_model: Model, model_with_directives_settings: Model) -> None:
+    for model in (simple_model, model_with_directives_settings):
+        buffer = io.StringIO()
+        ndjson.dump(model, buffer)
+        buffer.seek(0)
+        assert ndjson.load(buffer) == model
+
+    lines = list(ndjson.iter_lines(simple_model))
+    assert len(lines) == len(simple_model.instructions) + 1
+    assert all(line.endswith("\n") and "\n" not in line[:-1] for line in lines)
+    assert json.loads(lines[0])["format"] == ndjson.FORMAT
+
+
+def test_stream() -> None:
+    def instructions(count: int) -> Iterator[QuInstruct | Assign]:
+        for index in range(count):
+            yield Assign(f"%{index}", Call("mul", float(index), Load("x")))
+            yield QuInstruct("rx", Support((index % 2,)), Load(f"%{index}"))
+
+    lines = iter(
+        [
+            ndjson.encode_header(AllocQubits(2), {"x": Alloc(1, True)}),
+            *map(ndjson.encode_instruction, instructions(100)),
+            "\n",
+        ]
+    )
+    header, decoded = ndjson.read_stream(lines)
+    assert header["register"] == AllocQubits(2)
+    assert header["inputs"] == {"x": Alloc(1, True)}
+    assert header["directives"] == header["settings"] == {}
+
+    # Instructions are decoded on demand.
+    assert next(decoded) == Assign("%0", Call("mul", 0.0, Load("x")))
+    assert len(list(lines)) == 200
+    assert next(decoded, None) is None
+
+
+def test_errors(simple_model: Model) -> None:
+    with pytest.raises(ValueError, match="header"):
+        ndjson.load([])
+    with pytest.raises(ValueError, match="header"):
+        ndjson.load(list(ndjson.iter_lines(simple_model))[1:])
+
+    header = json.loads(next(ndjson.iter_lines(simple_model)))
+    header["version"] = ndjson.VERSION + 1
+    with pytest.raises(ValueError, match="version"):
+        ndjson.load([json.dumps(header)])
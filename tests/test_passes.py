@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+from qadence2_ir.factory_tools import build_instructions
+from qadence2_ir.irast import AST
+from qadence2_ir.passes import (
+    FOLDABLE_CALLABLES,
+    allocate_slots,
+    eliminate_common_subexpressions,
+    eliminate_dead_assignments,
+    fold_constants,
+    is_temporary,
+    liveness,
+    register_foldable,
+)
+from qadence2_ir.types import Assign, Call, Load, QuInstruct, Support
+
+
+class Opaque:
+    # A value with the same `repr` for all instances, that cannot be fingerprinted.
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+    def __repr__(self) -> str:
+        return "Opaque"
+
+
+def test_is_temporary() -> None:
+    assert is_temporary(Assign("%0", Call("add", Load("a"), Load("b"))))
+    assert not is_temporary(Assign("x", Call("add", Load("a"), Load("b"))))
+    assert not is_temporary(QuInstruct("x", Support((0,))))
+
+
+def test_eliminate_associative_chains() -> None:
+    instructions: list[QuInstruct | Assign] = [
+        Assign("%0", Call("add", Load("a"), Load("b"))),
+        Assign("%1", Call("add", Load("%0"), Load("c"))),
+        Assign("%2", Call("add", Load("b"), Load("c"))),
+        Assign("%3", Call("add", Load("a"), Load("%2"))),
+        QuInstruct("rx", Support((0,)), Load("%1")),
+        QuInstruct("rx", Support((1,)), Load("%3")),
+    ]
+    optimized, removed = eliminate_common_subexpressions(instructions)
+    assert removed == 2
+    assert optimized == [
+        Assign("%0", Call("add", Load("a"), Load("b"))),
+        Assign("%1", Call("add", Load("%0"), Load("c"))),
+        QuInstruct("rx", Support((0,)), Load("%1")),
+        QuInstruct("rx", Support((1,)), Load("%1")),
+    ]
+
+
+def test_eliminate_commutative_permutations() -> None:
+    instructions: list[QuInstruct | Assign] = [
+        Assign("%0", Call("mul", Load("b"), Load("a"))),
+        Assign("%1", Call("mul", Load("a"), Load("b"))),
+        Assign("%2", Call("sin", Load("%0"))),
+        Assign("%3", Call("sin", Load("%1"))),
+        Assign("%4", Call("sub", Load("a"), Load("b"))),
+        Assign("%5", Call("sub", Load("b"), Load("a"))),
+        QuInstruct("rx", Support((0,)), Load("%2")),
+        QuInstruct("ry", Support((0,)), Load("%3")),
+        QuInstruct("rz", Support((0,)), Load("%4"), Load("%5")),
+    ]
+    optimized, removed = eliminate_common_subexpressions(instructions)
+    assert removed == 2
+    assert optimized == [
+        Assign("%0", Call("mul", Load("a"), Load("b"))),
+        Assign("%1", Call("sin", Load("%0"))),
+        QuInstruct("rx", Support((0,)), Load("%1")),
+        QuInstruct("ry", Support((0,)), Load("%1")),
+        Assign("%2", Call("sub", Load("a"), Load("b"))),
+        Assign("%3", Call("sub", Load("b"), Load("a"))),
+        QuInstruct("rz", Support((0,)), Load("%2"), Load("%3")),
+    ]
+
+
+def test_eliminate_constant_subtrees() -> None:
+    instructions: list[QuInstruct | Assign] = [
+        Assign("%0", Call("div", 1, 2)),
+        Assign("%1", Call("div", 1, 2)),
+        Assign("%2", Call("mul", Load("x"), Load("%0"))),
+        Assign("%3", Call("mul", Load("%1"), Load("x"))),
+        QuInstruct("rx", Support((0,)), Load("%2")),
+        QuInstruct("rx", Support((1,)), Load("%3")),
+    ]
+    optimized, removed = eliminate_common_subexpressions(instructions)
+    assert removed == 2
+    assert optimized[-2:] == [
+        QuInstruct("rx", Support((0,)), Load("%1")),
+        QuInstruct("rx", Support((1,)), Load("%1")),
+    ]
+
+
+def test_eliminate_compiled_instructions() -> None:
+    x = AST.input_variable("x", 1, False)
+    y = AST.input_variable("y", 1, False)
+    z = AST.input_variable("z", 1, False)
+    ast = AST.sequence(
+        AST.quantum_op("rx", (0,), (), AST.add(AST.add(x, y), z)),
+        AST.quantum_op("rx", (1,), (), AST.add(x, AST.add(y, z))),
+        AST.quantum_op("rx", (2,), (), AST.add(z, AST.add(y, x))),
+    )
+    instructions = build_instructions(ast)
+    optimized, removed = eliminate_common_subexpressions(instructions)
+
+    temporaries = [ins for ins in instructions if is_temporary(ins)]
+    assert removed == len(temporaries) - 2
+    assert [ins for ins in optimized if not is_temporary(ins)] == [
+        QuInstruct("rx", Support((0,)), Load("%1")),
+        QuInstruct("rx", Support((1,)), Load("%1")),
+        QuInstruct("rx", Support((2,)), Load("%1")),
+    ]
+
+
+def test_keep_named_assignments() -> None:
+    instructions: list[QuInstruct | Assign] = [
+        Assign("%0", Call("add", Load("a"), Load("b"))),
+        Assign("%1", Call("add", Load("b"), Load("a"))),
+        Assign("theta", Call("mul", Load("%1"), 2)),
+        Assign("phi", Load("%0")),
+        QuInstruct("rx", Support((0,)), Load("theta"), duration=1),
+    ]
+    optimized, removed = eliminate_common_subexpressions(instructions)
+    assert removed == 1
+    assert optimized == [
+        Assign("%0", Call("add", Load("a"), Load("b"))),
+        Assign("theta", Call("mul", Load("%0"), 2)),
+        Assign("phi", Load("%0")),
+        QuInstruct("rx", Support((0,)), Load("theta"), duration=1),
+    ]
+
+
+def test_unencodable_literals() -> None:
+    lhs, rhs = Opaque(1), Opaque(2)
+    instructions: list[QuInstruct | Assign] = [
+        Assign("%0", Call("fn", lhs)),
+        Assign("%1", Call("fn", rhs)),
+        Assign("%2", Call("fn", lhs)),
+        QuInstruct("rx", Support((0,)), Load("%0")),
+        QuInstruct("rx", Support((1,)), Load("%1")),
+        QuInstruct("rx", Support((2,)), Load("%2")),
+    ]
+    optimized, removed = eliminate_common_subexpressions(instructions)
+    assert removed == 1
+    assert [ins.value.args[0] for ins in optimized if isinstance(ins, Assign)] == [lhs, rhs]
+
+
+def test_eliminate_deep_chain() -> None:
+    depth = 10_000
+    instructions: list[QuInstruct | Assign] = [Assign("%0", Call("sin", Load("x")))]
+    for i in range(1, depth):
+        instructions.append(Assign(f"%{i}", Call("sin", Load(f"%{i - 1}"))))
+    instructions.append(QuInstruct("rx", Support((0,)), Load(f"%{depth - 1}")))
+
+    optimized, removed = eliminate_common_subexpressions(instructions)
+    assert removed == 0
+    assert optimized == instructions
+
+
+def test_fold_constants() -> None:
+    ast = AST.sequence(
+        AST.quantum_op("rx", (0,), (), AST.mul(AST.numeric(2.0), AST.numeric(3.0))),
+        AST.quantum_op(
+            "ry",
+            (0,),
+            (),
+            AST.add(
+                AST.input_variable("x", 1, False),
+                AST.div(AST.numeric(1), AST.pow(AST.numeric(2), AST.numeric(2))),
+            ),
+        ),
+    )
+    optimized, folded = fold_constants(build_instructions(ast))
+    assert folded == 3
+    assert optimized == [
+        QuInstruct("rx", Support((0,)), 6.0),
+        Assign("%0", Call("add", Load("x"), 0.25)),
+        QuInstruct("ry", Support((0,)), Load("%0")),
+    ]
+
+
+def test_fold_constants_keeps_errors_and_unknown_callables() -> None:
+    instructions: list[QuInstruct | Assign] = [
+        Assign("%0", Call("div", 1, 0)),
+        Assign("%1", Call("sin", 0.5)),
+        Assign("%2", Call("rem", 7, 4)),
+        Assign("theta", Call("add", Load("%2"), 1)),
+        QuInstruct("rx", Support((0,)), Load("%0"), Load("%1"), Load("theta")),
+    ]
+    optimized, folded = fold_constants(instructions)
+    assert folded == 1
+    assert optimized == [
+        Assign("%0", Call("div", 1, 0)),
+        Assign("%1", Call("sin", 0.5)),
+        Assign("theta", Call("add", 3, 1)),
+        QuInstruct("rx", Support((0,)), Load("%0"), Load("%1"), Load("theta")),
+    ]
+
+
+def test_fold_constants_bounds_integers() -> None:
+    instructions: list[QuInstruct | Assign] = [
+        Assign("%0", Call("pow", 10, 10**8)),
+        Assign("%1", Call("pow", 2, 64)),
+        Assign("%2", Call("mul", Load("%1"), 2**4090)),
+        Assign("%3", Call("pow", 2.0, 10**8)),
+        QuInstruct("rx", Support((0,)), Load("%0"), Load("%1"), Load("%2"), Load("%3")),
+    ]
+    optimized, folded = fold_constants(instructions)
+    assert folded == 1
+    assert optimized == [
+        Assign("%0", Call("pow", 10, 10**8)),
+        Assign("%1", Call("mul", 2**64, 2**4090)),
+        Assign("%2", Call("pow", 2.0, 10**8)),
+        QuInstruct("rx", Support((0,)), Load("%0"), 2**64, Load("%1"), Load("%2")),
+    ]
+
+
+def test_register_foldable() -> None:
+    instructions: list[QuInstruct | Assign] = [
+        Assign("%0", Call("neg", 0.5)),
+        QuInstruct("rx", Support((0,)), Load("%0")),
+    ]
+    register_foldable("neg", lambda x: -x)
+    try:
+        assert fold_constants(instructions) == ([QuInstruct("rx", Support((0,)), -0.5)], 1)
+    finally:
+        del FOLDABLE_CALLABLES["neg"]
+
+
+def test_liveness() -> None:
+    instructions: list[QuInstruct | Assign] = [
+        Assign("%0", Call("mul", 2, Load("x"))),
+        Assign("%1", Call("sin", Load("%0"))),
+        QuInstruct("rx", Support((0,)), Load("%1")),
+        Assign("%2", Call("cos", Load("x"))),
+        QuInstruct("ry", Support((0,)), Load("%0")),
+    ]
+    assert liveness(instructions) == {"%0": 4, "%1": 2, "%2": 3}
+
+
+def test_eliminate_dead_assignments() -> None:
+    instructions: list[QuInstruct | Assign] = [
+        Assign("%0", Call("mul", 2, Load("x"))),
+        Assign("%1", Call("sin", Load("%0"))),
+        Assign("%2", Call("cos", Load("%1"))),
+        Assign("%3", Call("add", Load("x"), 1)),
+        Assign("theta", Load("%0")),
+        QuInstruct("rx", Support((0,)), Load("%3")),
+    ]
+    optimized, removed = eliminate_dead_assignments(instructions)
+    assert removed == 2
+    assert optimized == [
+        Assign("%0", Call("mul", 2, Load("x"))),
+        Assign("%1", Call("add", Load("x"), 1)),
+        Assign("theta", Load("%0")),
+        QuInstruct("rx", Support((0,)), Load("%1")),
+    ]
+
+
+def test_allocate_slots() -> None:
+    instructions: list[QuInstruct | Assign] = [
+        Assign("%0", Call("mul", 2, Load("x"))),
+        Assign("%1", Call("sin", Load("%0"))),
+        QuInstruct("rx", Support((0,)), Load("%1")),
+        Assign("%2", Call("cos", Load("x"))),
+        Assign("%3", Call("add", Load("%2"), Load("x"))),
+        QuInstruct("ry", Support((0,)), Load("%3"), Load("%0")),
+        Assign("%4", Call("sin", Load("y"))),
+        QuInstruct("rz", Support((0,)), Load("%4")),
+    ]
+    assert allocate_slots(instructions) == {"%0": 0, "%1": 1, "%2": 1, "%3": 2, "%4": 0}
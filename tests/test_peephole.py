@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from qadence2_ir.peephole import RULES, optimize_gates, register_rule
+from qadence2_ir.types import Assign, Call, Load, QuInstruct, Support
+
+
+def test_merge_rotations() -> None:
+    instructions: list[QuInstruct | Assign] = [
+        Assign("%0", Call("mul", 2, Load("x"))),
+        QuInstruct("rx", Support((0,)), Load("%0")),
+        QuInstruct("rx", Support((1,)), 0.5),
+        QuInstruct("rx", Support((0,)), Load("y")),
+        QuInstruct("rx", Support((0,)), 0.25),
+        QuInstruct("rx", Support((1,)), 0.5),
+    ]
+    optimized, removed = optimize_gates(instructions)
+    assert removed == 3
+    assert optimized == [
+        Assign("%0", Call("mul", 2, Load("x"))),
+        Assign("%1", Call("add", Load("%0"), Load("y"))),
+        Assign("%2", Call("add", Load("%1"), 0.25)),
+        QuInstruct("rx", Support((0,)), Load("%2")),
+        QuInstruct("rx", Support((1,)), 1.0),
+    ]
+
+
+def test_merge_rotations_to_identity() -> None:
+    instructions: list[QuInstruct | Assign] = [
+        QuInstruct("RZ", Support((0,)), 0.5),
+        QuInstruct("RZ", Support((0,)), -0.5),
+    ]
+    assert optimize_gates(instructions) == ([], 2)
+
+
+def test_cancel_inverses() -> None:
+    instructions: list[QuInstruct | Assign] = [
+        QuInstruct("x", Support((0,))),
+        QuInstruct("cnot", Support((1,), (0,))),
+        QuInstruct("h", Support((2,))),
+        QuInstruct("cnot", Support((1,), (0,))),
+        QuInstruct("x", Support((0,))),
+        QuInstruct("cnot", Support((0,), (1,))),
+        QuInstruct("cnot", Support((0,), (1,)), duration=2),
+    ]
+    optimized, removed = optimize_gates(instructions)
+    assert removed == 4
+    assert optimized == [
+        QuInstruct("h", Support((2,))),
+        QuInstruct("cnot", Support((0,), (1,))),
+        QuInstruct("cnot", Support((0,), (1,)), duration=2),
+    ]
+
+
+def test_blocking_instructions() -> None:
+    instructions: list[QuInstruct | Assign] = [
+        QuInstruct("x", Support((0,))),
+        QuInstruct("cz", Support((1,), (0,))),
+        QuInstruct("x", Support((0,))),
+        QuInstruct("h", Support((1,))),
+        QuInstruct("dyn_pulse", Support.target_all(), 1.0),
+        QuInstruct("h", Support((1,))),
+    ]
+    assert optimize_gates(instructions) == (instructions, 0)
+
+
+def test_register_rule() -> None:
+    def fuse(previous: QuInstruct, current: QuInstruct, fresh: object) -> list[QuInstruct]:
+        return [QuInstruct("s", current.support)]
+
+    instructions: list[QuInstruct | Assign] = [
+        QuInstruct("t", Support((0,))),
+        QuInstruct("t", Support((0,))),
+        QuInstruct("s", Support((0,))),
+    ]
+    register_rule("t", fuse)
+    try:
+        assert optimize_gates(instructions) == ([QuInstruct("s", Support((0,)))] * 2, 1)
+    finally:
+        del RULES["t"]
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from io import StringIO
+
+import pytest
+
+from qadence2_ir.printer import format_model, write_model
+from qadence2_ir.types import Alloc, AllocQubits, Model, QuInstruct, Support
+
+
+def _model(size: int) -> Model:
+    return Model(
+        AllocQubits(2),
+        {"x": Alloc(1, True)},
+        [QuInstruct("rx", Support((i % 2,)), i) for i in range(size)],
+        {"my-directive": 1},
+    )
+
+
+def test_write_model(model_with_directives_settings: Model) -> None:
+    stream = StringIO()
+    write_model(model_with_directives_settings, stream)
+    assert stream.getvalue() == repr(model_with_directives_settings)
+    assert format_model(model_with_directives_settings) == repr(model_with_directives_settings)
+
+
+def test_elision() -> None:
+    model = _model(10)
+    assert format_model(model, head=2, tail=1) == (
+        "Model(\n"
+        "  AllocQubits(2),\n"
+        "  {\n"
+        "    'x': Alloc(1, trainable=True),\n"
+        "  },\n"
+        "  [\n"
+        "    QuInstruct('rx', Support((0,)), 0),\n"
+        "    QuInstruct('rx', Support((1,)), 1),\n"
+        "    ...  # 7 more instructions\n"
+        "    QuInstruct('rx', Support((1,)), 9),\n"
+        "  ],\n"
+        "  directives={\n"
+        "    'my-directive': 1,\n"
+        "  }\n"
+        ")"
+    )
+    assert "more instructions" not in format_model(model, head=0, tail=10)
+    assert format_model(model, head=5, tail=5) == repr(model)
+    assert format_model(model, head=0).count("QuInstruct") == 0
+
+
+@pytest.mark.parametrize("head, tail", [(-1, 0), (2, -1), (None, -1)])
+def test_negative_elision(head: int | None, tail: int) -> None:
+    stream = StringIO()
+    with pytest.raises(ValueError):
+        write_model(_model(10), stream, head, tail)
+    assert stream.getvalue() == ""
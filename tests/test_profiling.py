@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from qadence2_ir import AST, ir_compiler_factory
+from qadence2_ir.cache import CompileCache
+from qadence2_ir.profiling import HOOKS, CompileProfile, add_hook, profile_compilation, remove_hook
+
+from .conftest import InputTypeTest, IRBuilderTest
+
+STAGES = ["set_register", "set_directives", "settings", "parse_sequence", "lower"]
+
+
+def _shared_ast() -> AST:
+    theta = AST.callable("sin", AST.input_variable("x", 1, True))
+    return AST.sequence(
+        AST.quantum_op("rx", (0,), (), theta),
+        AST.quantum_op("ry", (1,), (), theta),
+    )
+
+
+def test_profile_compilation(builder: IRBuilderTest) -> None:
+    ir_compiler = ir_compiler_factory(builder)
+    input_ = InputTypeTest(2, {}, {}, _shared_ast())
+    expected = ir_compiler(input_)
+
+    with profile_compilation() as profiles:
+        model = ir_compiler(input_)
+        ir_compiler(input_)
+
+    assert model == expected
+    assert len(profiles) == 2
+    profile = profiles[0]
+    assert [stage.name for stage in profile.stages] == STAGES
+    assert all(stage.wall_time >= 0 and stage.peak_memory is None for stage in profile.stages)
+    assert profile.total_time == sum(stage.wall_time for stage in profile.stages)
+    assert profile.instructions == len(model.instructions) == 3
+    # Sequence, two quantum operations with their supports, the shared call and its input.
+    assert profile.nodes == 7
+    assert (profile.memo_hits, profile.memo_misses) == (1, 1)
+    assert profile.memo_hit_rate == 0.5
+    assert not HOOKS
+
+
+def test_profile_shared_subtrees(builder: IRBuilderTest) -> None:
+    # Each level references the previous one twice, the tree has 2**40 paths.
+    x = AST.input_variable("x", 1, True)
+    for _ in range(40):
+        x = AST.add(x, AST.callable("sin", x))
+    input_ = InputTypeTest(1, {}, {}, AST.sequence(AST.quantum_op("rx", (0,), (), x)))
+
+    ir_compiler = ir_compiler_factory(builder)
+    with profile_compilation() as profiles:
+        ir_compiler(input_)
+
+    profile = profiles[0]
+    assert profile.nodes == 84
+    assert (profile.memo_hits, profile.memo_misses) == (39, 80)
+
+
+def test_profile_cache_hit(builder: IRBuilderTest) -> None:
+    ir_compiler = ir_compiler_factory(builder, cache=CompileCache())
+    input_ = InputTypeTest(2, {}, {}, _shared_ast())
+    with profile_compilation() as profiles:
+        ir_compiler(input_)
+        ir_compiler(input_)
+
+    assert (profiles[0].memo_hits, profiles[0].memo_misses) == (1, 1)
+    assert (profiles[1].memo_hits, profiles[1].memo_misses) == (0, 0)
+
+
+def test_profile_memory(builder: IRBuilderTest) -> None:
+    ir_compiler = ir_compiler_factory(builder)
+    with profile_compilation(trace_memory=True) as profiles:
+        ir_compiler(InputTypeTest(2, {}, {}, _shared_ast()))
+
+    assert all(stage.peak_memory is not None for stage in profiles[0].stages)
+
+
+def test_hooks(builder: IRBuilderTest) -> None:
+    ir_compiler = ir_compiler_factory(builder)
+    input_ = InputTypeTest(2, {}, {}, _shared_ast())
+    received: list[CompileProfile] = []
+
+    add_hook(received.append)
+    try:
+        ir_compiler(input_)
+    finally:
+        remove_hook(received.append)
+    ir_compiler(input_)
+
+    assert len(received) == 1
+    assert not HOOKS
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import pytest
+
+from qadence2_ir.factory import ir_compiler_factory, ir_template_factory
+from qadence2_ir.irast import AST
+from qadence2_ir.templates import ModelTemplate
+from qadence2_ir.types import AllocQubits
+
+from .conftest import InputTypeTest, IRBuilderTest
+
+
+def _circuit(a: float, b: float, c: float) -> AST:
+    x = AST.input_variable("x", 1, True)
+    return AST.sequence(
+        AST.quantum_op("rx", (0,), (), AST.mul(AST.numeric(a), x)),
+        AST.quantum_op("ry", (1,), (), AST.numeric(b)),
+        AST.quantum_op("rz", (0,), (1,), AST.add(x, AST.pow(AST.numeric(c), x))),
+    )
+
+
+def test_bind(builder: IRBuilderTest) -> None:
+    ir_compiler = ir_compiler_factory(builder)
+    ir_template_compiler = ir_template_factory(builder)
+    template = ir_template_compiler(InputTypeTest(2, {"d": 1}, {"s": 2}, _circuit(0.5, 1.0, 2.0)))
+
+    assert template.constants == (0.5, 1.0, 2.0)
+    assert len(template) == 3
+    assert template.bind() == ir_compiler(
+        InputTypeTest(2, {"d": 1}, {"s": 2}, _circuit(0.5, 1.0, 2.0))
+    )
+
+    model = template.bind([1.5, -1.0, 3.0])
+    assert model == ir_compiler(InputTypeTest(2, {"d": 1}, {"s": 2}, _circuit(1.5, -1.0, 3.0)))
+    assert list(model.inputs) == ["x"]
+
+    # Instructions without constants are shared between the bound models.
+    assert template.bind().instructions[4] is model.instructions[4]
+
+    with pytest.raises(ValueError):
+        template.bind([1.0])
+
+
+def test_reserved_names() -> None:
+    ast = AST.quantum_op("rx", (0,), (), AST.input_variable("#0", 1, False))
+    with pytest.raises(ValueError):
+        ModelTemplate(ast, AllocQubits(1))
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import sys
+
+from qadence2_ir.factory_tools import build_instructions, extract_inputs_variables
+from qadence2_ir.irast import AST
+from qadence2_ir.traversal import postorder_array, walk_filtered, walk_postorder, walk_preorder
+from qadence2_ir.types import Alloc, Assign, Call, Load, QuInstruct, Support
+
+
+def test_walk_preorder(classical_ast: AST) -> None:
+    x = AST.input_variable("x", 1, False)
+    three = AST.numeric(3)
+    div = AST.div(x, three)
+
+    assert list(walk_preorder(classical_ast)) == [classical_ast, div, x, three, x]
+    assert list(walk_preorder(x)) == [x]
+
+
+def test_walk_postorder(classical_ast: AST) -> None:
+    x = AST.input_variable("x", 1, False)
+    three = AST.numeric(3)
+    div = AST.div(x, three)
+
+    assert list(walk_postorder(classical_ast)) == [x, three, div, x, classical_ast]
+    assert postorder_array(classical_ast) == list(walk_postorder(classical_ast))
+
+
+def test_walk_filtered(quantum_ast: AST) -> None:
+    x = AST.input_variable("x", 1, False)
+    assert list(walk_filtered(lambda ast: ast.is_input_variable, quantum_ast)) == [x, x]
+    # The arguments of selected nodes are not visited.
+    assert list(walk_filtered(lambda ast: ast.is_callable, quantum_ast)) == [quantum_ast.args[1]]
+
+
+def test_deep_ast() -> None:
+    depth = 10 * sys.getrecursionlimit()
+    x = AST.input_variable("x", 1, True)
+
+    sequence = AST.quantum_op("h", (0,), ())
+    for _ in range(depth):
+        sequence = AST.sequence(sequence)
+    assert len(postorder_array(sequence)) == depth + 2
+    assert build_instructions(sequence) == [QuInstruct("h", Support((0,)))]
+
+    expr = x
+    for _ in range(depth):
+        expr = AST.add(expr, AST.numeric(1))
+    ast = AST.quantum_op("rx", (0,), (), expr)
+
+    assert extract_inputs_variables(ast) == {"x": Alloc(1, True)}
+    instructions = build_instructions(ast)
+    assert len(instructions) == depth + 1
+    assert instructions[0] == Assign("%0", Call("add", Load("x"), 1))
+    assert instructions[-1] == QuInstruct("rx", Support((0,)), Load(f"%{depth - 1}"))
@@ -1,10 +1,20 @@
 from __future__ import annotations
 
+import pickle
 from copy import deepcopy
 
 import pytest
 
-from qadence2_ir.types import Alloc, AllocQubits, Assign, Call, Load, Model, QuInstruct, Support
+from qadence2_ir.types import (
+    Alloc,
+    AllocQubits,
+    Assign,
+    Call,
+    Load,
+    Model,
+    QuInstruct,
+    Support,
+)
 
 
 def test_alloc_repr() -> None:
@@ -176,3 +186,81 @@ def test_model_eq(simple_model: Model, model_with_directives_settings: Model) ->
     assert model_with_directives_settings == deepcopy(model_with_directives_settings)
     assert simple_model != model_with_directives_settings
     assert simple_model.__eq__("model") is NotImplemented
+
+
+def test_slots(simple_model: Model, support_control_target: Support) -> None:
+    instances = [
+        Alloc(1, True, attr=1),
+        Assign("%0", Call("fn", Load("x"))),
+        Load("x"),
+        Call("fn", 2.0),
+        support_control_target,
+        QuInstruct("rx", support_control_target, Load("x"), attr=True),
+        AllocQubits(2, connectivity={(0, 1): 1.0}),
+        simple_model,
+    ]
+    for instance in instances:
+        assert not hasattr(instance, "__dict__")
+        assert pickle.loads(pickle.dumps(instance)) == instance
+        assert deepcopy(instance) == instance
+
+
+def test_model_metrics() -> None:
+    model = Model(
+        AllocQubits(4),
+        {"x": Alloc(1, True), "y": Alloc(3, False)},
+        [
+            Assign("%0", Call("sin", Load("x"))),
+            QuInstruct("rx", Support((0,)), Load("%0")),
+            QuInstruct("x", Support((1,), (0,))),
+            QuInstruct("h", Support((2,))),
+            QuInstruct("rx", Support((1,)), Load("%0")),
+            QuInstruct("global", Support.target_all()),
+            QuInstruct("h", Support((2,))),
+        ],
+    )
+
+    metrics = model.metrics()
+    assert metrics.gate_counts == {"rx": 2, "x": 1, "h": 2, "global": 1}
+    assert metrics.num_gates == 6
+    assert metrics.two_qubit_gates == 1
+    assert metrics.depth == 5
+    assert metrics.num_temporaries == 1
+    assert metrics.input_sizes == {"x": 1, "y": 3}
+    assert metrics.used_qubits == 4
+    assert metrics.qubit_utilisation == 1.0
+    assert model.metrics() == metrics
+    assert model.metrics(cached=True) == metrics
+
+    # In-place changes are only picked up by the cached results after `invalidate`.
+    model.instructions[2] = QuInstruct("x", Support((2,)))
+    assert model.metrics(cached=True).two_qubit_gates == 1
+    assert model.metrics().two_qubit_gates == 0
+    model.instructions[2] = QuInstruct("x", Support((1,), (0,)))
+    assert model.metrics(cached=True).two_qubit_gates == 0
+    model.invalidate()
+    assert model.metrics(cached=True) == metrics
+
+    model.instructions.pop()
+    model.instructions.pop()
+    metrics = model.metrics()
+    assert metrics.depth == 3
+    assert metrics.used_qubits == 3
+    assert metrics.qubit_utilisation == 0.75
+
+    model.instructions = []
+    assert model.metrics().num_gates == 0
+
+
+def test_model_keeps_instructions() -> None:
+    instructions: list[QuInstruct | Assign] = [QuInstruct("x", Support((0,)))]
+    model = Model(AllocQubits(2), {}, instructions)
+    assert model.instructions is instructions
+    assert model.metrics(cached=True).num_gates == 1
+
+    instructions.append(QuInstruct("h", Support((1,))))
+    assert model.instructions == instructions
+    assert model.metrics().num_gates == 2
+
+    model.instructions = [QuInstruct("y", Support((0,)))]
+    assert model.metrics(cached=True).gate_counts == {"y": 1}